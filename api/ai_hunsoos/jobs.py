@@ -0,0 +1,158 @@
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from common.logger import logger
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import AiHunsoo, AiHunsooJob
+from .utils import request_ai_response
+
+# 아직 끝나지 않은 작업 상태 (같은 게시글에 대해 작업을 중복 등록하지 않음)
+ACTIVE_STATUSES = ("pending", "running")
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    AI 훈수 생성용 스레드 풀을 반환합니다.
+    동시에 실행되는 OpenAI 호출 수는 settings.AI_HUNSOO_MAX_CONCURRENCY로 제한됩니다.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.AI_HUNSOO_MAX_CONCURRENCY,
+                thread_name_prefix="ai-hunsoo",
+            )
+    return _executor
+
+
+def enqueue_ai_hunsoo(comment):
+    """
+    채택된 댓글에 대한 AI 훈수 생성 작업을 등록합니다.
+    작업은 현재 트랜잭션이 커밋된 뒤에 워커 풀로 전달됩니다.
+    """
+    # 게시글당 끝나지 않은 작업은 하나뿐이므로 (unique 제약) 동시에 등록해도
+    # 나중에 INSERT한 요청은 IntegrityError 후 먼저 등록된 작업을 다시 조회함
+    job, _ = AiHunsooJob.objects.get_or_create(
+        article_id=comment.article_id,
+        status__in=ACTIVE_STATUSES,
+        defaults={"comment": comment, "next_run_at": timezone.now()},
+    )
+    transaction.on_commit(lambda: submit_job(job.id))
+    return job
+
+
+def submit_job(job_id, delay=0):
+    """작업을 워커 풀에 전달합니다. delay(초)가 있으면 그 시간 이후에 전달합니다."""
+    if settings.AI_HUNSOO_JOBS_EAGER:
+        # 테스트 등에서 현재 스레드에서 바로 실행 (재시도는 워커 명령어가 처리)
+        if not delay:
+            run_job(job_id)
+        return
+
+    if delay:
+        timer = threading.Timer(delay, submit_job, args=(job_id,))
+        timer.daemon = True
+        timer.start()
+        return
+
+    get_executor().submit(run_job_in_thread, job_id)
+
+
+def run_job_in_thread(job_id):
+    try:
+        run_job(job_id)
+    except Exception:
+        logger.exception(f"AI 훈수 작업 {job_id} 실행 중 오류")
+    finally:
+        # 워커 스레드에서 연 DB 연결 정리
+        connections.close_all()
+
+
+def claim_job(job_id):
+    """
+    실행 시각이 된 대기 작업을 running으로 변경합니다.
+    조건부 UPDATE로 처리하므로 여러 워커가 같은 작업을 받아도 한 번만 실행됩니다.
+    """
+    now = timezone.now()
+    claimed = AiHunsooJob.objects.filter(
+        id=job_id, status="pending", next_run_at__lte=now
+    ).update(status="running", started_at=now, attempts=F("attempts") + 1)
+    return claimed == 1
+
+
+def run_job(job_id):
+    """작업을 실행하고 AiHunsoo에 결과를 저장합니다. 실행하지 않은 경우 None을 반환합니다."""
+    if not claim_job(job_id):
+        return None
+
+    job = AiHunsooJob.objects.select_related("article", "comment").get(id=job_id)
+    try:
+        content = request_ai_response(job.article.content, job.comment.content)
+    except Exception as e:
+        return fail_job(job, e)
+
+    with transaction.atomic():
+        ai_hunsoo, created = AiHunsoo.objects.get_or_create(
+            article=job.article, defaults={"content": content, "status": True}
+        )
+        if not created:
+            # 저장 시 AI 답변 알림 시그널 발생
+            ai_hunsoo.content = content
+            ai_hunsoo.status = True
+            ai_hunsoo.save()
+
+        job.status = "succeeded"
+        job.last_error = ""
+        job.save(update_fields=["status", "last_error", "updated_at"])
+    return job
+
+
+def get_retry_delay(attempts):
+    """지수 backoff (base x 2^(시도 횟수 - 1), 최대값 제한) 에 jitter를 적용한 재시도 대기 시간(초)"""
+    delay = min(
+        settings.AI_HUNSOO_RETRY_BASE_DELAY * 2 ** (attempts - 1),
+        settings.AI_HUNSOO_RETRY_MAX_DELAY,
+    )
+    return delay * random.uniform(0.5, 1.0)
+
+
+def fail_job(job, error):
+    """실패한 작업을 재시도 대기 상태로 돌리거나, 최대 시도 횟수를 넘으면 failed로 처리합니다."""
+    logger.warning(f"AI 훈수 작업 {job.id} 실패 ({job.attempts}회): {error}")
+    job.last_error = str(error)[:1000]
+
+    if job.attempts >= settings.AI_HUNSOO_MAX_ATTEMPTS:
+        job.status = "failed"
+        job.save(update_fields=["status", "last_error", "updated_at"])
+        return job
+
+    delay = get_retry_delay(job.attempts)
+    job.status = "pending"
+    job.next_run_at = timezone.now() + timedelta(seconds=delay)
+    job.save(update_fields=["status", "last_error", "next_run_at", "updated_at"])
+    submit_job(job.id, delay=delay)
+    return job
+
+
+def recover_stale_jobs(timeout):
+    """워커가 중간에 종료되어 running으로 남은 작업을 다시 대기 상태로 돌립니다."""
+    return AiHunsooJob.objects.filter(
+        status="running", started_at__lt=timezone.now() - timedelta(seconds=timeout)
+    ).update(status="pending", next_run_at=timezone.now())
+
+
+def get_due_job_ids(limit):
+    return list(
+        AiHunsooJob.objects.filter(status="pending", next_run_at__lte=timezone.now())
+        .order_by("next_run_at")
+        .values_list("id", flat=True)[:limit]
+    )
@@ -0,0 +1,195 @@
+import asyncio
+import random
+
+import openai
+from ai_hunsoos.models import AiHunsoo, AiHunsooJob
+from ai_hunsoos.utils import arequest_ai_response, create_async_openai_client
+from asgiref.sync import async_to_sync, sync_to_async
+from comments.models import Comment
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Prefetch, Q
+from notifications import dispatcher
+
+# 중단된 실행의 진행 위치 (이 id 이하는 모두 처리됨, 끝까지 실행하면 삭제)
+CHECKPOINT_KEY = "ai_hunsoo_backfill:last_id"
+CHECKPOINT_TIMEOUT = 60 * 60 * 24 * 7
+# 이전 generate_ai_response가 실패 시 content에 저장하던 오류 문구
+ERROR_CONTENT_PREFIX = "An error occurred while generating the response"
+# 재시도할 HTTP 상태 코드 (rate limit, 일시적인 서버 오류)
+RETRYABLE_STATUS_CODES = (408, 409, 429, 500, 502, 503, 504)
+
+
+def is_retryable(error):
+    if isinstance(error, (openai.APIConnectionError, openai.APITimeoutError)):
+        return True
+    return getattr(error, "status_code", None) in RETRYABLE_STATUS_CODES
+
+
+def get_retry_after(error):
+    """rate limit 응답의 Retry-After 헤더(초)를 반환합니다."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        "마감된 게시글 중 AI 훈수가 생성되지 않았거나 실패한 건을 비동기로 동시에 다시 생성합니다. "
+        "(배치 단위로 bulk_update 후 진행 위치를 저장)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", type=int, default=8)
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument("--max-attempts", type=int, default=5)
+        parser.add_argument(
+            "--base-delay",
+            type=float,
+            default=1.0,
+            help="재시도 대기 시간 기준값(초), 시도할 때마다 2배씩 증가",
+        )
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="저장된 진행 위치를 무시하고 처음부터 처리",
+        )
+        parser.add_argument(
+            "--no-notify",
+            action="store_true",
+            help="생성된 AI 훈수에 대한 알림을 보내지 않음",
+        )
+
+    def handle(self, *args, **options):
+        if options["reset"]:
+            cache.delete(CHECKPOINT_KEY)
+        # async_to_sync로 실행하여 sync_to_async로 감싼 ORM 호출이 현재 스레드의 DB 연결을 사용하도록 함
+        async_to_sync(self.backfill)(options)
+
+    def get_queryset(self):
+        return (
+            AiHunsoo.objects.filter(article__is_closed=True)
+            .filter(Q(status=False) | Q(content__startswith=ERROR_CONTENT_PREFIX))
+            .select_related("article")
+            .prefetch_related(
+                Prefetch(
+                    "article__comments",
+                    queryset=Comment.objects.filter(is_selected=True),
+                    to_attr="selected_comments",
+                )
+            )
+            .order_by("id")
+        )
+
+    def load_batch(self, after_id, batch_size):
+        return list(self.get_queryset().filter(id__gt=after_id)[:batch_size])
+
+    async def backfill(self, options):
+        semaphore = asyncio.Semaphore(options["concurrency"])
+        last_id = await cache.aget(CHECKPOINT_KEY, 0)
+        succeeded = failed = 0
+        # 실패한 행이 나오면 이후 진행 위치는 저장하지 않음 (중단 후 다시 실행하면 실패한 행부터 처리)
+        stalled = False
+
+        client = create_async_openai_client()
+        try:
+            while True:
+                batch = await sync_to_async(self.load_batch)(
+                    last_id, options["batch_size"]
+                )
+                if not batch:
+                    break
+
+                results = await asyncio.gather(
+                    *[
+                        self.generate(client, semaphore, ai_hunsoo, options)
+                        for ai_hunsoo in batch
+                    ]
+                )
+                done = []
+                failed_ids = []
+                for ai_hunsoo, content in zip(batch, results):
+                    if content is None:
+                        failed_ids.append(ai_hunsoo.id)
+                        continue
+                    ai_hunsoo.content = content
+                    ai_hunsoo.status = True
+                    done.append(ai_hunsoo)
+
+                await sync_to_async(self.save_batch)(done, not options["no_notify"])
+                succeeded += len(done)
+                failed += len(batch) - len(done)
+
+                last_id = batch[-1].id
+                # 배치 저장 후 진행 위치 기록 (실패한 행 직전까지만)
+                if not stalled:
+                    stalled = bool(failed_ids)
+                    await cache.aset(
+                        CHECKPOINT_KEY,
+                        failed_ids[0] - 1 if failed_ids else last_id,
+                        CHECKPOINT_TIMEOUT,
+                    )
+                self.stdout.write(
+                    f"AiHunsoo id {last_id}까지 처리 (성공 {succeeded}, 실패 {failed})"
+                )
+
+            # 끝까지 처리했으면 다음 실행은 실패한 행을 포함해 처음부터 처리
+            await cache.adelete(CHECKPOINT_KEY)
+        finally:
+            await client.close()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"AI 훈수 재생성 완료: 성공 {succeeded}, 실패 {failed}")
+        )
+
+    async def generate(self, client, semaphore, ai_hunsoo, options):
+        """AI 훈수를 생성해 반환합니다. 재시도 후에도 실패하면 None을 반환합니다."""
+        selected_comments = ai_hunsoo.article.selected_comments
+        if not selected_comments:
+            return None
+
+        for attempt in range(1, options["max_attempts"] + 1):
+            async with semaphore:
+                try:
+                    return await arequest_ai_response(
+                        client, ai_hunsoo.article.content, selected_comments[0].content
+                    )
+                except Exception as e:
+                    error = e
+
+            if not is_retryable(error) or attempt == options["max_attempts"]:
+                break
+            # Retry-After가 있으면 따르고, 없으면 지수 backoff + jitter
+            delay = get_retry_after(error)
+            if delay is None:
+                delay = options["base_delay"] * 2 ** (attempt - 1)
+                delay *= random.uniform(0.5, 1.0)
+            await asyncio.sleep(delay)
+
+        self.stderr.write(f"AiHunsoo {ai_hunsoo.id} 생성 실패: {error}")
+        return None
+
+    def save_batch(self, ai_hunsoos, notify):
+        if not ai_hunsoos:
+            return
+        article_ids = [ai_hunsoo.article_id for ai_hunsoo in ai_hunsoos]
+        with transaction.atomic():
+            AiHunsoo.objects.bulk_update(ai_hunsoos, ["content", "status"])
+            # 같은 게시글의 실패한 작업은 완료 처리
+            AiHunsooJob.objects.filter(
+                article_id__in=article_ids, status="failed"
+            ).update(status="succeeded")
+
+            if notify:
+                # bulk_update는 시그널이 발생하지 않으므로 알림을 직접 등록 (커밋 후 한 번에 저장)
+                for ai_hunsoo in ai_hunsoos:
+                    dispatcher.notify(
+                        "ai_response",
+                        ai_hunsoo,
+                        ai_hunsoo.article_id,
+                        recipient_id=ai_hunsoo.article.user_id,
+                    )
@@ -0,0 +1,55 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from ai_hunsoos.jobs import get_due_job_ids, recover_stale_jobs, run_job_in_thread
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        "대기 중인 AI 훈수 생성 작업을 실행합니다. "
+        "(웹 프로세스에서 놓친 작업과 재시도 작업 처리, --interval 지정 시 주기적으로 반복)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=0,
+            help="반복 주기(초). 0이면 한 번만 실행",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=settings.AI_HUNSOO_MAX_CONCURRENCY,
+            help="동시에 실행할 작업 수",
+        )
+        parser.add_argument(
+            "--stale-timeout",
+            type=int,
+            default=600,
+            help="running 상태로 이 시간(초) 이상 남은 작업은 다시 실행",
+        )
+
+    def handle(self, *args, **options):
+        concurrency = options["concurrency"]
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="ai-hunsoo-worker"
+        ) as executor:
+            while True:
+                recovered = recover_stale_jobs(options["stale_timeout"])
+                job_ids = get_due_job_ids(concurrency)
+                futures = [
+                    executor.submit(run_job_in_thread, job_id) for job_id in job_ids
+                ]
+                wait(futures)
+                self.stdout.write(
+                    f"AI 훈수 작업 {len(job_ids)}개 실행 (중단된 작업 {recovered}개 복구)"
+                )
+
+                if not options["interval"]:
+                    break
+                # 처리할 작업이 남아 있으면 바로 다음 배치 실행
+                if len(job_ids) < concurrency:
+                    time.sleep(options["interval"])
@@ -0,0 +1,35 @@
+# Generated by Django 5.1 on 2026-10-18 16:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_hunsoos', '0003_aihunsoo_status_alter_aihunsoo_content'),
+        ('articles', '0012_articlengram'),
+        ('comments', '0005_comment_comment_article_created_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AiHunsooJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(null=True)),
+                ('status', models.CharField(choices=[('pending', '대기'), ('running', '실행 중'), ('succeeded', '완료'), ('failed', '실패')], default='pending', max_length=20)),
+                ('attempts', models.IntegerField(default=0)),
+                ('next_run_at', models.DateTimeField()),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ai_hunsoo_jobs', to='articles.article')),
+                ('comment', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ai_hunsoo_jobs', to='comments.comment')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'next_run_at'], name='ai_hunsoo_job_status_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1 on 2026-10-18 17:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_hunsoos', '0004_aihunsoojob'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='aihunsoojob',
+            constraint=models.UniqueConstraint(condition=models.Q(('status__in', ['pending', 'running'])), fields=('article',), name='ai_hunsoo_job_active_article_uniq'),
+        ),
+    ]
@@ -7,3 +7,49 @@ class AiHunsoo(TimeStampModel):
     article = models.ForeignKey(Article, on_delete=models.CASCADE, null=False)
     content = models.TextField(null=True)
     status = models.BooleanField(default=False)
+
+
+AI_HUNSOO_JOB_STATUS = (
+    ("pending", "대기"),
+    ("running", "실행 중"),
+    ("succeeded", "완료"),
+    ("failed", "실패"),
+)
+
+
+# 채택된 댓글에 대한 AI 훈수 생성 작업 (요청 스레드 밖에서 워커가 처리)
+class AiHunsooJob(TimeStampModel):
+    article = models.ForeignKey(
+        Article, on_delete=models.CASCADE, related_name="ai_hunsoo_jobs"
+    )
+    comment = models.ForeignKey(
+        "comments.Comment", on_delete=models.CASCADE, related_name="ai_hunsoo_jobs"
+    )
+    status = models.CharField(
+        max_length=20, choices=AI_HUNSOO_JOB_STATUS, default="pending"
+    )
+    attempts = models.IntegerField(default=0)
+    # 다음 실행 가능 시각 (재시도 backoff)
+    next_run_at = models.DateTimeField()
+    # 실행을 시작한 시각 (워커가 죽어 running으로 남은 작업 감지용)
+    started_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default="")
+
+    class Meta:
+        indexes = [
+            # 워커가 실행할 작업을 찾는 조회용 인덱스
+            models.Index(
+                fields=["status", "next_run_at"], name="ai_hunsoo_job_status_idx"
+            ),
+        ]
+        constraints = [
+            # 게시글당 끝나지 않은 작업은 하나만 (동시에 채택해도 중복 등록되지 않음)
+            models.UniqueConstraint(
+                fields=["article"],
+                condition=models.Q(status__in=["pending", "running"]),
+                name="ai_hunsoo_job_active_article_uniq",
+            ),
+        ]
+
+    def __str__(self):
+        return f"AiHunsooJob {self.id} ({self.status}) - {self.article_id}"
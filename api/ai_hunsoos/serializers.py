@@ -1,4 +1,4 @@
-from ai_hunsoos.models import AiHunsoo
+from ai_hunsoos.models import AiHunsoo, AiHunsooJob
 from rest_framework import serializers
 
 
@@ -6,3 +6,19 @@ class AiHunsooSerializer(serializers.ModelSerializer):
     class Meta:
         model = AiHunsoo
         fields = ["status", "article", "content", "created_at", "updated_at"]
+
+
+class AiHunsooJobSerializer(serializers.ModelSerializer):
+    job_id = serializers.ReadOnlyField(source="id")
+
+    class Meta:
+        model = AiHunsooJob
+        fields = [
+            "job_id",
+            "article",
+            "status",
+            "attempts",
+            "next_run_at",
+            "created_at",
+            "updated_at",
+        ]
@@ -1,7 +1,36 @@
-from ai_hunsoos.models import AiHunsoo
+import os
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from types import SimpleNamespace
+from unittest import mock
+
+from ai_hunsoos.jobs import (
+    enqueue_ai_hunsoo,
+    get_due_job_ids,
+    recover_stale_jobs,
+    run_job,
+)
+from ai_hunsoos.management.commands.backfill_ai_hunsoos import CHECKPOINT_KEY, Command
+from ai_hunsoos.models import AiHunsoo, AiHunsooJob
+from ai_hunsoos.utils import (
+    arequest_ai_response,
+    get_openai_client,
+    load_prompt_template,
+    request_ai_response,
+)
 from articles.models import Article
+from asgiref.sync import async_to_sync
+from comments.models import Comment
+from common import metrics
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import IntegrityError, transaction
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from notifications.models import Notification
 from rest_framework.test import APIClient
 
 User = get_user_model()
@@ -55,3 +84,388 @@ class AiHunsooDetailViewTest(TestCase):
         AiHunsoo.objects.all().delete()
         Article.objects.all().delete()
         User.objects.all().delete()
+
+
+class FakeOpenAIClient:
+    """OpenAI 클라이언트 대신 사용하는 가짜 클라이언트 (chat.completions.create만 구현)"""
+
+    def __init__(self, content="AI 훈수입니다.", errors=0):
+        self.content = content
+        # 앞에서부터 errors번 호출은 실패
+        self.errors = errors
+        self.calls = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        if len(self.calls) <= self.errors:
+            raise ConnectionError("OpenAI 연결 실패")
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@override_settings(AI_HUNSOO_JOBS_EAGER=True, AI_HUNSOO_MAX_ATTEMPTS=2)
+class AiHunsooJobTests(TestCase):
+
+    def setUp(self):
+        # 이전 테스트의 AI 응답 캐시가 재사용되지 않도록 초기화
+        cache.clear()
+        self.author = User.objects.create_user(
+            email="author@example.com",
+            username="author",
+            password="testpassword",
+            nickname="author",
+        )
+        self.commenter = User.objects.create_user(
+            email="commenter@example.com",
+            username="commenter",
+            password="testpassword",
+            nickname="commenter",
+        )
+        self.article = Article.objects.create(
+            user=self.author, title="Test Article", content="질문 내용"
+        )
+        # 댓글 알림은 테스트 트랜잭션이 커밋되지 않으므로 여기서 저장
+        with self.captureOnCommitCallbacks(execute=True):
+            self.comment = Comment.objects.create(
+                user=self.commenter, article=self.article, content="답변 내용"
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.author)
+
+    def select_comment(self, fake_client):
+        url = reverse("comment-select", kwargs={"pk": self.comment.id})
+        with mock.patch("ai_hunsoos.utils.get_openai_client", return_value=fake_client):
+            with self.captureOnCommitCallbacks(execute=False) as callbacks:
+                response = self.client.put(url)
+                self.assertEqual(response.status_code, 200)
+
+            # 요청 처리 중에는 OpenAI를 호출하지 않음
+            self.assertEqual(fake_client.calls, [])
+            # 작업 중에 등록되는 알림 저장도 실행
+            with self.captureOnCommitCallbacks(execute=True):
+                for callback in callbacks:
+                    callback()
+        return AiHunsooJob.objects.get(article=self.article)
+
+    def test_job_runs_after_commit(self):
+        fake_client = FakeOpenAIClient()
+        job = self.select_comment(fake_client)
+
+        self.assertEqual(job.status, "succeeded")
+        self.assertEqual(job.attempts, 1)
+        self.assertEqual(len(fake_client.calls), 1)
+        self.assertIn("질문 내용", fake_client.calls[0]["messages"][1]["content"])
+
+        ai_hunsoo = AiHunsoo.objects.get(article=self.article)
+        self.assertTrue(ai_hunsoo.status)
+        self.assertEqual(ai_hunsoo.content, "AI 훈수입니다.")
+        self.assertTrue(
+            Notification.objects.filter(
+                recipient=self.author, verb="ai_response"
+            ).exists()
+        )
+
+    def test_job_retries_with_backoff_then_fails(self):
+        fake_client = FakeOpenAIClient(errors=2)
+        job = self.select_comment(fake_client)
+
+        # 첫 번째 실패 후 backoff 시간 이후로 재시도 예약
+        self.assertEqual(job.status, "pending")
+        self.assertEqual(job.attempts, 1)
+        self.assertGreater(job.next_run_at, timezone.now())
+        self.assertIn("OpenAI 연결 실패", job.last_error)
+        self.assertIsNone(run_job(job.id))
+
+        # 재시도 시각이 되면 다시 실행되고, 최대 시도 횟수에 도달하면 failed
+        AiHunsooJob.objects.filter(id=job.id).update(next_run_at=timezone.now())
+        self.assertEqual(get_due_job_ids(10), [job.id])
+        with mock.patch("ai_hunsoos.utils.get_openai_client", return_value=fake_client):
+            job = run_job(job.id)
+        self.assertEqual(job.status, "failed")
+        self.assertEqual(job.attempts, 2)
+        self.assertFalse(AiHunsoo.objects.get(article=self.article).status)
+
+    def test_cache_errors_do_not_fail_job(self):
+        fake_client = FakeOpenAIClient()
+        with mock.patch.object(
+            cache, "get", side_effect=ConnectionError("Redis 연결 실패")
+        ), mock.patch.object(
+            cache, "set", side_effect=ConnectionError("Redis 연결 실패")
+        ):
+            job = self.select_comment(fake_client)
+
+        # OpenAI 응답을 받은 뒤 캐시 저장에 실패해도 재시도하지 않고 결과를 저장
+        self.assertEqual(job.status, "succeeded")
+        self.assertEqual(job.attempts, 1)
+        self.assertEqual(len(fake_client.calls), 1)
+        self.assertEqual(
+            AiHunsoo.objects.get(article=self.article).content, "AI 훈수입니다."
+        )
+
+    def test_stale_running_job_is_recovered(self):
+        job = AiHunsooJob.objects.create(
+            article=self.article,
+            comment=self.comment,
+            status="running",
+            started_at=timezone.now() - timedelta(hours=1),
+            next_run_at=timezone.now() - timedelta(hours=1),
+        )
+        self.assertEqual(recover_stale_jobs(600), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, "pending")
+
+    def test_enqueue_reuses_active_job(self):
+        with self.captureOnCommitCallbacks(execute=False):
+            job = enqueue_ai_hunsoo(self.comment)
+            self.assertEqual(enqueue_ai_hunsoo(self.comment).id, job.id)
+        self.assertEqual(AiHunsooJob.objects.filter(article=self.article).count(), 1)
+
+        # 동시에 등록하는 경우 unique 제약으로 두 번째 작업은 만들어지지 않음
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            AiHunsooJob.objects.create(
+                article=self.article,
+                comment=self.comment,
+                next_run_at=timezone.now(),
+            )
+
+        # 끝난 작업은 제약에 포함되지 않으므로 새 작업을 등록할 수 있음
+        AiHunsooJob.objects.filter(id=job.id).update(status="failed")
+        with self.captureOnCommitCallbacks(execute=False):
+            self.assertNotEqual(enqueue_ai_hunsoo(self.comment).id, job.id)
+
+    def test_job_status_view(self):
+        url = reverse("ai-hunsoo-job-status", kwargs={"article_id": self.article.id})
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+        self.select_comment(FakeOpenAIClient())
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["status"], "succeeded")
+        self.assertEqual(response.data["attempts"], 1)
+
+
+class AiHunsooClientTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        metrics.reset()
+
+    def test_response_cache_skips_duplicate_calls(self):
+        fake_client = FakeOpenAIClient()
+        with mock.patch("ai_hunsoos.utils.get_openai_client", return_value=fake_client):
+            first = request_ai_response("질문", "답변")
+            second = request_ai_response("질문", "답변")
+            request_ai_response("질문", "다른 답변")
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(fake_client.calls), 2)
+        self.assertEqual(metrics.get_counter("cache.ai_hunsoo_response.hit"), 1)
+        histogram = metrics.snapshot()["histograms"]["openai.chat.latency_ms"]
+        self.assertEqual(histogram["count"], 2)
+
+    def test_failed_call_is_not_cached(self):
+        fake_client = FakeOpenAIClient(errors=1)
+        with mock.patch("ai_hunsoos.utils.get_openai_client", return_value=fake_client):
+            with self.assertRaises(ConnectionError):
+                request_ai_response("질문", "답변")
+            self.assertEqual(request_ai_response("질문", "답변"), "AI 훈수입니다.")
+
+        self.assertEqual(metrics.get_counter("openai.chat.error"), 1)
+
+    def test_async_cache_errors_are_treated_as_miss(self):
+        fake_client = FakeAsyncOpenAIClient()
+        with mock.patch.object(
+            cache, "aget", side_effect=ConnectionError("Redis 연결 실패")
+        ), mock.patch.object(
+            cache, "aset", side_effect=ConnectionError("Redis 연결 실패")
+        ):
+            response = async_to_sync(arequest_ai_response)(fake_client, "질문", "답변")
+
+        self.assertEqual(response, "AI 훈수입니다.")
+        self.assertEqual(len(fake_client.calls), 1)
+        self.assertEqual(metrics.get_counter("cache.ai_hunsoo_response.miss"), 1)
+
+    def test_prompt_template_reloads_when_file_changes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "prompt.txt")
+            with open(path, "w") as file:
+                file.write("v1 {question}")
+
+            with mock.patch("ai_hunsoos.utils.PROMPT_PATH", path):
+                self.assertEqual(load_prompt_template(), "v1 {question}")
+
+                # 같은 파일은 다시 읽지 않음
+                with mock.patch("builtins.open") as mocked_open:
+                    self.assertEqual(load_prompt_template(), "v1 {question}")
+                    mocked_open.assert_not_called()
+
+                with open(path, "w") as file:
+                    file.write("v2 {question}")
+                stat = os.stat(path)
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+                self.assertEqual(load_prompt_template(), "v2 {question}")
+
+    def test_client_is_reused(self):
+        with mock.patch("ai_hunsoos.utils.OpenAI") as openai_class, mock.patch(
+            "ai_hunsoos.utils._client", None
+        ):
+            first = get_openai_client()
+            second = get_openai_client()
+
+        self.assertIs(first, second)
+        openai_class.assert_called_once()
+
+
+class FakeAsyncOpenAIClient(FakeOpenAIClient):
+    """비동기 OpenAI 클라이언트 대신 사용하는 가짜 클라이언트"""
+
+    def __init__(self, content="AI 훈수입니다.", error=None, errors=0):
+        super().__init__(content=content, errors=errors)
+        self.error = error or ConnectionError("OpenAI 연결 실패")
+        self.closed = False
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.acreate))
+
+    async def acreate(self, **kwargs):
+        self.calls.append(kwargs)
+        if len(self.calls) <= self.errors:
+            raise self.error
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    async def close(self):
+        self.closed = True
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class BackfillAiHunsoosCommandTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.author = User.objects.create_user(
+            email="author@example.com",
+            username="author",
+            password="testpassword",
+            nickname="author",
+        )
+        self.commenter = User.objects.create_user(
+            email="commenter@example.com",
+            username="commenter",
+            password="testpassword",
+            nickname="commenter",
+        )
+        self.articles = []
+        for i in range(3):
+            article = Article.objects.create(
+                user=self.author,
+                title=f"Article {i}",
+                content=f"질문 {i}",
+                is_closed=True,
+            )
+            # 댓글 알림은 테스트 트랜잭션이 커밋되지 않으므로 여기서 저장
+            with self.captureOnCommitCallbacks(execute=True):
+                Comment.objects.create(
+                    user=self.commenter,
+                    article=article,
+                    content=f"답변 {i}",
+                    is_selected=True,
+                )
+            self.articles.append(article)
+
+        # 이전 방식에서 오류 문구가 저장된 AI 훈수
+        AiHunsoo.objects.filter(article=self.articles[2]).update(
+            content="An error occurred while generating the response: timeout",
+            status=True,
+        )
+        # 마감되지 않은 게시글은 대상이 아님
+        Article.objects.create(user=self.author, title="Open", content="열린 게시글")
+
+    def run_command(self, fake_client, *args):
+        with mock.patch(
+            "ai_hunsoos.management.commands.backfill_ai_hunsoos."
+            "create_async_openai_client",
+            return_value=fake_client,
+        ), self.captureOnCommitCallbacks(execute=True):
+            call_command(
+                "backfill_ai_hunsoos",
+                "--batch-size=2",
+                "--base-delay=0",
+                *args,
+                stdout=StringIO(),
+                stderr=StringIO(),
+            )
+
+    def test_backfill_regenerates_pending_and_failed(self):
+        fake_client = FakeAsyncOpenAIClient(error=RateLimitError(), errors=1)
+        self.run_command(fake_client)
+
+        # rate limit 1회 재시도 포함 3건 생성
+        self.assertEqual(len(fake_client.calls), 4)
+        self.assertTrue(fake_client.closed)
+        for article in self.articles:
+            ai_hunsoo = AiHunsoo.objects.get(article=article)
+            self.assertTrue(ai_hunsoo.status)
+            self.assertEqual(ai_hunsoo.content, "AI 훈수입니다.")
+        self.assertFalse(
+            AiHunsoo.objects.get(article__title="Open").status,
+        )
+        self.assertEqual(Notification.objects.filter(verb="ai_response").count(), 3)
+
+        # 모두 생성되어 다시 실행하면 처리할 대상이 없음
+        second_client = FakeAsyncOpenAIClient()
+        self.run_command(second_client)
+        self.assertEqual(second_client.calls, [])
+
+    def test_non_retryable_error_is_left_for_next_run(self):
+        fake_client = FakeAsyncOpenAIClient(errors=1)
+        self.run_command(fake_client, "--no-notify")
+
+        # 재시도하지 않는 오류는 건너뛰고 나머지 처리
+        self.assertEqual(len(fake_client.calls), 3)
+        self.assertEqual(
+            AiHunsoo.objects.filter(
+                article__in=self.articles, status=True, content="AI 훈수입니다."
+            ).count(),
+            2,
+        )
+        self.assertFalse(Notification.objects.filter(verb="ai_response").exists())
+
+        # 끝까지 실행했으므로 진행 위치가 남지 않고, 다시 실행하면 남은 건 처리
+        self.assertIsNone(cache.get(CHECKPOINT_KEY))
+        self.run_command(FakeAsyncOpenAIClient())
+        self.assertEqual(
+            AiHunsoo.objects.filter(
+                article__in=self.articles, content="AI 훈수입니다."
+            ).count(),
+            3,
+        )
+
+    def test_interrupted_run_does_not_checkpoint_past_failures(self):
+        first = AiHunsoo.objects.get(article=self.articles[0])
+        save_batch = Command.save_batch
+        calls = []
+
+        def interrupt_second_batch(command, ai_hunsoos, notify):
+            calls.append(ai_hunsoos)
+            if len(calls) == 2:
+                raise RuntimeError("interrupted")
+            save_batch(command, ai_hunsoos, notify)
+
+        # 첫 번째 행이 실패한 뒤 두 번째 배치 저장 중 중단된 경우
+        with mock.patch.object(Command, "save_batch", interrupt_second_batch):
+            with self.assertRaises(RuntimeError):
+                self.run_command(FakeAsyncOpenAIClient(errors=1), "--no-notify")
+
+        # 진행 위치는 실패한 행 직전에 머물러 다음 실행에서 실패한 행부터 처리
+        self.assertEqual(cache.get(CHECKPOINT_KEY), first.id - 1)
+        self.run_command(FakeAsyncOpenAIClient(), "--no-notify")
+        self.assertEqual(
+            AiHunsoo.objects.filter(
+                article__in=self.articles, content="AI 훈수입니다."
+            ).count(),
+            3,
+        )
+        self.assertIsNone(cache.get(CHECKPOINT_KEY))
@@ -1,4 +1,4 @@
-from ai_hunsoos.views import AiHunsooDetailView
+from ai_hunsoos.views import AiHunsooDetailView, AiHunsooJobStatusView
 from django.urls import path
 
 urlpatterns = [
@@ -7,4 +7,9 @@ urlpatterns = [
         AiHunsooDetailView.as_view(),
         name="ai-hunsoo-detail",
     ),
+    path(
+        "<int:article_id>/job/",
+        AiHunsooJobStatusView.as_view(),
+        name="ai-hunsoo-job-status",
+    ),
 ]
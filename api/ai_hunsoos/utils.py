@@ -1,9 +1,17 @@
+import hashlib
 import os
+import threading
+import time
 from pathlib import Path
 
+import httpx
+from common import metrics
+from common.cache import aget_cached, get_cached
+from common.logger import logger
 from django.conf import settings
+from django.core.cache import cache
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -11,14 +19,31 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 load_dotenv(os.path.join(BASE_DIR, ".env"))
 
 
+PROMPT_PATH = os.path.join(settings.BASE_DIR, "ai_hunsoos", "prompt.txt")
+
+# 프롬프트 템플릿 캐시 (파일 수정 시각이 바뀌면 다시 읽음)
+_prompt_cache = {"mtime": None, "template": None}
+_prompt_lock = threading.Lock()
+
+# 프로세스 전체에서 재사용하는 OpenAI 클라이언트 (keep-alive 연결 풀 공유)
+_client = None
+_client_lock = threading.Lock()
+
+RESPONSE_CACHE_KEY = "ai_hunsoo_response:{digest}"
+
+
 def load_prompt_template():
     """
     텍스트 파일로부터 프롬프트를 불러오는 함수.
+    한 번 읽은 템플릿은 메모리에 두고, 파일 수정 시각(mtime)이 바뀐 경우에만 다시 읽습니다.
     """
-    prompt_path = os.path.join(settings.BASE_DIR, "ai_hunsoos", "prompt.txt")
-    with open(prompt_path, "r") as file:
-        prompt_template = file.read()
-    return prompt_template
+    mtime = os.stat(PROMPT_PATH).st_mtime_ns
+    with _prompt_lock:
+        if _prompt_cache["mtime"] != mtime:
+            with open(PROMPT_PATH, "r") as file:
+                _prompt_cache["template"] = file.read()
+            _prompt_cache["mtime"] = mtime
+        return _prompt_cache["template"]
 
 
 # ai_test.py 실행용
@@ -31,24 +56,70 @@ def load_prompt_template():
 #         return file.read()
 
 
-def generate_ai_response(question, answer):
+def get_openai_client():
+    """
+    OpenAI API 클라이언트를 반환하는 함수. (테스트에서는 가짜 클라이언트로 대체)
+    매 호출마다 새 연결(TLS 핸드셰이크)을 맺지 않도록 연결 풀을 가진 클라이언트를 재사용합니다.
     """
-    GPT-4-mini 모델을 사용해 AI 응답을 생성하는 함수.
+    global _client
+    with _client_lock:
+        if _client is None:
+            http_client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=settings.OPENAI_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.OPENAI_MAX_CONNECTIONS,
+                    keepalive_expiry=settings.OPENAI_KEEPALIVE_EXPIRY,
+                ),
+                timeout=httpx.Timeout(
+                    settings.OPENAI_TIMEOUT, connect=settings.OPENAI_CONNECT_TIMEOUT
+                ),
+            )
+            _client = OpenAI(
+                api_key=os.environ.get("API_KEY"),
+                http_client=http_client,
+                # 재시도는 AI 훈수 작업 큐에서 backoff와 함께 처리
+                max_retries=settings.OPENAI_MAX_RETRIES,
+            )
+        return _client
+
+
+def create_async_openai_client():
+    """
+    비동기 OpenAI 클라이언트를 만듭니다. (이벤트 루프마다 새로 만들고 사용 후 close 해야 함)
+    """
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.OPENAI_MAX_CONNECTIONS,
+            keepalive_expiry=settings.OPENAI_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(
+            settings.OPENAI_TIMEOUT, connect=settings.OPENAI_CONNECT_TIMEOUT
+        ),
+    )
+    return AsyncOpenAI(
+        api_key=os.environ.get("API_KEY"),
+        http_client=http_client,
+        max_retries=settings.OPENAI_MAX_RETRIES,
+    )
 
-    :param question: 게시글의 질문 내용
-    :param answer: 선택된 답변 내용
-    :return: AI가 생성한 응답 텍스트
+
+def get_response_cache_key(prompt, model):
+    """(프롬프트(질문과 답변 포함), 모델) 해시로 응답 캐시 키를 만듭니다."""
+    digest = hashlib.sha256(f"{model}\0{prompt}".encode("utf-8")).hexdigest()
+    return RESPONSE_CACHE_KEY.format(digest=digest)
+
+
+def build_chat_request(question, answer):
+    """
+    프롬프트를 만들고 (응답 캐시 키, chat.completions.create 인자)를 반환하는 함수.
     """
     # 프롬프트 템플릿 불러오기
     prompt_template = load_prompt_template()
 
     # 프롬프트에 게시글과 댓글 내용 삽입
     prompt = prompt_template.format(question=question, answer=answer)
-
-    # OpenAI API
-    client = OpenAI(
-        api_key=os.environ.get("API_KEY"),
-    )
+    model = settings.OPENAI_MODEL
 
     messages = [
         {
@@ -57,18 +128,95 @@ def generate_ai_response(question, answer):
         },
         {"role": "user", "content": prompt},
     ]
+    request = {
+        "model": model,  # GPT-4-mini 모델 사용
+        "messages": messages,  # AI에게 주어질 프롬프트
+        "max_tokens": 300,  # 응답의 최대 길이 설정
+        "n": 1,  # 생성할 응답 수
+        "stop": None,  # 응답을 멈추는 특정 토큰 설정
+        "temperature": 0.7,  # 생성되는 텍스트의 창의성 조절
+    }
+    return get_response_cache_key(prompt, model), request
+
+
+def request_ai_response(question, answer):
+    """
+    GPT-4-mini 모델을 사용해 AI 응답을 생성하는 함수. 오류가 발생하면 예외를 그대로 전달합니다.
+    같은 질문/답변/모델에 대한 응답은 캐시에서 반환하여 유료 API 호출을 생략합니다.
+
+    :param question: 게시글의 질문 내용
+    :param answer: 선택된 답변 내용
+    :return: AI가 생성한 응답 텍스트
+    """
+    cache_key, request = build_chat_request(question, answer)
+    cached_response = get_cached("ai_hunsoo_response", cache_key)
+    if cached_response is not None:
+        return cached_response
+
+    # OpenAI API
+    client = get_openai_client()
+
+    started = time.perf_counter()
+    try:
+        response = client.chat.completions.create(**request)
+    except Exception:
+        metrics.increment("openai.chat.error")
+        raise
+    finally:
+        # 호출별 지연 시간 (실패 포함)
+        metrics.observe(
+            "openai.chat.latency_ms", (time.perf_counter() - started) * 1000
+        )
+
+    # 응답 텍스트 반환
+    content = response.choices[0].message.content
+    try:
+        cache.set(cache_key, content, settings.AI_HUNSOO_RESPONSE_CACHE_TIMEOUT)
+    except Exception as e:
+        # 캐시 저장에 실패해도 이미 비용을 지불한 응답은 그대로 사용 (작업을 재시도하지 않음)
+        logger.warning(f"AI 응답 캐시 저장 실패 ({cache_key}): {e}")
+    return content
+
+
+async def arequest_ai_response(client, question, answer):
+    """
+    request_ai_response의 비동기 버전. client는 create_async_openai_client()로 만든 클라이언트.
+    """
+    cache_key, request = build_chat_request(question, answer)
+    cached_response = await aget_cached("ai_hunsoo_response", cache_key)
+    if cached_response is not None:
+        return cached_response
 
+    started = time.perf_counter()
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",  # GPT-4-mini 모델 사용
-            messages=messages,  # AI에게 주어질 프롬프트
-            max_tokens=300,  # 응답의 최대 길이 설정
-            n=1,  # 생성할 응답 수
-            stop=None,  # 응답을 멈추는 특정 토큰 설정
-            temperature=0.7,  # 생성되는 텍스트의 창의성 조절
+        response = await client.chat.completions.create(**request)
+    except Exception:
+        metrics.increment("openai.chat.error")
+        raise
+    finally:
+        metrics.observe(
+            "openai.chat.latency_ms", (time.perf_counter() - started) * 1000
         )
-        # 응답 텍스트 반환
-        return response.choices[0].message.content
+
+    content = response.choices[0].message.content
+    try:
+        await cache.aset(cache_key, content, settings.AI_HUNSOO_RESPONSE_CACHE_TIMEOUT)
+    except Exception as e:
+        # 캐시 저장에 실패해도 생성한 응답은 그대로 사용
+        logger.warning(f"AI 응답 캐시 저장 실패 ({cache_key}): {e}")
+    return content
+
+
+def generate_ai_response(question, answer):
+    """
+    AI 응답을 생성하는 함수. 오류 발생 시 오류 메시지를 응답으로 반환합니다.
+
+    :param question: 게시글의 질문 내용
+    :param answer: 선택된 답변 내용
+    :return: AI가 생성한 응답 텍스트
+    """
+    try:
+        return request_ai_response(question, answer)
 
     except Exception as e:
         # 오류 발생 시 기본 응답을 반환
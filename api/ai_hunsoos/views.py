@@ -1,5 +1,5 @@
-from ai_hunsoos.models import AiHunsoo, Article
-from ai_hunsoos.serializers import AiHunsooSerializer
+from ai_hunsoos.models import AiHunsoo, AiHunsooJob, Article
+from ai_hunsoos.serializers import AiHunsooJobSerializer, AiHunsooSerializer
 from rest_framework import generics
 from rest_framework.exceptions import NotFound
 from rest_framework.permissions import AllowAny
@@ -30,3 +30,23 @@ class AiHunsooDetailView(generics.RetrieveAPIView):
         ai_hunsoo = self.get_object()
         serializer = self.get_serializer(ai_hunsoo)
         return Response(serializer.data)
+
+
+class AiHunsooJobStatusView(generics.RetrieveAPIView):
+    """
+    특정 게시글의 AI 답변 생성 작업 상태를 조회하는 뷰 (가장 최근 작업 기준)
+    """
+
+    serializer_class = AiHunsooJobSerializer
+    permission_classes = [AllowAny]
+
+    def get_object(self):
+        article_id = self.kwargs.get("article_id")
+        job = (
+            AiHunsooJob.objects.filter(article_id=article_id)
+            .order_by("-created_at", "-id")
+            .first()
+        )
+        if job is None:
+            raise NotFound(detail="해당 게시글에 대한 AI 답변 생성 작업이 없습니다.")
+        return job
@@ -7,3 +7,8 @@ class ArticlesConfig(AppConfig):
 
     def ready(self):
         import articles.signals
+        from articles.images import complete_moves
+        from common import outbox
+
+        # S3 이동이 끝난 게시글 이미지의 URL 변경 (outbox 워커에서 호출)
+        outbox.register_move_handler(complete_moves)
@@ -0,0 +1,66 @@
+import hashlib
+
+from common.cache import bump_namespace, get_cached, versioned_key
+from django.core.cache import cache
+
+from .models import Article
+
+# 게시글 목록 캐시 네임스페이스 (전체 목록, 태그별 목록, 검색 결과 공통)
+ARTICLE_LIST_NAMESPACE = "article_list"
+ARTICLE_LIST_TIMEOUT = 60 * 15  # 15분 동안 캐시 유지
+# 바뀌면 목록 캐시를 무효화해야 하는 게시글 필드
+# (조회수/좋아요/댓글 수는 캐시 TTL 동안 늦게 반영되는 것을 허용하므로 제외)
+ARTICLE_LIST_FIELDS = {"user", "user_id", "title", "content", "created_at"}
+
+
+def article_list_cache_key(*parts):
+    """현재 네임스페이스 버전이 포함된 게시글 목록 캐시 키를 만듭니다."""
+    return versioned_key(ARTICLE_LIST_NAMESPACE, *parts)
+
+
+def article_search_cache_key(query, *parts):
+    # 검색어는 길이 제한이 없으므로 해시값을 키로 사용
+    digest = hashlib.sha256(query.encode("utf-8")).hexdigest()
+    return article_list_cache_key("search", digest, *parts)
+
+
+def get_or_build_article_list(cache_key, build):
+    """
+    사용자와 무관한 게시글 목록을 캐시에서 가져오고, 없으면 build()로 만들어 저장합니다.
+    build()가 None을 반환하면 캐시하지 않습니다.
+    """
+    data = get_cached(ARTICLE_LIST_NAMESPACE, cache_key)
+    if data is None:
+        data = build()
+        if data is not None:
+            cache.set(cache_key, data, ARTICLE_LIST_TIMEOUT)
+    return data
+
+
+def invalidate_article_lists():
+    """게시글 목록 캐시 전체를 무효화합니다. (Redis 연산 1회)"""
+    return bump_namespace(ARTICLE_LIST_NAMESPACE)
+
+
+def apply_viewer_overlay(request, articles):
+    """
+    캐시된 게시글 목록에 요청한 사용자별 값(좋아요 여부, 로그인 여부)을 덮어씁니다.
+    좋아요 여부는 해당 목록의 게시글 id로 한 번만 조회합니다.
+    """
+    if not request.user.is_authenticated:
+        return articles
+
+    article_ids = [article["article_id"] for article in articles]
+    liked_ids = set(
+        Article.likes.through.objects.filter(
+            user_id=request.user.id, article_id__in=article_ids
+        ).values_list("article_id", flat=True)
+    )
+    return [
+        {
+            **article,
+            "status": True,
+            "like": article["article_id"] in liked_ids,
+        }
+        for article in articles
+    ]
@@ -0,0 +1,143 @@
+import uuid
+
+from common.cache import get_redis
+from common.logger import logger
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Value, When
+
+from .models import Article, ArticleViewCountFlush
+
+# 아직 DB에 반영되지 않은 조회수 증가분 (Redis hash: article_id -> 증가분)
+VIEW_COUNT_KEY = "article_view_count_pending"
+# flush 중인 스냅샷 키 (flush 도중 실패하면 다음 flush에서 이어서 처리)
+VIEW_COUNT_FLUSHING_KEY = f"{VIEW_COUNT_KEY}:flushing"
+# flush 중인 스냅샷의 ID (ArticleViewCountFlush에 기록되어 있으면 이미 DB에 반영된 스냅샷)
+VIEW_COUNT_SNAPSHOT_KEY = f"{VIEW_COUNT_KEY}:snapshot"
+# 여러 프로세스가 동시에 flush하지 않도록 잡는 잠금 (flush가 비정상 종료돼도 TTL 후 해제)
+VIEW_COUNT_LOCK_KEY = f"{VIEW_COUNT_KEY}:lock"
+VIEW_COUNT_LOCK_TTL = 300
+
+# 남은 스냅샷이 있으면 그 ID를, 없으면 누적된 조회수를 새 스냅샷으로 옮기고 새 ID를 반환
+_SNAPSHOT_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 0 then
+    if redis.call('EXISTS', KEYS[1]) == 0 then
+        return false
+    end
+    redis.call('RENAME', KEYS[1], KEYS[2])
+    redis.call('SET', KEYS[3], ARGV[1])
+end
+local snapshot_id = redis.call('GET', KEYS[3])
+if not snapshot_id then
+    snapshot_id = ARGV[1]
+    redis.call('SET', KEYS[3], snapshot_id)
+end
+return snapshot_id
+"""
+
+# 자신이 잡은 잠금일 때만 해제
+_UNLOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def increment_view_count(article):
+    """
+    조회수 증가분을 Redis에 누적합니다. DB 반영은 flush_view_counts가 일괄 처리합니다.
+    Redis를 사용할 수 없으면 DB에 바로 반영합니다.
+    """
+    redis = get_redis()
+    if redis is not None:
+        try:
+            redis.hincrby(VIEW_COUNT_KEY, article.id, 1)
+            return
+        except Exception as e:
+            logger.warning(f"조회수 Redis 누적 실패, DB에 바로 반영합니다: {e}")
+
+    Article.objects.filter(id=article.id).update(view_count=F("view_count") + 1)
+    article.view_count += 1
+
+
+def get_pending_view_count(article_id):
+    """아직 DB에 반영되지 않은 조회수 증가분을 반환합니다."""
+    redis = get_redis()
+    if redis is None:
+        return 0
+    try:
+        pending = 0
+        for key in (VIEW_COUNT_KEY, VIEW_COUNT_FLUSHING_KEY):
+            pending += int(redis.hget(key, article_id) or 0)
+        return pending
+    except Exception:
+        return 0
+
+
+def flush_view_counts(batch_size=500):
+    """
+    Redis에 누적된 조회수를 F() 표현식으로 일괄 반영하고, 반영한 게시글 수를 반환합니다.
+    게시글 batch_size개마다 UPDATE 한 번을 실행합니다.
+    다른 프로세스가 flush 중이면 아무것도 하지 않고 0을 반환합니다.
+    """
+    redis = get_redis()
+    if redis is None:
+        return 0
+
+    token = uuid.uuid4().hex
+    if not redis.set(VIEW_COUNT_LOCK_KEY, token, nx=True, ex=VIEW_COUNT_LOCK_TTL):
+        return 0
+    try:
+        return _flush_snapshot(redis, batch_size)
+    finally:
+        redis.eval(_UNLOCK_SCRIPT, 1, VIEW_COUNT_LOCK_KEY, token)
+
+
+def _flush_snapshot(redis, batch_size):
+    # 이전 flush가 중간에 실패해 남은 스냅샷이 있으면 그 스냅샷부터 처리
+    snapshot_id = redis.eval(
+        _SNAPSHOT_SCRIPT,
+        3,
+        VIEW_COUNT_KEY,
+        VIEW_COUNT_FLUSHING_KEY,
+        VIEW_COUNT_SNAPSHOT_KEY,
+        uuid.uuid4().hex,
+    )
+    if snapshot_id is None:
+        # 누적된 조회수가 없음
+        return 0
+    if isinstance(snapshot_id, bytes):
+        snapshot_id = snapshot_id.decode()
+
+    pending = [
+        (int(article_id), int(count))
+        for article_id, count in redis.hgetall(VIEW_COUNT_FLUSHING_KEY).items()
+        if int(count)
+    ]
+
+    with transaction.atomic():
+        # 커밋 후 스냅샷을 지우기 전에 실패했다면 이미 반영된 스냅샷이므로 지우기만 함
+        _, created = ArticleViewCountFlush.objects.get_or_create(
+            snapshot_id=snapshot_id
+        )
+        if created:
+            # 스냅샷은 한 번에 하나뿐이므로 이전 기록은 더 이상 필요 없음
+            ArticleViewCountFlush.objects.exclude(snapshot_id=snapshot_id).delete()
+            for start in range(0, len(pending), batch_size):
+                batch = pending[start : start + batch_size]
+                Article.objects.filter(
+                    id__in=[article_id for article_id, _ in batch]
+                ).update(
+                    view_count=F("view_count")
+                    + Case(
+                        *[
+                            When(id=article_id, then=Value(count))
+                            for article_id, count in batch
+                        ],
+                        default=Value(0),
+                        output_field=IntegerField(),
+                    )
+                )
+
+    redis.delete(VIEW_COUNT_FLUSHING_KEY, VIEW_COUNT_SNAPSHOT_KEY)
+    return len(pending) if created else 0
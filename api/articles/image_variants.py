@@ -0,0 +1,161 @@
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from common import metrics, storage
+from common.logger import logger
+from django.conf import settings
+from django.db import connections
+from PIL import Image, ImageOps
+
+from .cache import invalidate_article_lists
+from .models import ArticleImage
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    게시글 이미지 변환용 스레드 풀을 반환합니다.
+    이미지 디코딩/인코딩은 요청 처리 스레드가 아닌 이 풀에서 실행됩니다.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.ARTICLE_IMAGE_WORKERS,
+                thread_name_prefix="article-image",
+            )
+    return _executor
+
+
+def submit(article_id):
+    if settings.ARTICLE_IMAGE_VARIANTS_EAGER:
+        # 테스트 등에서 현재 스레드에서 바로 실행
+        process_article_images(article_id)
+        return
+    get_executor().submit(run_in_thread, article_id)
+
+
+def run_in_thread(article_id):
+    try:
+        process_article_images(article_id)
+    except Exception:
+        logger.exception(f"게시글 {article_id} 이미지 변환 중 오류")
+    finally:
+        # 워커 스레드에서 연 DB 연결 정리
+        connections.close_all()
+
+
+def get_variant_key(key, width):
+    """원본 키 옆에 저장할 변환 이미지 키 (articles/1/abc.png -> articles/1/abc_320.webp)"""
+    return f"{key.rsplit('.', 1)[0]}_{width}.webp"
+
+
+def build_variants(data):
+    """
+    이미지를 디코딩해 설정된 너비별 WebP 이미지를 만듭니다.
+    EXIF 방향은 픽셀에 반영하고 메타데이터(EXIF, ICC 등)는 저장하지 않습니다.
+    원본보다 큰 너비는 원본 크기로 만들며, 같은 크기는 한 번만 인코딩합니다.
+    {너비: (실제 너비, 높이, WebP bytes)}를 반환합니다.
+    """
+    with Image.open(io.BytesIO(data)) as source:
+        image = ImageOps.exif_transpose(source)
+        image = image.convert(
+            "RGBA" if image.mode in ("RGBA", "LA", "P", "PA") else "RGB"
+        )
+
+    encoded = {}
+    variants = {}
+    for width in settings.ARTICLE_IMAGE_VARIANT_WIDTHS:
+        target_width = min(width, image.width)
+        if target_width not in encoded:
+            resized = image
+            if target_width < image.width:
+                height = max(1, round(image.height * target_width / image.width))
+                resized = image.resize((target_width, height), Image.LANCZOS)
+            buffer = io.BytesIO()
+            resized.save(
+                buffer,
+                "WEBP",
+                quality=settings.ARTICLE_IMAGE_WEBP_QUALITY,
+                method=4,
+            )
+            encoded[target_width] = (resized.width, resized.height, buffer.getvalue())
+        variants[width] = encoded[target_width]
+    return variants
+
+
+def process_image(image):
+    """원본을 내려받아 변환 이미지를 업로드하고, 저장할 variants 값과 원본 크기를 반환합니다."""
+    key = storage.get_key(image.image)
+    data = storage.download_file(key)
+    variants = {}
+    uploaded = {}
+    for width, (real_width, height, content) in build_variants(data).items():
+        variant_key = get_variant_key(key, real_width)
+        if variant_key not in uploaded:
+            uploaded[variant_key] = storage.put_file(
+                variant_key, content, content_type="image/webp"
+            )
+        variants[str(width)] = {
+            "url": uploaded[variant_key],
+            "width": real_width,
+            "height": height,
+            "size": len(content),
+        }
+
+    thumbnail = variants[str(settings.ARTICLE_IMAGE_THUMBNAIL_WIDTH)]
+    metrics.increment("article_image.original_bytes", len(data))
+    metrics.increment("article_image.thumbnail_bytes", thumbnail["size"])
+    return variants, len(data)
+
+
+def process_article_images(article_id):
+    """
+    게시글에 연결된 이미지 중 아직 변환되지 않은 이미지의 크기별 WebP를 만듭니다.
+    처리한 이미지 수를 반환합니다.
+    """
+    # 게시글 경로로 이동이 끝난 이미지만 변환
+    images = ArticleImage.objects.filter(
+        article_id=article_id,
+        is_temporary=False,
+        variants={},
+        image__startswith=storage.get_codec().article_prefix(article_id),
+    ).order_by("id")
+
+    processed = 0
+    for image in images:
+        try:
+            variants, size = process_image(image)
+        except Exception as e:
+            metrics.increment("article_image.variant_error")
+            logger.warning(f"게시글 이미지 {image.id} 변환 실패: {e}")
+            continue
+
+        updated = ArticleImage.objects.filter(id=image.id, image=image.image).update(
+            variants=variants, size=size
+        )
+        if not updated:
+            # 변환 중 이미지가 삭제/변경된 경우 업로드한 변환 이미지 정리
+            storage.delete_files(get_variant_keys(variants))
+            continue
+        processed += 1
+
+    if processed:
+        # 목록 캐시에 저장된 썸네일 URL 갱신
+        invalidate_article_lists()
+    return processed
+
+
+def get_variant_keys(variants):
+    return list(
+        dict.fromkeys(storage.get_key(variant["url"]) for variant in variants.values())
+    )
+
+
+def get_thumbnail_url(image):
+    """목록에서 사용할 작은 WebP 썸네일 URL (변환 전이면 원본 URL)"""
+    variant = (image.variants or {}).get(str(settings.ARTICLE_IMAGE_THUMBNAIL_WIDTH))
+    return variant["url"] if variant else image.image_url
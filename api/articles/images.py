@@ -0,0 +1,202 @@
+import re
+from collections import defaultdict
+
+from comments.models import CommentImage
+from common import metrics, outbox, storage
+from django.db import transaction
+
+from . import image_variants
+from .image_variants import get_variant_keys
+from .models import Article, ArticleImage
+
+# 게시글 이미지 객체 키 (articles/<게시글 id>/<파일 이름>)
+ARTICLE_KEY_PATTERN = re.compile(r"articles/(\d+)/([^/]+)$")
+
+
+def upload_temp_image(file):
+    """이미지를 S3 임시 경로에 업로드하고 URL을 반환합니다. (게시글 저장 시 최종 경로로 이동)"""
+    return storage.upload_file(file, storage.generate_key("temporary"))
+
+
+def create_pending_image(content_type, uploader):
+    """
+    S3 임시 경로로 직접 업로드할 presigned POST와 업로드 대기 중인 ArticleImage를 만듭니다.
+    클라이언트(uploader)는 업로드 후 confirm 요청으로 업로드 완료를 알립니다.
+    """
+    upload = storage.create_presigned_upload("temporary", content_type)
+    image = ArticleImage.objects.create(
+        image=upload["image_url"], article=None, is_uploaded=False, uploader=uploader
+    )
+    return image, upload
+
+
+def confirm_uploaded_image(image):
+    """S3에 파일이 올라왔는지 확인하고 이미지를 업로드 완료 상태로 변경합니다."""
+    if image.is_uploaded:
+        return True
+    if not storage.object_exists(storage.get_key(image.image)):
+        return False
+    image.is_uploaded = True
+    image.save(update_fields=["is_uploaded", "updated_at"])
+    return True
+
+
+def update_image_urls(content, article):
+    """
+    본문의 임시 이미지 URL 중 게시글 경로로 이동이 끝난 이미지의 URL을 최종 URL로 변환합니다.
+    (이동 중인 이미지는 임시 URL을 그대로 두고, 이동이 끝나면 complete_moves에서 변환)
+    """
+    codec = storage.get_codec()
+    if codec.temp_prefix not in content:
+        return content
+    prefix = codec.article_prefix(article.id)
+    names = {
+        url[len(prefix) :]
+        for url in article.images.filter(image__startswith=prefix).values_list(
+            "image", flat=True
+        )
+    }
+    return codec.rewrite_temp_urls(content, article.id, names)
+
+
+def move_temp_images_to_article(temp_image_ids, article):
+    """
+    임시 이미지들을 게시글에 연결하고, 최종 게시글 경로로의 이동을 outbox에 기록합니다.
+    요청 처리 중에는 DB만 변경하고(bulk_update + outbox 기록), S3 이동(복사 후 임시 파일
+    삭제)은 커밋 후 outbox 워커가 처리합니다. 이미지와 본문의 URL은 복사가 끝난 뒤
+    complete_moves에서 바꾸므로 그 전까지는 임시 URL로 계속 보입니다.
+    """
+    article_id = article.id
+    with transaction.atomic():
+        # 오래된 임시 이미지 정리와 겹치지 않도록 연결할 이미지 행을 잠금
+        images = list(
+            ArticleImage.objects.select_for_update().filter(
+                id__in=temp_image_ids, is_temporary=True, is_uploaded=True
+            )
+        )
+        if not images:
+            return []
+
+        moves = []
+        for image in images:
+            old_key = storage.get_key(image.image)
+            # 게시글 경로로 이동
+            new_key = f"articles/{article_id}/{old_key.split('/')[-1]}"
+            moves.append((old_key, new_key))
+
+            image.article = article  # 게시글과 연결
+            image.is_temporary = False  # 임시 상태 해제
+
+        ArticleImage.objects.bulk_update(images, ["article", "is_temporary"])
+        outbox.enqueue_moves(moves)
+    return images
+
+
+def complete_moves(tasks):
+    """
+    outbox 이동 작업의 복사가 끝나면 (임시 파일 삭제 전) 이미지와 본문의 URL을 게시글 경로로
+    바꾸고 크기별 WebP 변환을 시작합니다. 재시도(drain)로 끝난 이동도 여기서 처리합니다.
+    """
+    # 게시글 id -> {임시 URL: 게시글 이미지 URL}
+    moved = defaultdict(dict)
+    for task in tasks:
+        match = ARTICLE_KEY_PATTERN.match(task.dest_key)
+        if match:
+            moved[int(match.group(1))][storage.get_url(task.key)] = storage.get_url(
+                task.dest_key
+            )
+
+    for article_id, urls in moved.items():
+        with transaction.atomic():
+            # 본문 수정 요청과 겹치지 않도록 게시글 행을 잠금
+            article = Article.objects.select_for_update().filter(id=article_id).first()
+            if article is None:
+                continue
+            images = list(
+                ArticleImage.objects.filter(article_id=article_id, image__in=urls)
+            )
+            for image in images:
+                image.image = urls[image.image]
+            ArticleImage.objects.bulk_update(images, ["image"])
+
+            names = {url.rsplit("/", 1)[-1] for url in urls.values()}
+            content = storage.get_codec().rewrite_temp_urls(
+                article.content, article_id, names
+            )
+            if content != article.content:
+                article.content = content
+                article.save(update_fields=["content"])
+        image_variants.submit(article_id)
+
+
+def get_image_keys(images):
+    """원본과 변환 이미지를 포함한 S3 객체 키 목록"""
+    keys = []
+    for image in images:
+        keys.append(storage.get_key(image.image))
+        keys.extend(get_variant_keys(image.variants or {}))
+    return keys
+
+
+# s3와 db에 있는 이미지 정보 모두 삭제
+def delete_images(image_ids):
+    """
+    이미지 ID 목록을 받아서 DB에서 삭제하고, S3 파일 삭제를 outbox에 기록합니다.
+    (S3 삭제는 커밋 후 outbox 워커가 처리)
+    """
+    with transaction.atomic():
+        images = list(ArticleImage.objects.filter(id__in=image_ids))
+        if not images:
+            return []
+
+        deleted_images = [image.id for image in images]
+        ArticleImage.objects.filter(id__in=deleted_images).delete()
+        outbox.enqueue_deletes(get_image_keys(images))
+    return deleted_images
+
+
+def delete_stale_temporary_images(created_before, batch_size=1000, dry_run=False):
+    """
+    created_before 이전에 업로드되었지만 게시글에 연결되지 않은 임시 이미지와
+    업로드 확인이 끝나지 않은 댓글 이미지를 S3(delete_objects)와 DB에서 batch_size개씩 삭제합니다.
+    삭제한(dry_run이면 삭제 대상) 이미지 수와 S3 용량(bytes)을 반환합니다.
+    """
+    querysets = [
+        ArticleImage.objects.filter(
+            is_temporary=True, article__isnull=True, created_at__lt=created_before
+        ),
+        CommentImage.objects.filter(is_uploaded=False, created_at__lt=created_before),
+    ]
+
+    deleted = reclaimed = 0
+    for queryset in querysets:
+        last_id = 0
+        while True:
+            with transaction.atomic():
+                # 정리 중에 게시글에 연결되는 이미지와 겹치지 않도록 행 잠금
+                batch = list(
+                    queryset.filter(id__gt=last_id)
+                    .order_by("id")
+                    .select_for_update(skip_locked=True)
+                    .values_list("id", "image")[:batch_size]
+                )
+                if not batch:
+                    break
+                last_id = batch[-1][0]
+                keys = [storage.get_key(url) for _, url in batch if url]
+                # 삭제할 객체의 크기만 조회 (임시 경로 전체를 나열하지 않음)
+                sizes = storage.get_object_sizes(keys)
+
+                if not dry_run:
+                    storage.delete_files(keys)
+                    queryset.model.objects.filter(
+                        id__in=[image_id for image_id, _ in batch]
+                    ).delete()
+
+            deleted += len(batch)
+            reclaimed += sum(sizes.values())
+
+    if not dry_run:
+        metrics.increment("article_image.temporary_deleted", deleted)
+        metrics.increment("article_image.temporary_bytes_reclaimed", reclaimed)
+    return deleted, reclaimed
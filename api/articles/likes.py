@@ -0,0 +1,81 @@
+from common import metrics
+from django.db import connection
+from django.db.models.signals import m2m_changed
+from users.models import User
+
+from .models import Article
+
+# 좋아요 행 추가와 좋아요 수 증가를 한 문장으로 처리 (이미 좋아요한 경우 아무 행도 반환하지 않음)
+_LIKE = """
+WITH liked AS (
+    INSERT INTO {likes} (article_id, user_id) VALUES (%s, %s)
+    ON CONFLICT (article_id, user_id) DO NOTHING
+    RETURNING article_id
+)
+UPDATE {articles} SET like_count = like_count + 1
+FROM liked WHERE {articles}.id = liked.article_id
+RETURNING like_count
+"""
+
+# 좋아요 행 삭제와 좋아요 수 감소를 한 문장으로 처리 (좋아요하지 않은 경우 아무 행도 반환하지 않음)
+_UNLIKE = """
+WITH unliked AS (
+    DELETE FROM {likes} WHERE article_id = %s AND user_id = %s
+    RETURNING article_id
+)
+UPDATE {articles} SET like_count = like_count - 1
+FROM unliked WHERE {articles}.id = unliked.article_id
+RETURNING like_count
+"""
+
+# 동시에 같은 사용자의 토글이 겹쳐 두 문장이 모두 아무 행도 바꾸지 못한 경우의 재시도 횟수
+MAX_ATTEMPTS = 3
+
+
+def _execute(sql, article_id, user_id):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            sql.format(
+                likes=Article.likes.through._meta.db_table,
+                articles=Article._meta.db_table,
+            ),
+            [article_id, user_id],
+        )
+        row = cursor.fetchone()
+    return None if row is None else row[0]
+
+
+def toggle_like(article, user_id):
+    """
+    좋아요를 추가하거나(없으면) 취소하고(있으면) (좋아요 여부, 새 좋아요 수)를 반환합니다.
+    좋아요 목록을 불러오거나 COUNT를 실행하지 않으며, 각 문장은 행 추가/삭제와 좋아요 수 변경을
+    함께 처리하므로 동시에 눌러도 like_count와 좋아요 행 수가 어긋나지 않습니다.
+    """
+    for _ in range(MAX_ATTEMPTS):
+        like_count = _execute(_LIKE, article.id, user_id)
+        if like_count is not None:
+            _send_m2m_changed(article, "post_add", user_id)
+            metrics.increment("article.like.added")
+            return True, like_count
+
+        # 이미 좋아요한 상태 (새 문장이므로 다른 요청이 방금 커밋한 좋아요도 보임)
+        like_count = _execute(_UNLIKE, article.id, user_id)
+        if like_count is not None:
+            _send_m2m_changed(article, "post_remove", user_id)
+            metrics.increment("article.like.removed")
+            return False, like_count
+
+    raise RuntimeError(f"게시글 {article.id} 좋아요 변경이 계속 충돌합니다.")
+
+
+def _send_m2m_changed(article, action, user_id):
+    # SQL로 직접 변경하므로 article.likes.add/remove와 같은 시그널을 보냄 (좋아요 알림 등)
+    m2m_changed.send(
+        sender=Article.likes.through,
+        instance=article,
+        action=action,
+        reverse=False,
+        model=User,
+        pk_set={user_id},
+        using=connection.alias,
+    )
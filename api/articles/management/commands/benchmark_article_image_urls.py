@@ -0,0 +1,121 @@
+import random
+import re
+import string
+import time
+
+from common import storage
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+def legacy_base_url():
+    """변경 전 방식: 호출할 때마다 설정값으로 버킷 URL 생성"""
+    return f"https://{settings.AWS_STORAGE_BUCKET_NAME}.s3.{settings.AWS_S3_REGION_NAME}.amazonaws.com/"
+
+
+def legacy_update_image_urls(content, article_id):
+    """변경 전 방식: 호출할 때마다 정규 표현식 컴파일, 치환할 때마다 URL 생성"""
+    temp_url_pattern = re.compile(
+        rf"{re.escape(legacy_base_url())}temporary/([a-zA-Z0-9]+.png)"
+    )
+
+    def replace_temp_url(match):
+        return legacy_base_url() + f"articles/{article_id}/{match.group(1)}"
+
+    return re.sub(temp_url_pattern, replace_temp_url, content)
+
+
+def legacy_get_key(url):
+    return url.split(legacy_base_url())[-1]
+
+
+def build_articles(rng, count, images, paragraph_length=400):
+    """임시 이미지 URL이 images개씩 포함된 게시글 본문 목록"""
+    base_url = storage.get_base_url()
+    articles = []
+    for _ in range(count):
+        parts = []
+        for _ in range(images):
+            name = "".join(rng.choices(string.ascii_letters + string.digits, k=16))
+            parts.append("가" * rng.randint(paragraph_length // 2, paragraph_length))
+            parts.append(f'<img src="{base_url}temporary/{name}.png">')
+        articles.append("".join(parts))
+    return articles
+
+
+def chunked(content, size):
+    for i in range(0, len(content), size):
+        yield content[i : i + size]
+
+
+class Command(BaseCommand):
+    help = "게시글 본문 이미지 URL 변환과 키/URL 변환 시간을 변경 전 방식과 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--articles", type=int, default=10000)
+        parser.add_argument("--images", type=int, default=20, help="게시글당 이미지 수")
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument(
+            "--chunk-size", type=int, default=8192, help="스트리밍 변환 청크 크기"
+        )
+
+    def handle(self, *args, **options):
+        rng = random.Random(0)
+        articles = build_articles(rng, options["articles"], options["images"])
+        codec = storage.get_codec()
+        chunk_size = options["chunk_size"]
+        self.stdout.write(
+            f"게시글 {len(articles)}개, 게시글당 이미지 {options['images']}개"
+        )
+
+        # 세 방식의 결과가 같은지 먼저 확인
+        for article_id, content in enumerate(articles[:100]):
+            expected = legacy_update_image_urls(content, article_id)
+            assert codec.rewrite_temp_urls(content, article_id) == expected
+            assert (
+                "".join(
+                    codec.iter_rewrite_temp_urls(
+                        chunked(content, chunk_size), article_id
+                    )
+                )
+                == expected
+            )
+
+        urls = [
+            codec.to_url(f"articles/{article_id}/{i}.png")
+            for article_id in range(len(articles))
+            for i in range(options["images"])
+        ]
+        cases = [
+            (
+                "rewrite(legacy)",
+                lambda: [
+                    legacy_update_image_urls(c, i) for i, c in enumerate(articles)
+                ],
+            ),
+            (
+                "rewrite(codec)",
+                lambda: [codec.rewrite_temp_urls(c, i) for i, c in enumerate(articles)],
+            ),
+            (
+                "rewrite(stream)",
+                lambda: [
+                    "".join(codec.iter_rewrite_temp_urls(chunked(c, chunk_size), i))
+                    for i, c in enumerate(articles)
+                ],
+            ),
+            ("get_key(legacy)", lambda: [legacy_get_key(url) for url in urls]),
+            ("get_key(codec)", lambda: [codec.to_key(url) for url in urls]),
+        ]
+        for name, run in cases:
+            timings = []
+            for _ in range(options["repeat"]):
+                started = time.perf_counter()
+                run()
+                timings.append((time.perf_counter() - started) * 1000)
+
+            timings.sort()
+            self.stdout.write(
+                f"{name:<16} median={timings[len(timings) // 2]:.1f}ms "
+                f"min={timings[0]:.1f}ms"
+            )
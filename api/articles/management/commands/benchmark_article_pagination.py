@@ -0,0 +1,96 @@
+import time
+
+from articles.models import Article
+from articles.views.article_list_views import (
+    ArticlePageNumberPagination,
+    ArticlePagination,
+)
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = "OFFSET 페이지네이션과 키셋(커서) 페이지네이션의 1페이지/깊은 페이지 조회 시간을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="게시글 수가 이 값보다 적으면 부족한 만큼 더미 게시글을 생성 (예: 1000000)",
+        )
+        parser.add_argument("--page", type=int, default=5000)
+        parser.add_argument("--page-size", type=int, default=12)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--batch-size", type=int, default=10000)
+
+    def handle(self, *args, **options):
+        if options["seed"]:
+            self.seed(options["seed"], options["batch_size"])
+
+        page = options["page"]
+        page_size = options["page_size"]
+        total = Article.objects.count()
+        if total < page * page_size:
+            raise CommandError(
+                f"{page}페이지를 조회하려면 게시글이 최소 {page * page_size}개 필요합니다. (현재 {total}개)"
+            )
+
+        queryset = Article.objects.all().order_by("-created_at", "-id")
+        factory = APIRequestFactory()
+
+        # 깊은 페이지의 커서는 측정 전에 한 번만 계산 (클라이언트가 이전 응답에서 받은 값에 해당)
+        paginator = ArticlePagination()
+        anchor = queryset[(page - 1) * page_size - 1]
+        deep_cursor = paginator.encode_cursor(anchor, reverse=False)
+
+        cases = [
+            ("offset", 1, {"page": 1}),
+            ("offset", page, {"page": page}),
+            ("keyset", 1, {"cursor": ""}),
+            ("keyset", page, {"cursor": deep_cursor}),
+        ]
+        for mode, page_number, params in cases:
+            params["page_size"] = page_size
+            timings = []
+            for _ in range(options["repeat"]):
+                request = Request(factory.get("/api/article/", params))
+                paginator = (
+                    ArticlePageNumberPagination()
+                    if mode == "offset"
+                    else ArticlePagination()
+                )
+                started = time.perf_counter()
+                results = paginator.paginate_queryset(queryset, request)
+                timings.append((time.perf_counter() - started) * 1000)
+
+            timings.sort()
+            self.stdout.write(
+                f"{mode:<7} page={page_number:<6} rows={len(results):<3} "
+                f"median={timings[len(timings) // 2]:.2f}ms min={timings[0]:.2f}ms"
+            )
+
+    def seed(self, target, batch_size):
+        """벤치마크용 더미 게시글을 bulk_create로 생성 (시그널 미발생)"""
+        existing = Article.objects.count()
+        if existing >= target:
+            return
+
+        user, _ = User.objects.get_or_create(
+            username="benchmark_user",
+            defaults={"email": "benchmark@example.com", "nickname": "benchmark"},
+        )
+        remaining = target - existing
+        self.stdout.write(f"더미 게시글 {remaining}개 생성 중...")
+        while remaining > 0:
+            size = min(batch_size, remaining)
+            Article.objects.bulk_create(
+                [
+                    Article(user=user, title=f"benchmark {i}", content="benchmark")
+                    for i in range(size)
+                ],
+                batch_size=batch_size,
+            )
+            remaining -= size
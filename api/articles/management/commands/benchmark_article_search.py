@@ -0,0 +1,121 @@
+import random
+import time
+
+from articles.models import Article, ArticleNgram
+from articles.search.ngrams import NgramSearchBackend
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from users.models import User
+
+# 더미 게시글 생성용 주제 단어 (게시글마다 몇 개씩 포함)
+TOPIC_WORDS = (
+    "연애 훈수 직장 상사 동료 친구 가족 부모님 결혼 이별 고민 상담 조언 부탁 질문 "
+    "학교 시험 공부 취업 면접 이사 여행 운동 다이어트 음식 점심 저녁 주말 휴가 월급"
+).split()
+PARTICLES = ["", "은", "는", "이", "가", "을", "를", "에", "에서", "도", "와", "랑"]
+
+
+def build_vocabulary(rng, size=20000):
+    """임의의 한글 음절 2~3개로 이루어진 일반 단어 목록"""
+    return [
+        "".join(chr(rng.randint(0xAC00, 0xD7A3)) for _ in range(rng.randint(2, 3)))
+        for _ in range(size)
+    ]
+
+
+def random_text(rng, vocabulary, length, topics=3):
+    words = rng.sample(TOPIC_WORDS, topics) + rng.choices(vocabulary, k=length - topics)
+    rng.shuffle(words)
+    return " ".join(word + rng.choice(PARTICLES) for word in words)
+
+
+class Command(BaseCommand):
+    help = "게시글 검색: icontains 전체 스캔과 n-gram 역색인 조회 시간을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="게시글 수가 이 값보다 적으면 부족한 만큼 더미 게시글과 n-gram 색인을 생성 (예: 500000)",
+        )
+        parser.add_argument(
+            "--query",
+            action="append",
+            dest="queries",
+            help="검색어 (여러 번 지정 가능)",
+        )
+        parser.add_argument("--limit", type=int, default=12)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        if options["seed"]:
+            self.seed(options["seed"], options["batch_size"])
+
+        queries = options["queries"] or ["다이어트", "부모님 결혼", "월급날"]
+        limit = options["limit"]
+        backend = NgramSearchBackend()
+        self.stdout.write(
+            f"게시글 {Article.objects.count()}개, n-gram {ArticleNgram.objects.count()}행"
+        )
+
+        for query in queries:
+            cases = [
+                (
+                    "icontains",
+                    lambda: Article.objects.filter(
+                        Q(title__icontains=query) | Q(content__icontains=query)
+                    )
+                    .distinct()
+                    .order_by("-id"),
+                ),
+                ("ngram", lambda: backend.search(query)),
+            ]
+            for name, build in cases:
+                timings = []
+                for _ in range(options["repeat"]):
+                    started = time.perf_counter()
+                    results = list(build().values_list("id", flat=True)[:limit])
+                    timings.append((time.perf_counter() - started) * 1000)
+
+                timings.sort()
+                self.stdout.write(
+                    f"{name:<10} q={query!r:<14} rows={len(results):<3} "
+                    f"median={timings[len(timings) // 2]:.2f}ms min={timings[0]:.2f}ms"
+                )
+
+    def seed(self, target, batch_size):
+        """벤치마크용 더미 게시글과 n-gram 색인을 bulk_create로 생성 (시그널 미발생)"""
+        existing = Article.objects.count()
+        if existing >= target:
+            return
+
+        user, _ = User.objects.get_or_create(
+            username="benchmark_user",
+            defaults={"email": "benchmark@example.com", "nickname": "benchmark"},
+        )
+        backend = NgramSearchBackend()
+        rng = random.Random(existing)
+        vocabulary = build_vocabulary(rng)
+        remaining = target - existing
+        self.stdout.write(f"더미 게시글 {remaining}개 생성 중...")
+        while remaining > 0:
+            size = min(batch_size, remaining)
+            articles = Article.objects.bulk_create(
+                [
+                    Article(
+                        user=user,
+                        title=random_text(rng, vocabulary, 4, topics=1),
+                        content=random_text(rng, vocabulary, 30),
+                    )
+                    for _ in range(size)
+                ]
+            )
+            rows = []
+            for article in articles:
+                rows.extend(
+                    backend.build_rows(article.id, article.title, article.content)
+                )
+            ArticleNgram.objects.bulk_create(rows, batch_size=10000)
+            remaining -= size
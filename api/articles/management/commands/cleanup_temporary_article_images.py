@@ -0,0 +1,58 @@
+import time
+from datetime import timedelta
+
+from articles.images import delete_stale_temporary_images
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = (
+        "작성이 취소되어 게시글에 연결되지 않은 오래된 임시 이미지를 S3와 DB에서 삭제합니다. "
+        "(--interval 지정 시 주기적으로 반복)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-age-hours",
+            type=float,
+            default=settings.ARTICLE_TEMP_IMAGE_MAX_AGE_HOURS,
+            help="업로드 후 이 시간이 지난 임시 이미지를 삭제",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="삭제하지 않고 삭제 대상 수와 용량만 출력",
+        )
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=0,
+            help="반복 주기(초). 0이면 한 번만 실행",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            created_before = timezone.now() - timedelta(hours=options["max_age_hours"])
+            deleted, reclaimed = delete_stale_temporary_images(
+                created_before,
+                batch_size=options["batch_size"],
+                dry_run=options["dry_run"],
+            )
+
+            if options["dry_run"]:
+                self.stdout.write(
+                    f"(dry run) 삭제 대상 임시 이미지 {deleted}개, {reclaimed:,} bytes"
+                )
+            else:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"임시 이미지 {deleted}개 삭제, {reclaimed:,} bytes 회수"
+                    )
+                )
+
+            if not options["interval"]:
+                break
+            time.sleep(options["interval"])
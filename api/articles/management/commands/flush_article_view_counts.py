@@ -0,0 +1,26 @@
+import time
+
+from articles.counters import flush_view_counts
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Redis에 누적된 게시글 조회수를 DB에 일괄 반영합니다. (--interval 지정 시 주기적으로 반복)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=0,
+            help="반복 주기(초). 0이면 한 번만 실행",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        while True:
+            flushed = flush_view_counts(batch_size=options["batch_size"])
+            self.stdout.write(f"{flushed}개 게시글의 조회수를 반영했습니다.")
+
+            if not options["interval"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,27 @@
+from articles.image_variants import process_article_images
+from articles.models import ArticleImage
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "크기별 WebP 변환 이미지가 없는 게시글 이미지를 변환합니다. (기존 이미지 일괄 처리용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=None, help="처리할 게시글 수")
+
+    def handle(self, *args, **options):
+        article_ids = (
+            ArticleImage.objects.filter(
+                article__isnull=False, is_temporary=False, variants={}
+            )
+            .order_by("article_id")
+            .values_list("article_id", flat=True)
+            .distinct()
+        )
+        if options["limit"]:
+            article_ids = article_ids[: options["limit"]]
+
+        processed = 0
+        for article_id in article_ids:
+            processed += process_article_images(article_id)
+        self.stdout.write(self.style.SUCCESS(f"게시글 이미지 {processed}개 변환 완료"))
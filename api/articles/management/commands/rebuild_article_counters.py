@@ -0,0 +1,51 @@
+from articles.counters import flush_view_counts
+from articles.models import Article
+from comments.models import Comment
+from django.core.management.base import BaseCommand
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+class Command(BaseCommand):
+    help = "좋아요/댓글 원본 테이블로부터 게시글의 비정규화 카운터(like_count, comment_count)를 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10000,
+            help="UPDATE 한 번에 처리할 게시글 id 범위",
+        )
+
+    def handle(self, *args, **options):
+        # 누적된 조회수도 함께 반영
+        flush_view_counts()
+
+        like_count = (
+            Article.likes.through.objects.filter(article_id=OuterRef("pk"))
+            .values("article_id")
+            .annotate(count=Count("id"))
+            .values("count")
+        )
+        comment_count = (
+            Comment.objects.filter(article_id=OuterRef("pk"))
+            .values("article_id")
+            .annotate(count=Count("id"))
+            .values("count")
+        )
+
+        batch_size = options["batch_size"]
+        last_id = Article.objects.order_by("-id").values_list("id", flat=True).first()
+        updated = 0
+        # 긴 잠금을 피하기 위해 id 범위 단위로 나누어 갱신
+        for start in range(0, (last_id or 0) + 1, batch_size):
+            updated += Article.objects.filter(
+                id__gte=start, id__lt=start + batch_size
+            ).update(
+                like_count=Coalesce(Subquery(like_count), 0),
+                comment_count=Coalesce(Subquery(comment_count), 0),
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{updated}개 게시글의 카운터를 다시 계산했습니다.")
+        )
@@ -0,0 +1,16 @@
+from articles.search import get_search_backend
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "현재 검색 백엔드의 게시글 검색 색인을 전체 게시글 기준으로 다시 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        count = backend.rebuild(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(f"{type(backend).__name__}: 게시글 {count}개 색인 완료")
+        )
@@ -0,0 +1,44 @@
+from articles.models import Article
+from articles.serializers import ArticleListSerializer
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        "게시글 목록 페이지 단위로 원본 대신 WebP 썸네일을 응답할 때 줄어드는 "
+        "이미지 전송량을 집계합니다. (DB에 저장된 파일 크기 기준)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--page-size", type=int, default=12)
+        parser.add_argument("--pages", type=int, default=10)
+
+    def handle(self, *args, **options):
+        page_size = options["page_size"]
+        queryset = ArticleListSerializer.setup_eager_loading(
+            Article.objects.order_by("-created_at", "-id")
+        )[: page_size * options["pages"]]
+        articles = list(queryset)
+
+        width = settings.ARTICLE_IMAGE_THUMBNAIL_WIDTH
+        for start in range(0, len(articles), page_size):
+            original = thumbnail = missing = 0
+            for article in articles[start : start + page_size]:
+                image = ArticleListSerializer.get_thumbnail(article)
+                if image is None:
+                    continue
+                variant = image.variants.get(str(width))
+                if variant is None or image.size is None:
+                    missing += 1
+                    continue
+                original += image.size
+                thumbnail += variant["size"]
+
+            saved = original - thumbnail
+            ratio = saved / original * 100 if original else 0
+            self.stdout.write(
+                f"page {start // page_size + 1}: 원본 {original:,} bytes -> "
+                f"썸네일 {thumbnail:,} bytes ({saved:,} bytes, {ratio:.1f}% 절감, "
+                f"미변환 {missing}개)"
+            )
@@ -0,0 +1,49 @@
+# Generated by Django 5.1 on 2026-10-18 16:01
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    Article = apps.get_model('articles', 'Article')
+    Comment = apps.get_model('comments', 'Comment')
+
+    like_count = (
+        Article.likes.through.objects.filter(article_id=OuterRef('pk'))
+        .values('article_id')
+        .annotate(count=Count('id'))
+        .values('count')
+    )
+    comment_count = (
+        Comment.objects.filter(article_id=OuterRef('pk'))
+        .values('article_id')
+        .annotate(count=Count('id'))
+        .values('count')
+    )
+    Article.objects.update(
+        like_count=Coalesce(Subquery(like_count), 0),
+        comment_count=Coalesce(Subquery(comment_count), 0),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0009_article_article_created_id_idx'),
+        ('comments', '0005_comment_comment_article_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='comment_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='like_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
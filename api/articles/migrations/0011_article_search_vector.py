@@ -0,0 +1,38 @@
+# Generated by Django 5.1 on 2026-10-18 16:07
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+
+def populate_search_vector(apps, schema_editor):
+    # 기존 게시글의 검색 색인 생성 (제목 A, 본문 B 가중치)
+    Article = apps.get_model('articles', 'Article')
+    Article.objects.update(
+        search_vector=SearchVector('title', weight='A', config='simple')
+        + SearchVector('content', weight='B', config='simple')
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0010_article_like_count_comment_count'),
+        ('tags', '0005_alter_tag_tag_id'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='article_search_vector_idx'),
+        ),
+        migrations.RunPython(populate_search_vector, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.1 on 2026-10-18 16:09
+
+import django.db.models.deletion
+from articles.search.ngrams import ngram_weights
+from django.db import migrations, models
+
+
+def populate_ngrams(apps, schema_editor):
+    # 기존 게시글의 n-gram 색인 생성
+    Article = apps.get_model('articles', 'Article')
+    ArticleNgram = apps.get_model('articles', 'ArticleNgram')
+    rows = []
+    for article_id, title, content in Article.objects.values_list('id', 'title', 'content').iterator():
+        rows.extend(
+            ArticleNgram(article_id=article_id, gram=gram, weight=weight)
+            for gram, weight in ngram_weights(title, content).items()
+        )
+        if len(rows) >= 5000:
+            ArticleNgram.objects.bulk_create(rows)
+            rows = []
+    ArticleNgram.objects.bulk_create(rows)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0011_article_search_vector'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleNgram',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('gram', models.CharField(max_length=2)),
+                ('weight', models.IntegerField(default=0)),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ngrams', to='articles.article')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('gram', 'article'), name='article_ngram_gram_article_uniq')],
+            },
+        ),
+        migrations.RunPython(populate_ngrams, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1 on 2026-10-18 16:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0012_articlengram'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='articleimage',
+            name='is_uploaded',
+            field=models.BooleanField(default=True),
+        ),
+    ]
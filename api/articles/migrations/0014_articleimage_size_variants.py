@@ -0,0 +1,23 @@
+# Generated by Django 5.1 on 2026-10-18 16:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0013_articleimage_is_uploaded'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='articleimage',
+            name='size',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='articleimage',
+            name='variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
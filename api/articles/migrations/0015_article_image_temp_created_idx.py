@@ -0,0 +1,17 @@
+# Generated by Django 5.1 on 2026-10-18 16:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0014_articleimage_size_variants'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='articleimage',
+            index=models.Index(fields=['is_temporary', 'created_at'], name='article_image_temp_created_idx'),
+        ),
+    ]
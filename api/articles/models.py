@@ -1,5 +1,7 @@
 from common.models import TimeStampModel
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from tags.models import Tag
 from users.models import User
@@ -11,17 +13,24 @@ class Article(TimeStampModel):
     content = models.TextField(null=False)
     is_closed = models.BooleanField(default=False)
     view_count = models.IntegerField(default=0)
+    # 좋아요/댓글 수 비정규화 컬럼 (목록 조회 시 COUNT 쿼리 방지)
+    like_count = models.IntegerField(default=0)
+    comment_count = models.IntegerField(default=0)
     likes = models.ManyToManyField(User, related_name="liked_articles", blank=True)
     tags = models.ManyToManyField(Tag, blank=True)
+    # 전문 검색용 tsvector (게시글 저장 시 검색 백엔드가 갱신)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            # 키셋 페이지네이션 (created_at, id) 정렬용 인덱스
+            models.Index(fields=["-created_at", "-id"], name="article_created_id_idx"),
+            GinIndex(fields=["search_vector"], name="article_search_vector_idx"),
+        ]
 
     def __str__(self):
         return self.title
 
-    # 좋아요 집계 동적 실시간 반영
-    @property
-    def like_count(self):
-        return self.likes.count()
-
 
 class ArticleImage(TimeStampModel):
     article = models.ForeignKey(
@@ -29,7 +38,30 @@ class ArticleImage(TimeStampModel):
     )
     image = models.URLField(max_length=500, null=False)  # S3 URL을 직접 저장
     is_thumbnail = models.BooleanField(default=False)
-    is_temporary = models.BooleanField(default=True) 
+    is_temporary = models.BooleanField(default=True)
+    # presigned URL로 직접 업로드하는 경우 업로드 확인 전까지 False
+    is_uploaded = models.BooleanField(default=True)
+    # presigned URL을 발급받은 사용자 (본인만 업로드 완료를 확인할 수 있음)
+    uploader = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="uploaded_article_images",
+    )
+    # 원본 파일 크기(bytes)와 크기별 WebP 변환 이미지
+    # {"320": {"url": ..., "width": ..., "height": ..., "size": ...}, ...}
+    size = models.PositiveIntegerField(null=True, blank=True)
+    variants = models.JSONField(default=dict, blank=True)
+
+    class Meta:
+        indexes = [
+            # 오래된 임시 이미지 정리(cleanup_temporary_article_images)용 인덱스
+            models.Index(
+                fields=["is_temporary", "created_at"],
+                name="article_image_temp_created_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.article.title} - {self.id}"
@@ -37,3 +69,33 @@ class ArticleImage(TimeStampModel):
     @property
     def image_url(self):
         return self.image if self.image else None  # 이미지를 반환할 때는 S3 URL 반환
+
+
+# 게시글 검색용 n-gram 역색인 (n-gram -> 게시글)
+class ArticleNgram(models.Model):
+    article = models.ForeignKey(
+        Article, on_delete=models.CASCADE, related_name="ngrams"
+    )
+    gram = models.CharField(max_length=2)
+    # 제목 등장 횟수 x 10 + 본문 등장 횟수 (검색 결과 정렬 점수)
+    weight = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            # n-gram으로 게시글을 찾는 조회와 중복 방지를 함께 처리
+            models.UniqueConstraint(
+                fields=["gram", "article"], name="article_ngram_gram_article_uniq"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.gram} - {self.article_id}"
+
+
+# DB에 반영한 조회수 스냅샷 (조회수 UPDATE와 같은 트랜잭션에서 기록해 같은 스냅샷을 두 번 반영하지 않음)
+class ArticleViewCountFlush(models.Model):
+    snapshot_id = models.CharField(max_length=32, unique=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.snapshot_id
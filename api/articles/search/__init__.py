@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from .backends import (
+    BaseSearchBackend,
+    InMemorySearchBackend,
+    PostgresSearchBackend,
+    tokenize,
+)
+from .ngrams import NgramSearchBackend
+
+DEFAULT_BACKEND = "articles.search.ngrams.NgramSearchBackend"
+
+# 백엔드 경로별 인스턴스 (InMemorySearchBackend는 색인을 인스턴스에 보관)
+_backends = {}
+
+
+def get_search_backend():
+    """
+    settings.ARTICLE_SEARCH_BACKEND에 지정된 검색 백엔드를 반환합니다.
+    지정하지 않으면 n-gram 역색인 백엔드를 사용합니다.
+    """
+    path = getattr(settings, "ARTICLE_SEARCH_BACKEND", None) or DEFAULT_BACKEND
+
+    backend = _backends.get(path)
+    if backend is None:
+        backend = _backends[path] = import_string(path)()
+    return backend
@@ -0,0 +1,206 @@
+import re
+import threading
+from collections import defaultdict
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import Case, F, IntegerField, Value, When
+from django.db.models.functions import Cast
+
+from ..models import Article
+
+# 한글/영문/숫자 단위로 분리 (밑줄은 PostgreSQL 파서와 같이 구분자로 취급)
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+# 정렬용 점수는 정수로 저장 (커서에 실수를 넣으면 동률 비교가 어긋날 수 있음)
+RANK_SCALE = 1000000
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall((text or "").lower())
+
+
+class BaseSearchBackend:
+    """
+    게시글 검색 백엔드 인터페이스.
+    search()는 rank(정수, 클수록 관련도 높음)가 annotate된 게시글 QuerySet을 반환합니다.
+    """
+
+    def search(self, query, tag_id=None):
+        raise NotImplementedError
+
+    def index_article(self, article):
+        """게시글 저장 시 검색 색인을 갱신합니다."""
+
+    def remove_article(self, article_id):
+        """게시글 삭제 시 검색 색인에서 제거합니다."""
+
+    def rebuild(self, batch_size=1000):
+        """전체 게시글의 검색 색인을 다시 만들고, 색인한 게시글 수를 반환합니다."""
+
+    def filter_tag(self, queryset, tag_id):
+        if tag_id is not None:
+            queryset = queryset.filter(tags__tag_id=tag_id)
+        return queryset
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """
+    Article.search_vector(tsvector, GIN 인덱스) 기반 검색.
+    한국어 형태소 분석 사전이 없으므로 'simple' 설정으로 어절 단위 색인 후,
+    검색어는 접두어(:*)로 매칭하여 조사가 붙은 어절("훈수는")도 찾도록 합니다.
+    """
+
+    config = "simple"
+
+    @classmethod
+    def search_vector(cls):
+        # 제목(A)이 본문(B)보다 높은 가중치
+        return SearchVector("title", weight="A", config=cls.config) + SearchVector(
+            "content", weight="B", config=cls.config
+        )
+
+    def build_query(self, query):
+        terms = tokenize(query)
+        if not terms:
+            return None
+        raw = " & ".join(f"'{term}':*" for term in terms)
+        return SearchQuery(raw, search_type="raw", config=self.config)
+
+    def search(self, query, tag_id=None):
+        search_query = self.build_query(query)
+        if search_query is None:
+            return Article.objects.none()
+
+        queryset = (
+            Article.objects.filter(search_vector=search_query)
+            .annotate(
+                rank=Cast(
+                    SearchRank(F("search_vector"), search_query) * RANK_SCALE,
+                    IntegerField(),
+                )
+            )
+            .order_by("-rank", "-id")
+        )
+        return self.filter_tag(queryset, tag_id)
+
+    def index_article(self, article):
+        Article.objects.filter(id=article.id).update(search_vector=self.search_vector())
+
+    def rebuild(self, batch_size=1000):
+        return Article.objects.update(search_vector=self.search_vector())
+
+
+class InMemorySearchBackend(BaseSearchBackend):
+    """
+    프로세스 내부 역색인 기반 검색 (PostgreSQL 전문 검색을 쓸 수 없는 환경/테스트용).
+    첫 검색 시 DB에서 색인을 만들고, 이후에는 게시글 저장/삭제 시그널로 갱신합니다.
+    """
+
+    title_weight = 10
+    content_weight = 1
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaded = False
+        # 토큰 -> {게시글 id: 가중치 합}
+        self._index = defaultdict(dict)
+        # 게시글 id -> 색인된 토큰 목록 (갱신 시 기존 토큰 제거용)
+        self._documents = {}
+
+    def _add(self, article_id, title, content):
+        weights = defaultdict(int)
+        for token in tokenize(title):
+            weights[token] += self.title_weight
+        for token in tokenize(content):
+            weights[token] += self.content_weight
+        for token, weight in weights.items():
+            self._index[token][article_id] = weight
+        self._documents[article_id] = list(weights)
+
+    def _remove(self, article_id):
+        for token in self._documents.pop(article_id, []):
+            postings = self._index.get(token)
+            if postings is not None:
+                postings.pop(article_id, None)
+                if not postings:
+                    del self._index[token]
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            for article_id, title, content in Article.objects.values_list(
+                "id", "title", "content"
+            ).iterator():
+                self._add(article_id, title, content)
+            self._loaded = True
+
+    def scores(self, query):
+        """검색어의 모든 토큰을 접두어로 포함하는 게시글의 {id: 점수}를 반환합니다."""
+        terms = tokenize(query)
+        if not terms:
+            return {}
+        self._ensure_loaded()
+
+        with self._lock:
+            result = None
+            for term in terms:
+                matched = defaultdict(int)
+                for token, postings in self._index.items():
+                    if token.startswith(term):
+                        for article_id, weight in postings.items():
+                            matched[article_id] += weight
+                if result is None:
+                    result = matched
+                else:
+                    result = {
+                        article_id: score + matched[article_id]
+                        for article_id, score in result.items()
+                        if article_id in matched
+                    }
+                if not result:
+                    return {}
+            return dict(result)
+
+    def search(self, query, tag_id=None):
+        scores = self.scores(query)
+        if not scores:
+            return Article.objects.none()
+
+        queryset = (
+            Article.objects.filter(id__in=scores)
+            .annotate(
+                rank=Case(
+                    *[
+                        When(id=article_id, then=Value(score))
+                        for article_id, score in scores.items()
+                    ],
+                    default=Value(0),
+                    output_field=IntegerField(),
+                )
+            )
+            .order_by("-rank", "-id")
+        )
+        return self.filter_tag(queryset, tag_id)
+
+    def index_article(self, article):
+        if not self._loaded:
+            return
+        with self._lock:
+            self._remove(article.id)
+            self._add(article.id, article.title, article.content)
+
+    def remove_article(self, article_id):
+        if not self._loaded:
+            return
+        with self._lock:
+            self._remove(article_id)
+
+    def rebuild(self, batch_size=1000):
+        with self._lock:
+            self._index.clear()
+            self._documents.clear()
+            self._loaded = False
+        self._ensure_loaded()
+        return len(self._documents)
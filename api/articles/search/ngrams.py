@@ -0,0 +1,125 @@
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import (
+    Case,
+    Count,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+
+from ..models import Article, ArticleNgram
+from .backends import BaseSearchBackend, tokenize
+
+# n-gram 길이 (한국어는 2글자 단위가 검색 품질/색인 크기 균형이 가장 좋음)
+NGRAM_SIZE = 2
+TITLE_WEIGHT = 10
+CONTENT_WEIGHT = 1
+
+
+def ngrams(token, size=NGRAM_SIZE):
+    """토큰을 size 글자 단위 n-gram으로 나눕니다. size보다 짧은 토큰은 색인하지 않습니다."""
+    return [token[i : i + size] for i in range(len(token) - size + 1)]
+
+
+def query_ngrams(terms, size=NGRAM_SIZE):
+    return {gram for term in terms for gram in ngrams(term, size)}
+
+
+def ngram_weights(title, content, size=NGRAM_SIZE):
+    """게시글의 {n-gram: 가중치} 를 반환합니다. (제목 등장 횟수 x 10 + 본문 등장 횟수)"""
+    weights = defaultdict(int)
+    for text, weight in ((title, TITLE_WEIGHT), (content, CONTENT_WEIGHT)):
+        for token in tokenize(text):
+            for gram in ngrams(token, size):
+                weights[gram] += weight
+    return weights
+
+
+class NgramSearchBackend(BaseSearchBackend):
+    """
+    ArticleNgram 테이블(2-gram 역색인) 기반 검색.
+    검색어의 모든 n-gram을 가진 게시글만 후보로 가져온 뒤 원문 포함 여부를 확인하므로,
+    조회 비용이 전체 게시글 수가 아니라 n-gram의 게시글 목록 길이에 비례합니다.
+    PostgreSQL 확장이나 형태소 분석기 없이 한국어 부분 문자열 검색이 가능합니다.
+    """
+
+    def search(self, query, tag_id=None):
+        terms = tokenize(query)
+        if not terms:
+            return Article.objects.none()
+        grams = query_ngrams(terms)
+        if not grams:
+            # 1글자 검색어는 n-gram을 만들 수 없으므로 제목/본문에서 직접 찾음
+            return self.filter_tag(self.search_short_terms(terms), tag_id)
+
+        # 모든 n-gram을 포함하는 게시글과 가중치 합계
+        matches = (
+            ArticleNgram.objects.filter(gram__in=grams)
+            .values("article_id")
+            .annotate(matched=Count("id"), score=Sum("weight"))
+            .filter(matched=len(grams))
+        )
+        queryset = Article.objects.filter(id__in=matches.values("article_id")).annotate(
+            rank=Subquery(
+                matches.filter(article_id=OuterRef("pk")).values("score")[:1],
+                output_field=IntegerField(),
+            )
+        )
+        # n-gram이 흩어져 있는 경우를 걸러내기 위해 후보 게시글에서만 원문 확인
+        for term in terms:
+            queryset = queryset.filter(
+                Q(title__icontains=term) | Q(content__icontains=term)
+            )
+        return self.filter_tag(queryset.order_by("-rank", "-id"), tag_id)
+
+    def search_short_terms(self, terms):
+        """
+        n-gram보다 짧은 검색어만 있을 때 제목/본문 부분 문자열로 검색합니다. (색인 도입 전 검색과 같음)
+        1글자 단어나 단어 끝 글자는 색인에 n-gram의 앞 글자로 남지 않으므로 색인으로는 찾을 수 없습니다.
+        """
+        queryset = Article.objects.all()
+        rank = Value(0)
+        for term in terms:
+            queryset = queryset.filter(
+                Q(title__icontains=term) | Q(content__icontains=term)
+            )
+            rank += Case(
+                When(title__icontains=term, then=Value(TITLE_WEIGHT)),
+                default=Value(CONTENT_WEIGHT),
+                output_field=IntegerField(),
+            )
+        return queryset.annotate(rank=rank).order_by("-rank", "-id")
+
+    def build_rows(self, article_id, title, content):
+        return [
+            ArticleNgram(article_id=article_id, gram=gram, weight=weight)
+            for gram, weight in ngram_weights(title, content).items()
+        ]
+
+    def index_article(self, article):
+        with transaction.atomic():
+            ArticleNgram.objects.filter(article_id=article.id).delete()
+            ArticleNgram.objects.bulk_create(
+                self.build_rows(article.id, article.title, article.content)
+            )
+
+    def rebuild(self, batch_size=1000):
+        count = 0
+        with transaction.atomic():
+            ArticleNgram.objects.all().delete()
+            rows = []
+            articles = Article.objects.values_list("id", "title", "content")
+            for article_id, title, content in articles.iterator(chunk_size=batch_size):
+                rows.extend(self.build_rows(article_id, title, content))
+                count += 1
+                if count % batch_size == 0:
+                    ArticleNgram.objects.bulk_create(rows, batch_size=5000)
+                    rows = []
+            ArticleNgram.objects.bulk_create(rows, batch_size=5000)
+        return count
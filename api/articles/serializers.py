@@ -1,10 +1,12 @@
-from articles.s3instance import S3Instance
 from comments.serializers import CommentArticleListSerializer, CommentListSerializer
 from django.core.files.storage import default_storage
+from django.db.models import Exists, OuterRef, Prefetch, Value
 from rest_framework import serializers
 from tags.models import Tag
 from tags.serializers import TagSerializer
 
+from .image_variants import get_thumbnail_url
+from .images import move_temp_images_to_article
 from .models import Article, ArticleImage
 
 
@@ -53,12 +55,13 @@ class ArticleSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
+        read_only_fields = ["view_count", "like_count"]
 
     def get_user(self, obj):
         return {"user_id": obj.user.id, "nickname": obj.user.nickname}
 
     def get_comments_count(self, obj):
-        return obj.comments.count()
+        return obj.comment_count
 
     def create(self, validated_data):
         tag_id = validated_data.pop("tag_id")
@@ -68,8 +71,7 @@ class ArticleSerializer(serializers.ModelSerializer):
 
         # 임시 이미지들을 게시글에 연결하고 경로 변경
         if temp_image_ids:
-            s3instance = S3Instance().get_s3_instance()
-            S3Instance.move_temp_images_to_article(s3instance, temp_image_ids, article)
+            move_temp_images_to_article(temp_image_ids, article)
 
             # 첫 번째 임시 이미지를 썸네일로 설정
             first_image = (
@@ -95,8 +97,7 @@ class ArticleSerializer(serializers.ModelSerializer):
 
         # 임시 이미지들을 게시글에 연결하고 경로 변경
         if temp_image_ids:
-            s3instance = S3Instance().get_s3_instance()
-            S3Instance.move_temp_images_to_article(s3instance, temp_image_ids, instance)
+            move_temp_images_to_article(temp_image_ids, instance)
 
             # 기존 썸네일이 있으면 초기화
             instance.images.update(is_thumbnail=False)
@@ -146,6 +147,27 @@ class ArticleListSerializer(serializers.ModelSerializer):
             "thumbnail_image",
         ]
 
+    @staticmethod
+    def setup_eager_loading(queryset, user=None):
+        """
+        목록 직렬화에 필요한 데이터를 게시글 수와 상관없이 고정된 쿼리 수로 가져옵니다.
+        (게시글+작성자+프로필+좋아요 여부 1회, 이미지 1회, 태그 1회)
+        """
+        queryset = (
+            queryset.select_related("user__profile")
+            .prefetch_related(
+                "tags",
+                Prefetch("images", queryset=ArticleImage.objects.order_by("id")),
+            )
+            .defer("search_vector")
+        )
+        if user is not None and user.is_authenticated:
+            liked = Article.likes.through.objects.filter(
+                article_id=OuterRef("pk"), user_id=user.id
+            )
+            return queryset.annotate(is_liked=Exists(liked))
+        return queryset.annotate(is_liked=Value(False))
+
     def get_user(self, obj):
         user = obj.user
         profile = user.profile
@@ -156,19 +178,30 @@ class ArticleListSerializer(serializers.ModelSerializer):
             "hunsoo_level": profile.hunsoo_level,
         }
 
-    def get_thumbnail_image(self, obj):
+    @staticmethod
+    def get_thumbnail(obj):
         # 썸네일 이미지가 있으면 가져오고, 없으면 첫 번째 이미지를 가져옴
-        thumbnail_image = obj.images.filter(is_thumbnail=True).first()
-        if not thumbnail_image:
-            thumbnail_image = obj.images.first()
-        return thumbnail_image.image_url if thumbnail_image else None
+        # (prefetch된 이미지 목록에서 찾으므로 추가 쿼리가 발생하지 않음)
+        images = list(obj.images.all())
+        return next(
+            (image for image in images if image.is_thumbnail),
+            images[0] if images else None,
+        )
+
+    def get_thumbnail_image(self, obj):
+        thumbnail_image = self.get_thumbnail(obj)
+        # 변환된 작은 WebP 이미지가 있으면 원본 대신 사용
+        return get_thumbnail_url(thumbnail_image) if thumbnail_image else None
 
     def get_comments_count(self, obj):
-        return obj.comments.count()  # 댓글 수 반환
+        return obj.comment_count  # 댓글 수 반환 (비정규화 컬럼)
 
     def get_like(self, obj):
         request = self.context.get("request")
         if request and request.user and request.user.is_authenticated:
+            # setup_eager_loading에서 annotate한 값이 있으면 그대로 사용
+            if hasattr(obj, "is_liked"):
+                return obj.is_liked
             # 사용자가 해당 게시글의 좋아요를 눌렀는지 확인
             return obj.likes.filter(id=request.user.id).exists()
         return False
@@ -193,7 +226,7 @@ class ArticleDetailSerializer(serializers.ModelSerializer):
     comments = CommentArticleListSerializer(
         many=True, read_only=True
     )  # 댓글 목록을 포함
-    comments_count = serializers.IntegerField(source="comments.count", read_only=True)
+    comments_count = serializers.IntegerField(source="comment_count", read_only=True)
     # 댓글 수
     status = serializers.SerializerMethodField()  # 로그인여부
 
@@ -233,7 +266,8 @@ class ArticleDetailSerializer(serializers.ModelSerializer):
         thumbnail_image = obj.images.filter(is_thumbnail=True).first()
         if not thumbnail_image:
             thumbnail_image = obj.images.first()
-        return thumbnail_image.image_url if thumbnail_image else None
+        # 변환된 작은 WebP 이미지가 있으면 원본 대신 사용
+        return get_thumbnail_url(thumbnail_image) if thumbnail_image else None
 
     def get_status(self, obj):
         request = self.context.get("request")
@@ -1,9 +1,11 @@
 from ai_hunsoos.models import AiHunsoo
-from django.core.cache import cache
-from django.db.models.signals import post_delete, post_save
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
+from .cache import ARTICLE_LIST_FIELDS, invalidate_article_lists
 from .models import Article
+from .search import get_search_backend
 
 
 @receiver(post_save, sender=Article)
@@ -13,13 +15,37 @@ def create_initial_ai_hunsoo(sender, instance, created, **kwargs):
         AiHunsoo.objects.create(article=instance, content=None, status=False)
 
 
+# 게시글 작성, 수정시 검색 색인 갱신 (목록 캐시 무효화보다 먼저 실행)
+@receiver(post_save, sender=Article)
+def update_search_index(sender, instance, update_fields=None, **kwargs):
+    # 제목/본문이 바뀌지 않는 부분 저장은 색인을 갱신하지 않음
+    if update_fields is not None and not {"title", "content"} & set(update_fields):
+        return
+    get_search_backend().index_article(instance)
+
+
+# 게시글 삭제시 검색 색인에서 제거
+@receiver(post_delete, sender=Article)
+def remove_search_index(sender, instance, **kwargs):
+    get_search_backend().remove_article(instance.id)
+
+
 # 게시글 생성, 수정, 삭제시 캐시 무효화
 @receiver([post_save, post_delete], sender=Article)
-def article_changed_handler(sender, instance, **kwargs):
+def article_changed_handler(sender, instance, update_fields=None, **kwargs):
     """
     게시글 생성, 수정, 삭제 시 캐시 무효화.
+    목록 캐시 네임스페이스 버전을 올려 모든 페이지/페이지 크기/태그/검색 캐시를 한 번에 무효화합니다.
+    커밋 전에 무효화하면 다른 요청이 이전 데이터로 캐시를 다시 채울 수 있으므로 커밋 후에 실행합니다.
     """
-    # 여러 페이지에 대해 캐시 키를 삭제
-    for page_num in range(1, 100):  # 페이지 수에 따라 적절한 범위 지정
-        cache_key = f"article_list_page_{page_num}"
-        cache.delete(cache_key)
+    # 목록에 보이는 필드가 바뀌지 않는 부분 저장은 무효화하지 않음
+    if update_fields is not None and not ARTICLE_LIST_FIELDS & set(update_fields):
+        return
+    transaction.on_commit(invalidate_article_lists)
+
+
+# 게시글 태그 변경시 캐시 무효화 (게시글 작성 시 태그는 저장 이후에 추가됨)
+@receiver(m2m_changed, sender=Article.tags.through)
+def article_tags_changed_handler(sender, instance, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        transaction.on_commit(invalidate_article_lists)
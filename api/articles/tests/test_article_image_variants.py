@@ -0,0 +1,120 @@
+import io
+from io import StringIO
+
+from articles import images as article_images
+from articles.image_variants import build_variants, process_article_images
+from articles.models import Article, ArticleImage
+from articles.serializers import ArticleListSerializer
+from common import storage
+from common.testing import use_fake_s3
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from PIL import Image
+from users.models import User
+
+
+def make_png(width, height, exif=True):
+    image = Image.new("RGB", (width, height), (200, 80, 40))
+    buffer = io.BytesIO()
+    if exif:
+        metadata = Image.Exif()
+        metadata[0x010F] = "TestCamera"  # Make
+        image.save(buffer, "PNG", exif=metadata)
+    else:
+        image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+@override_settings(ARTICLE_IMAGE_VARIANT_WIDTHS=(320, 640, 1280))
+class ArticleImageVariantTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="variant",
+            email="variant@example.com",
+            password="testpassword",
+            nickname="Variant",
+        )
+        self.article = Article.objects.create(
+            user=self.user, title="이미지 게시글", content="본문"
+        )
+
+    def create_image(self, key, data):
+        self.s3_client.objects[key] = data
+        return ArticleImage.objects.create(
+            article=self.article, image=storage.get_url(key), is_temporary=False
+        )
+
+    def test_build_variants_resizes_and_strips_metadata(self):
+        variants = build_variants(make_png(2000, 1000))
+
+        self.assertEqual(
+            {width: size[:2] for width, size in variants.items()},
+            {320: (320, 160), 640: (640, 320), 1280: (1280, 640)},
+        )
+        with Image.open(io.BytesIO(variants[320][2])) as image:
+            self.assertEqual(image.format, "WEBP")
+            self.assertNotIn("exif", image.info)
+
+    def test_small_image_is_not_upscaled(self):
+        variants = build_variants(make_png(200, 100))
+
+        self.assertEqual({size[:2] for size in variants.values()}, {(200, 100)})
+
+    def test_process_article_images(self):
+        self.s3_client = use_fake_s3(self)
+        original = make_png(1600, 1200)
+        image = self.create_image(f"articles/{self.article.id}/abc.png", original)
+
+        self.assertEqual(process_article_images(self.article.id), 1)
+
+        image.refresh_from_db()
+        self.assertEqual(image.size, len(original))
+        self.assertEqual(set(image.variants), {"320", "640", "1280"})
+        thumbnail = image.variants["320"]
+        self.assertEqual(
+            thumbnail["url"],
+            storage.get_url(f"articles/{self.article.id}/abc_320.webp"),
+        )
+        self.assertLess(thumbnail["size"], len(original))
+        self.assertIn(
+            f"articles/{self.article.id}/abc_1280.webp", self.s3_client.objects
+        )
+
+        # 이미 변환된 이미지는 다시 처리하지 않음
+        self.assertEqual(process_article_images(self.article.id), 0)
+
+        # 목록 썸네일은 작은 WebP 이미지 사용
+        article = ArticleListSerializer.setup_eager_loading(
+            Article.objects.filter(id=self.article.id)
+        ).get()
+        self.assertEqual(
+            ArticleListSerializer(article).data["thumbnail_image"], thumbnail["url"]
+        )
+
+    @override_settings(ARTICLE_IMAGE_VARIANTS_EAGER=True, STORAGE_OUTBOX_EAGER=True)
+    def test_moving_temp_images_generates_variants_after_commit(self):
+        self.s3_client = use_fake_s3(self, copy_delay=0)
+        self.s3_client.objects["temporary/new.png"] = make_png(800, 600)
+        image = ArticleImage.objects.create(image=storage.get_url("temporary/new.png"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            article_images.move_temp_images_to_article([image.id], self.article)
+
+        image.refresh_from_db()
+        self.assertEqual(image.variants["1280"]["width"], 800)
+
+        # 게시글 이미지 삭제 시 변환 이미지도 함께 삭제
+        with self.captureOnCommitCallbacks(execute=True):
+            article_images.delete_images([image.id])
+        self.assertEqual(self.s3_client.objects, {})
+
+    def test_report_thumbnail_savings(self):
+        self.s3_client = use_fake_s3(self)
+        self.create_image(f"articles/{self.article.id}/abc.png", make_png(1600, 1200))
+        process_article_images(self.article.id)
+
+        out = StringIO()
+        call_command("report_article_thumbnail_savings", stdout=out)
+
+        self.assertIn("page 1", out.getvalue())
+        self.assertIn("미변환 0개", out.getvalue())
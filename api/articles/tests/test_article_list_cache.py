@@ -0,0 +1,112 @@
+from articles.cache import article_list_cache_key
+from articles.models import Article
+from common import metrics
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from users.models import User
+
+
+class ArticleListCacheTests(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.first_user = User.objects.create_user(
+            username="first",
+            email="first@example.com",
+            password="testpassword",
+            nickname="first",
+        )
+        self.second_user = User.objects.create_user(
+            username="second",
+            email="second@example.com",
+            password="testpassword",
+            nickname="second",
+        )
+        self.liked_article = Article.objects.create(
+            user=self.first_user, title="Liked", content="Liked"
+        )
+        self.other_article = Article.objects.create(
+            user=self.first_user, title="Other", content="Other"
+        )
+        self.liked_article.likes.add(self.first_user)
+        self.list_url = reverse("article-list")
+
+    def get_likes(self, user=None):
+        self.client.force_authenticate(user=user)
+        response = self.client.get(self.list_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {
+            article["title"]: (article["like"], article["status"])
+            for article in response.data
+        }
+
+    def test_cached_page_is_overlaid_per_viewer(self):
+        # 첫 번째 사용자가 캐시를 채움
+        self.assertEqual(
+            self.get_likes(self.first_user),
+            {"Liked": (True, True), "Other": (False, True)},
+        )
+
+        # 같은 캐시를 읽더라도 다른 사용자에게는 자신의 좋아요 여부가 보여야 함
+        self.assertEqual(
+            self.get_likes(self.second_user),
+            {"Liked": (False, True), "Other": (False, True)},
+        )
+        self.assertEqual(
+            self.get_likes(None),
+            {"Liked": (False, False), "Other": (False, False)},
+        )
+
+    def test_cached_page_stores_viewer_independent_data(self):
+        self.get_likes(self.first_user)
+
+        cached_data = cache.get(article_list_cache_key("page", 1, 12))
+        self.assertIsNotNone(cached_data)
+        self.assertTrue(all(not article["like"] for article in cached_data))
+        self.assertTrue(all(not article["status"] for article in cached_data))
+
+    def test_article_change_invalidates_every_list_variant(self):
+        urls = [
+            (self.list_url, {}),
+            (self.list_url, {"page_size": 2}),
+            (reverse("article_search"), {"q": "Liked"}),
+        ]
+        for url, params in urls:
+            self.client.get(url, params)
+
+        hits_before = metrics.get_counter("cache.article_list.hit")
+        bumps_before = metrics.get_counter("cache.article_list.bump")
+
+        # 게시글 수정 시 커밋된 뒤 네임스페이스 버전 한 번만 올라감
+        with self.captureOnCommitCallbacks(execute=True):
+            self.liked_article.title = "Liked Updated"
+            self.liked_article.save()
+            self.assertEqual(
+                metrics.get_counter("cache.article_list.bump"), bumps_before
+            )
+        self.assertEqual(
+            metrics.get_counter("cache.article_list.bump"), bumps_before + 1
+        )
+
+        # 모든 변형(페이지 크기, 검색)에서 수정된 제목을 반환해야 함
+        for url, params in urls:
+            response = self.client.get(url, params)
+            titles = [article["title"] for article in response.data]
+            self.assertIn("Liked Updated", titles)
+        self.assertEqual(metrics.get_counter("cache.article_list.hit"), hits_before)
+
+        # 다시 조회하면 캐시 적중
+        self.client.get(self.list_url)
+        self.assertEqual(metrics.get_counter("cache.article_list.hit"), hits_before + 1)
+
+    def test_counter_only_save_keeps_cache(self):
+        self.client.get(self.list_url)
+        bumps_before = metrics.get_counter("cache.article_list.bump")
+
+        # 목록 캐시에 영향이 없는 필드만 저장하면 무효화하지 않음
+        with self.captureOnCommitCallbacks(execute=True):
+            self.liked_article.view_count = 10
+            self.liked_article.save(update_fields=["view_count"])
+        self.assertEqual(metrics.get_counter("cache.article_list.bump"), bumps_before)
@@ -0,0 +1,102 @@
+from articles.models import Article, ArticleImage
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from tags.models import Tag
+from users.models import User
+
+
+class ArticleListQueryBudgetTests(APITestCase):
+    """
+    게시글 목록 API는 게시글 수(페이지 크기)와 상관없이 같은 수의 쿼리로 응답해야 함
+    (게시글+작성자+프로필+좋아요 여부, 이미지, 태그)
+    """
+
+    # 목록 직렬화에 허용되는 쿼리 수
+    query_budget = 3
+
+    def setUp(self):
+        cache.clear()
+        self.tag = Tag.objects.create(tag_id=2, name="연애 훈수")
+        self.viewer = User.objects.create_user(
+            username="viewer",
+            email="viewer@example.com",
+            password="testpassword",
+            nickname="viewer",
+        )
+        # 게시글마다 작성자/이미지/태그/좋아요를 다르게 생성
+        for i in range(10):
+            author = User.objects.create_user(
+                username=f"author{i}",
+                email=f"author{i}@example.com",
+                password="testpassword",
+                nickname=f"author{i}",
+            )
+            article = Article.objects.create(
+                user=author, title=f"검색 Article {i}", content=f"Content {i}"
+            )
+            article.tags.add(self.tag)
+            ArticleImage.objects.create(
+                article=article, image=f"https://example.com/{i}/1.png"
+            )
+            ArticleImage.objects.create(
+                article=article,
+                image=f"https://example.com/{i}/2.png",
+                is_thumbnail=True,
+                is_temporary=False,
+            )
+            if i % 2 == 0:
+                article.likes.add(self.viewer)
+
+        self.client.force_authenticate(user=self.viewer)
+
+    def count_queries(self, url, params=None):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries), response
+
+    def test_article_list_query_count_is_fixed(self):
+        url = reverse("article-list")
+        small, _ = self.count_queries(url, {"cursor": "", "page_size": 2})
+        large, response = self.count_queries(url, {"cursor": "", "page_size": 10})
+
+        self.assertEqual(small, large)
+        self.assertLessEqual(large, self.query_budget)
+
+        # prefetch된 데이터로 직렬화한 결과 확인
+        for article in response.data["results"]:
+            index = int(article["title"].split()[-1])
+            self.assertEqual(article["like"], index % 2 == 0)
+            self.assertEqual(
+                article["thumbnail_image"], f"https://example.com/{index}/2.png"
+            )
+            self.assertEqual(article["user"]["hunsoo_level"], 1)
+
+    def test_other_list_endpoints_query_count_is_fixed(self):
+        cases = [
+            (reverse("articles-by-tag", kwargs={"tag_id": self.tag.tag_id}), {}),
+            (reverse("top-liked-articles"), {}),
+            (reverse("article_search"), {"q": "검색", "cursor": ""}),
+            (reverse("article-likes-list"), {}),
+        ]
+        for url, params in cases:
+            with self.subTest(url=url):
+                num_queries, _ = self.count_queries(url, params)
+                # 캐시되는 목록은 사용자별 좋아요 여부를 덮어쓰는 쿼리 1회가 추가됨
+                self.assertLessEqual(num_queries, self.query_budget + 1)
+
+    def test_profile_articles_query_count_is_fixed(self):
+        author = User.objects.get(username="author0")
+        url = reverse("user-profile-detail-other", kwargs={"user_id": author.id})
+        before, _ = self.count_queries(url)
+
+        for i in range(5):
+            Article.objects.create(user=author, title=f"More {i}", content="more")
+        after, response = self.count_queries(url)
+
+        self.assertEqual(before, after)
+        self.assertEqual(len(response.data["articles"]), 6)
@@ -0,0 +1,134 @@
+import base64
+import json
+
+from articles.models import Article
+from comments.models import Comment
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from tags.models import Tag
+from users.models import User
+
+
+class ArticleCursorPaginationTests(APITestCase):
+
+    def setUp(self):
+        # 테스트 유저 생성
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="testuser@example.com",
+            password="testpassword",
+            nickname="TestNickname",
+        )
+
+        # 게시글 5개 생성 (최신순: Article 4 -> Article 0)
+        self.articles = [
+            Article.objects.create(
+                user=self.user, title=f"Article {i}", content=f"Content {i}"
+            )
+            for i in range(5)
+        ]
+        self.list_url = reverse("article-list")
+
+    def test_cursor_pages_forward_and_backward(self):
+        # 첫 페이지 (cursor 파라미터가 비어 있으면 처음부터 조회)
+        response = self.client.get(self.list_url, {"cursor": "", "page_size": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [article["title"] for article in response.data["results"]],
+            ["Article 4", "Article 3"],
+        )
+        self.assertIsNone(response.data["previous"])
+        self.assertIsNotNone(response.data["next"])
+
+        # 두 번째 페이지
+        response = self.client.get(
+            self.list_url, {"cursor": response.data["next"], "page_size": 2}
+        )
+        self.assertEqual(
+            [article["title"] for article in response.data["results"]],
+            ["Article 2", "Article 1"],
+        )
+
+        # 마지막 페이지
+        second_page = response.data
+        response = self.client.get(
+            self.list_url, {"cursor": second_page["next"], "page_size": 2}
+        )
+        self.assertEqual(
+            [article["title"] for article in response.data["results"]], ["Article 0"]
+        )
+        self.assertIsNone(response.data["next"])
+
+        # 이전 페이지로 돌아가기
+        response = self.client.get(
+            self.list_url, {"cursor": second_page["previous"], "page_size": 2}
+        )
+        self.assertEqual(
+            [article["title"] for article in response.data["results"]],
+            ["Article 4", "Article 3"],
+        )
+        self.assertIsNone(response.data["previous"])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.list_url, {"cursor": "invalid"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_tampered_cursor(self):
+        tag = Tag.objects.create(tag_id=1, name="일상")
+        urls = [
+            self.list_url,
+            reverse("articles-by-tag", kwargs={"tag_id": tag.tag_id}),
+        ]
+        positions = [
+            ["not a datetime", 1],
+            [None, None],
+            [[1], {"a": 1}],
+            [{"a": 1}, 1],
+            ["2024-01-01T00:00:00+00:00", "1"],
+            ["2024-01-01T00:00:00+00:00", 1.5],
+            ["2024-01-01T00:00:00+00:00", 2**64],
+            ["2024-13-45T00:00:00+00:00", 1],
+        ]
+        for url in urls:
+            for position in positions:
+                cursor = base64.urlsafe_b64encode(
+                    json.dumps({"p": position, "r": 0}).encode()
+                ).decode()
+                with self.subTest(url=url, position=position):
+                    response = self.client.get(url, {"cursor": cursor})
+                    self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_page_number_mode_is_kept(self):
+        # cursor 파라미터가 없으면 기존처럼 게시글 리스트만 반환
+        response = self.client.get(self.list_url, {"page_size": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+
+    def test_comment_list_cursor(self):
+        commenters = [
+            User.objects.create_user(
+                username=f"commenter{i}",
+                email=f"commenter{i}@example.com",
+                password="testpassword",
+                nickname=f"commenter{i}",
+            )
+            for i in range(3)
+        ]
+        for i, commenter in enumerate(commenters):
+            Comment.objects.create(
+                user=commenter, article=self.articles[0], content=f"Comment {i}"
+            )
+
+        url = reverse("comment-list", kwargs={"article_id": self.articles[0].id})
+        response = self.client.get(url, {"cursor": "", "page_size": 2})
+        self.assertEqual(
+            [comment["content"] for comment in response.data["results"]],
+            ["Comment 0", "Comment 1"],
+        )
+
+        response = self.client.get(url, {"cursor": response.data["next"]})
+        self.assertEqual(
+            [comment["content"] for comment in response.data["results"]],
+            ["Comment 2"],
+        )
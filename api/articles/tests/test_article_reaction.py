@@ -1,5 +1,22 @@
+import io
+import random
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from articles.counters import (
+    VIEW_COUNT_LOCK_KEY,
+    flush_view_counts,
+    increment_view_count,
+)
+from articles.likes import toggle_like
 from articles.models import Article
+from comments.models import Comment
+from common.cache import get_redis
+from django.core.management import call_command
+from django.db import connections
+from django.test import TransactionTestCase
 from django.urls import reverse
+from notifications.models import Notification
 from rest_framework import status
 from rest_framework.test import APITestCase
 from users.models import User
@@ -42,8 +59,10 @@ class ArticleReactionTests(APITestCase):
         # 첫 번째 조회 요청 (GET)
         response = self.client.get(self.view_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["view_count"], initial_view_count + 1)
 
-        # 조회수 증가 확인
+        # 조회수 증가 확인 (Redis에 누적된 조회수를 DB에 반영)
+        flush_view_counts()
         self.article.refresh_from_db()
         self.assertEqual(self.article.view_count, initial_view_count + 1)
 
@@ -52,6 +71,7 @@ class ArticleReactionTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         # 조회수는 증가하지 않아야 함
+        flush_view_counts()
         self.article.refresh_from_db()
         self.assertEqual(self.article.view_count, initial_view_count + 1)
 
@@ -62,9 +82,36 @@ class ArticleReactionTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         # 조회수 다시 증가 확인
+        flush_view_counts()
         self.article.refresh_from_db()
         self.assertEqual(self.article.view_count, initial_view_count + 2)
 
+    def test_view_count_flush_is_applied_once(self):
+        increment_view_count(self.article)
+
+        # DB에 커밋한 뒤 스냅샷을 지우기 전에 실패한 경우
+        redis = get_redis()
+        with patch.object(redis, "delete", side_effect=ConnectionError):
+            with self.assertRaises(ConnectionError):
+                flush_view_counts()
+
+        # 다음 flush는 이미 반영된 스냅샷을 다시 반영하지 않음
+        self.assertEqual(flush_view_counts(), 0)
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.view_count, 1)
+
+    def test_view_count_flush_skips_when_locked(self):
+        increment_view_count(self.article)
+        redis = get_redis()
+        redis.set(VIEW_COUNT_LOCK_KEY, "other", ex=60)
+
+        # 다른 프로세스가 flush 중이면 반영하지 않음
+        self.assertEqual(flush_view_counts(), 0)
+        redis.delete(VIEW_COUNT_LOCK_KEY)
+        self.assertEqual(flush_view_counts(), 1)
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.view_count, 1)
+
     def test_author_cannot_like_own_article(self):
         # 게시글 작성자가 자신의 게시글에 좋아요를 시도하는 경우
         response = self.client.post(self.like_url)
@@ -89,6 +136,120 @@ class ArticleReactionTests(APITestCase):
         self.article.refresh_from_db()
         self.assertEqual(self.article.like_count, 0)
 
+    def test_like_toggle_does_not_load_likers(self):
+        # 좋아요가 많은 게시글이어도 좋아요 목록/COUNT를 조회하지 않음
+        likers = [
+            User.objects.create_user(
+                username=f"liker{i}",
+                email=f"liker{i}@example.com",
+                password="testpassword",
+                nickname=f"Liker{i}",
+            )
+            for i in range(20)
+        ]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.article.likes.add(*likers)
+        Article.objects.filter(id=self.article.id).update(like_count=20)
+        self.client.force_authenticate(user=self.other_user)
+
+        # 게시글 조회 1회 + 좋아요 추가/좋아요 수 증가 1회
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertNumQueries(2):
+                response = self.client.post(self.like_url)
+        self.assertEqual(response.data["like_count"], 21)
+        self.assertEqual(response.data["message"], "Like added")
+        # m2m_changed 시그널로 좋아요 알림 생성
+        self.assertTrue(
+            Notification.objects.filter(
+                recipient=self.user, actor=self.other_user, verb="like"
+            ).exists()
+        )
+
+        # 게시글 조회 1회 + 좋아요 추가 시도 1회 + 좋아요 삭제/좋아요 수 감소 1회
+        # + 좋아요 알림 조회 1회 (post_remove 시그널, 여러 명이 묶인 알림은 삭제하지 않음)
+        with self.assertNumQueries(4):
+            response = self.client.post(self.like_url)
+        self.assertEqual(response.data["like_count"], 20)
+        self.assertEqual(response.data["message"], "Like removed")
+
+    def test_comment_count_follows_comments(self):
+        # 댓글 작성 시 댓글 수 증가
+        comment = Comment.objects.create(
+            user=self.other_user, article=self.article, content="Test Comment"
+        )
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.comment_count, 1)
+
+        # 댓글 삭제 시 댓글 수 감소
+        comment.delete()
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.comment_count, 0)
+
+    def test_rebuild_article_counters(self):
+        # 원본 테이블과 어긋난 카운터를 다시 계산
+        self.article.likes.add(self.other_user)
+        Comment.objects.create(
+            user=self.other_user, article=self.article, content="Test Comment"
+        )
+        Article.objects.filter(id=self.article.id).update(
+            like_count=10, comment_count=10
+        )
+
+        call_command("rebuild_article_counters", stdout=io.StringIO())
+
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.like_count, 1)
+        self.assertEqual(self.article.comment_count, 1)
+
     def tearDown(self):
         self.user.delete()
         self.article.delete()
+
+
+class ArticleLikeConcurrencyTests(TransactionTestCase):
+    def setUp(self):
+        self.author = User.objects.create_user(
+            username="author",
+            email="author@example.com",
+            password="testpassword",
+            nickname="Author",
+        )
+        self.article = Article.objects.create(
+            user=self.author, title="Test Article", content="Test Content"
+        )
+        self.users = [
+            User.objects.create_user(
+                username=f"concurrent{i}",
+                email=f"concurrent{i}@example.com",
+                password="testpassword",
+                nickname=f"Concurrent{i}",
+            )
+            for i in range(80)
+        ]
+
+    def toggle(self, user_id):
+        try:
+            return toggle_like(self.article, user_id)
+        finally:
+            connections.close_all()
+
+    def test_parallel_toggles_keep_like_count_consistent(self):
+        # 100번 동시에 토글: 60명은 한 번, 20명은 두 번 (같은 사용자의 토글끼리도 경합)
+        user_ids = [user.id for user in self.users] + [
+            user.id for user in self.users[60:]
+        ]
+        random.Random(0).shuffle(user_ids)
+        self.assertEqual(len(user_ids), 100)
+
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            results = list(executor.map(self.toggle, user_ids))
+
+        liked = sum(1 if result[0] else -1 for result in results)
+        self.article.refresh_from_db()
+        self.assertEqual(liked, 60)
+        self.assertEqual(self.article.like_count, 60)
+        self.assertEqual(self.article.likes.count(), 60)
+        self.assertEqual(
+            set(self.article.likes.values_list("id", flat=True)),
+            {user.id for user in self.users[:60]},
+        )
@@ -0,0 +1,387 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from articles import images as article_images
+from articles.models import Article, ArticleImage
+from comments.models import Comment, CommentImage
+from common import storage
+from common.models import StorageTask
+from common.testing import use_fake_s3
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from users.models import User
+
+
+@override_settings(STORAGE_OUTBOX_EAGER=True)
+class ArticleImageBatchTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="s3user",
+            email="s3user@example.com",
+            password="testpassword",
+            nickname="S3Nickname",
+        )
+        self.article = Article.objects.create(
+            user=self.user, title="S3 게시글", content="본문"
+        )
+
+    def create_temp_images(self, count):
+        images = ArticleImage.objects.bulk_create(
+            [
+                ArticleImage(image=f"{storage.get_base_url()}temporary/img{i}.png")
+                for i in range(count)
+            ]
+        )
+        return [image.id for image in images]
+
+    @patch("articles.image_variants.submit")
+    def test_move_temp_images_copies_concurrently_and_batches(self, submit):
+        image_ids = self.create_temp_images(10)
+        s3_client = use_fake_s3(self, [f"temporary/img{i}.png" for i in range(10)])
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            with self.assertNumQueries(5):
+                # 이미지 조회 1회 + bulk_update 1회 + outbox 기록 1회 (+ savepoint)
+                article_images.move_temp_images_to_article(image_ids, self.article)
+            # 요청 처리 중에는 S3를 호출하지 않음
+            self.assertEqual(s3_client.calls, [])
+            self.assertEqual(StorageTask.objects.count(), 10)
+
+        for callback in callbacks:
+            callback()
+
+        # 이동이 모두 끝난 뒤 WebP 변환 시작
+        submit.assert_called_once_with(self.article.id)
+        self.assertEqual(s3_client.count("copy_object"), 10)
+        self.assertGreater(s3_client.max_concurrent_copies, 1)
+        self.assertEqual(s3_client.count("delete_objects"), 1)
+        self.assertEqual(s3_client.count("delete_object"), 0)
+        self.assertEqual(
+            set(s3_client.objects),
+            {f"articles/{self.article.id}/img{i}.png" for i in range(10)},
+        )
+        self.assertFalse(StorageTask.objects.exists())
+
+        images = ArticleImage.objects.filter(id__in=image_ids)
+        self.assertFalse(images.filter(is_temporary=True).exists())
+        self.assertEqual(images.filter(article=self.article).count(), 10)
+        self.assertTrue(
+            all(
+                image.image.endswith(f"articles/{self.article.id}/img{i}.png")
+                for i, image in enumerate(images.order_by("id"))
+            )
+        )
+
+    @patch("articles.image_variants.submit")
+    def test_move_temp_images_retries_when_copy_fails(self, submit):
+        image_ids = self.create_temp_images(3)
+        base_url = storage.get_base_url()
+        self.article.content = "".join(
+            f'<img src="{base_url}temporary/img{i}.png">' for i in range(3)
+        )
+        self.article.save()
+        # 복사할 원본 하나가 S3에 없음
+        s3_client = use_fake_s3(self, ["temporary/img0.png", "temporary/img1.png"])
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            article_images.move_temp_images_to_article(image_ids, self.article)
+        # 이동이 끝나기 전에는 임시 URL을 그대로 사용
+        self.assertTrue(
+            all(
+                "/temporary/" in image.image
+                for image in ArticleImage.objects.filter(id__in=image_ids)
+            )
+        )
+        for callback in callbacks:
+            callback()
+
+        # 성공한 이동만 URL을 바꾸고 원본을 삭제하며, 실패한 작업은 재시도 대기
+        self.assertEqual(
+            set(s3_client.objects),
+            {f"articles/{self.article.id}/img{i}.png" for i in range(2)},
+        )
+        images = ArticleImage.objects.filter(id__in=image_ids).order_by("id")
+        self.assertEqual(
+            [image.image for image in images],
+            [
+                f"{base_url}articles/{self.article.id}/img0.png",
+                f"{base_url}articles/{self.article.id}/img1.png",
+                f"{base_url}temporary/img2.png",
+            ],
+        )
+        self.article.refresh_from_db()
+        self.assertEqual(
+            self.article.content,
+            f'<img src="{base_url}articles/{self.article.id}/img0.png">'
+            f'<img src="{base_url}articles/{self.article.id}/img1.png">'
+            f'<img src="{base_url}temporary/img2.png">',
+        )
+        task = StorageTask.objects.get()
+        self.assertEqual(task.key, "temporary/img2.png")
+        self.assertEqual(task.status, "pending")
+        self.assertEqual(task.attempts, 1)
+        self.assertIn("NoSuchKey", task.last_error)
+        self.assertGreater(task.next_run_at, timezone.now())
+        submit.assert_called_once_with(self.article.id)
+
+        # 워커 재시도로 끝난 이동도 URL을 바꾸고 WebP 변환을 시작
+        s3_client.objects["temporary/img2.png"] = b"png"
+        StorageTask.objects.update(next_run_at=timezone.now())
+        call_command("drain_storage_outbox", stdout=StringIO())
+
+        self.assertFalse(StorageTask.objects.exists())
+        self.assertEqual(
+            ArticleImage.objects.get(id=image_ids[2]).image,
+            f"{base_url}articles/{self.article.id}/img2.png",
+        )
+        self.article.refresh_from_db()
+        self.assertNotIn("/temporary/", self.article.content)
+        self.assertEqual(submit.call_count, 2)
+
+    def test_update_image_urls_rewrites_only_moved_images(self):
+        base_url = storage.get_base_url()
+        ArticleImage.objects.create(
+            article=self.article,
+            image=f"{base_url}articles/{self.article.id}/moved.png",
+            is_temporary=False,
+        )
+        content = (
+            f'<img src="{base_url}temporary/moved.png">'
+            f'<img src="{base_url}temporary/pending.png">'
+        )
+
+        # 수정 요청이 이동 전의 본문을 보내도 이동이 끝난 이미지는 최종 URL로 저장
+        self.assertEqual(
+            article_images.update_image_urls(content, self.article),
+            f'<img src="{base_url}articles/{self.article.id}/moved.png">'
+            f'<img src="{base_url}temporary/pending.png">',
+        )
+
+    def test_delete_files_splits_into_batches(self):
+        keys = [f"articles/{self.article.id}/{i}.png" for i in range(2500)]
+        s3_client = use_fake_s3(self, keys)
+
+        storage.delete_files(keys)
+
+        self.assertEqual(s3_client.count("delete_objects"), 3)
+        self.assertEqual(set(s3_client.objects), set())
+
+    def test_delete_images(self):
+        image_ids = self.create_temp_images(5)
+        s3_client = use_fake_s3(self, [f"temporary/img{i}.png" for i in range(5)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            deleted = article_images.delete_images(image_ids + [0])
+            self.assertEqual(s3_client.calls, [])
+
+        self.assertEqual(sorted(deleted), sorted(image_ids))
+        self.assertEqual(s3_client.count("delete_objects"), 1)
+        self.assertEqual(set(s3_client.objects), set())
+        self.assertFalse(ArticleImage.objects.filter(id__in=image_ids).exists())
+        self.assertFalse(StorageTask.objects.exists())
+
+
+@override_settings(STORAGE_OUTBOX_EAGER=True)
+class ArticleDeleteS3Tests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="s3delete",
+            email="s3delete@example.com",
+            password="testpassword",
+            nickname="S3Delete",
+        )
+        self.client.cookies["hunsu_access"] = str(
+            RefreshToken.for_user(self.user).access_token
+        )
+        self.article = Article.objects.create(
+            user=self.user, title="삭제할 게시글", content="본문"
+        )
+        self.keys = [f"articles/{self.article.id}/img{i}.png" for i in range(10)]
+        ArticleImage.objects.bulk_create(
+            [
+                ArticleImage(
+                    article=self.article,
+                    image=storage.get_base_url() + key,
+                    is_temporary=False,
+                )
+                for key in self.keys
+            ]
+        )
+
+    def test_delete_article_removes_images_in_one_request(self):
+        s3_client = use_fake_s3(self, self.keys)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(
+                reverse("article-delete", kwargs={"id": self.article.id})
+            )
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(s3_client.calls, ["delete_objects"])
+        self.assertEqual(set(s3_client.objects), set())
+        self.assertFalse(ArticleImage.objects.exists())
+
+
+class ArticleImagePresignTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="presign",
+            email="presign@example.com",
+            password="testpassword",
+            nickname="Presign",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.s3_client = use_fake_s3(self)
+
+    def presign(self, content_type="image/png"):
+        return self.client.post(
+            reverse("article-image-presign"),
+            {"content_type": content_type},
+            format="json",
+        )
+
+    def test_presign_creates_pending_image(self):
+        response = self.presign()
+
+        self.assertEqual(response.status_code, 201)
+        image = ArticleImage.objects.get(id=response.data["id"])
+        self.assertFalse(image.is_uploaded)
+        self.assertTrue(image.is_temporary)
+        self.assertEqual(image.image, response.data["image_url"])
+        self.assertTrue(response.data["fields"]["key"].startswith("temporary/"))
+        self.assertEqual(response.data["fields"]["Content-Type"], "image/png")
+        # 서버는 파일을 직접 받거나 업로드하지 않음
+        self.assertEqual(self.s3_client.calls, ["generate_presigned_post"])
+
+    def test_presign_rejects_unsupported_type(self):
+        response = self.presign("application/pdf")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(ArticleImage.objects.exists())
+
+    def test_confirm_after_upload(self):
+        data = self.presign().data
+        confirm_url = reverse("article-image-confirm", kwargs={"image_id": data["id"]})
+
+        # 업로드 전 확인 요청은 거부
+        self.assertEqual(self.client.post(confirm_url).status_code, 400)
+
+        self.s3_client.objects[data["fields"]["key"]] = b"png"
+        response = self.client.post(confirm_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(ArticleImage.objects.get(id=data["id"]).is_uploaded)
+
+    def test_confirm_rejects_other_users_upload(self):
+        data = self.presign().data
+        self.s3_client.objects[data["fields"]["key"]] = b"png"
+        other = User.objects.create_user(
+            username="otheruploader",
+            email="otheruploader@example.com",
+            password="testpassword",
+            nickname="OtherUploader",
+        )
+        self.client.force_authenticate(user=other)
+
+        response = self.client.post(
+            reverse("article-image-confirm", kwargs={"image_id": data["id"]})
+        )
+
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(ArticleImage.objects.get(id=data["id"]).is_uploaded)
+
+    def test_unconfirmed_image_is_not_attached_to_article(self):
+        data = self.presign().data
+        article = Article.objects.create(user=self.user, title="제목", content="본문")
+
+        article_images.move_temp_images_to_article([data["id"]], article)
+
+        image = ArticleImage.objects.get(id=data["id"])
+        self.assertIsNone(image.article_id)
+        self.assertEqual(self.s3_client.count("copy_object"), 0)
+
+
+class TemporaryImageCleanupTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="cleanup",
+            email="cleanup@example.com",
+            password="testpassword",
+            nickname="Cleanup",
+        )
+        self.s3_client = use_fake_s3(self)
+
+    def create_temp_image(self, name, hours_ago, article=None):
+        key = f"temporary/{name}.png"
+        self.s3_client.objects[key] = b"x" * 100
+        image = ArticleImage.objects.create(image=storage.get_url(key), article=article)
+        ArticleImage.objects.filter(id=image.id).update(
+            created_at=timezone.now() - timedelta(hours=hours_ago)
+        )
+        return image
+
+    def test_cleanup_deletes_only_stale_orphans(self):
+        stale = [self.create_temp_image(f"old{i}", 48) for i in range(3)]
+        fresh = self.create_temp_image("fresh", 1)
+        article = Article.objects.create(user=self.user, title="제목", content="본문")
+        attached = self.create_temp_image("attached", 48, article=article)
+
+        out = StringIO()
+        call_command("cleanup_temporary_article_images", "--batch-size=2", stdout=out)
+
+        self.assertIn("3개 삭제, 300 bytes", out.getvalue())
+        self.assertFalse(
+            ArticleImage.objects.filter(id__in=[image.id for image in stale]).exists()
+        )
+        self.assertTrue(ArticleImage.objects.filter(id=fresh.id).exists())
+        self.assertTrue(ArticleImage.objects.filter(id=attached.id).exists())
+        self.assertEqual(
+            set(self.s3_client.objects),
+            {"temporary/fresh.png", "temporary/attached.png"},
+        )
+        # 2개씩 나누어 삭제하고, 크기는 삭제할 객체만 head_object로 조회
+        self.assertEqual(self.s3_client.count("delete_objects"), 2)
+        self.assertEqual(self.s3_client.count("head_object"), 3)
+
+    def test_dry_run_keeps_everything(self):
+        self.create_temp_image("old", 48)
+
+        out = StringIO()
+        call_command("cleanup_temporary_article_images", "--dry-run", stdout=out)
+
+        self.assertIn("삭제 대상 임시 이미지 1개, 100 bytes", out.getvalue())
+        self.assertEqual(ArticleImage.objects.count(), 1)
+        self.assertIn("temporary/old.png", self.s3_client.objects)
+        self.assertEqual(self.s3_client.count("delete_objects"), 0)
+
+    def test_cleanup_deletes_stale_pending_comment_images(self):
+        article = Article.objects.create(user=self.user, title="제목", content="본문")
+        comment = Comment.objects.create(
+            user=self.user, article=article, content="댓글"
+        )
+        images = {}
+        for name, is_uploaded in (("pending", False), ("confirmed", True)):
+            key = f"comments/{self.user.id}/{name}.png"
+            self.s3_client.objects[key] = b"x" * 100
+            images[name] = CommentImage.objects.create(
+                comment=comment, image=storage.get_url(key), is_uploaded=is_uploaded
+            )
+        CommentImage.objects.update(created_at=timezone.now() - timedelta(hours=48))
+
+        out = StringIO()
+        call_command("cleanup_temporary_article_images", stdout=out)
+
+        # 업로드 확인이 끝나지 않은 댓글 이미지만 삭제
+        self.assertIn("1개 삭제, 100 bytes", out.getvalue())
+        self.assertEqual(
+            list(CommentImage.objects.values_list("id", flat=True)),
+            [images["confirmed"].id],
+        )
+        self.assertEqual(
+            set(self.s3_client.objects), {f"comments/{self.user.id}/confirmed.png"}
+        )
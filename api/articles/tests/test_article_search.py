@@ -0,0 +1,145 @@
+from io import StringIO
+
+from articles.models import Article, ArticleNgram
+from articles.search import get_search_backend
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from tags.models import Tag
+from users.models import User
+
+
+class ArticleSearchTestsMixin:
+
+    def setUp(self):
+        cache.clear()
+        get_search_backend().rebuild()
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="testuser@example.com",
+            password="testpassword",
+            nickname="TestNickname",
+        )
+        self.love = Tag.objects.create(tag_id=2, name="연애 훈수")
+        self.work = Tag.objects.create(tag_id=3, name="직장 훈수")
+
+        # 본문에만 검색어가 있는 게시글
+        self.in_content = self.create_article(
+            "점심 메뉴 고민", "연애 상담도 받아주나요?", self.work
+        )
+        # 제목에 검색어(조사 포함)가 있는 게시글
+        self.in_title = self.create_article(
+            "연애는 어려워요", "누가 좀 알려주세요", self.love
+        )
+        self.unrelated = self.create_article("오늘 날씨", "맑음", self.love)
+        self.search_url = reverse("article_search")
+
+    def create_article(self, title, content, tag):
+        article = Article.objects.create(user=self.user, title=title, content=content)
+        article.tags.add(tag)
+        return article
+
+    def search(self, params):
+        response = self.client.get(self.search_url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def titles(self, articles):
+        return [article["title"] for article in articles]
+
+    def test_ranked_results(self):
+        # 제목 매칭이 본문 매칭보다 먼저 나와야 함
+        response = self.search({"q": "연애"})
+        self.assertEqual(
+            self.titles(response.data), ["연애는 어려워요", "점심 메뉴 고민"]
+        )
+
+    def test_all_terms_must_match(self):
+        response = self.search({"q": "연애 상담"})
+        self.assertEqual(self.titles(response.data), ["점심 메뉴 고민"])
+
+    def test_tag_filter(self):
+        response = self.search({"q": "연애", "tag": self.work.tag_id})
+        self.assertEqual(self.titles(response.data), ["점심 메뉴 고민"])
+
+    def test_index_follows_article_changes(self):
+        self.unrelated.title = "연애 날씨"
+        self.unrelated.save()
+        self.in_title.delete()
+
+        response = self.search({"q": "연애"})
+        self.assertCountEqual(
+            self.titles(response.data), ["연애 날씨", "점심 메뉴 고민"]
+        )
+
+    def test_cursor_pagination(self):
+        response = self.search({"q": "연애", "cursor": "", "page_size": 1})
+        self.assertEqual(self.titles(response.data["results"]), ["연애는 어려워요"])
+
+        response = self.search(
+            {"q": "연애", "cursor": response.data["next"], "page_size": 1}
+        )
+        self.assertEqual(self.titles(response.data["results"]), ["점심 메뉴 고민"])
+        self.assertIsNone(response.data["next"])
+
+    def test_invalid_params(self):
+        response = self.client.get(self.search_url, {"q": " "})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(self.search_url, {"q": "연애", "tag": "abc"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@override_settings(ARTICLE_SEARCH_BACKEND="articles.search.ngrams.NgramSearchBackend")
+class NgramArticleSearchTests(ArticleSearchTestsMixin, APITestCase):
+
+    def test_substring_inside_word(self):
+        # 띄어쓰기 없이 붙은 단어 중간의 검색어도 찾아야 함
+        self.create_article("직장훈수 부탁드려요", "상사가 너무해요", self.work)
+        response = self.search({"q": "훈수"})
+        self.assertEqual(self.titles(response.data), ["직장훈수 부탁드려요"])
+
+    def test_scattered_ngrams_are_not_matched(self):
+        # "연애"와 "애상"이 따로 있어도 "연애상"이 없으면 결과에서 제외
+        self.create_article("연애 애상", "내용", self.love)
+        response = self.search({"q": "연애상"})
+        self.assertEqual(self.titles(response.data), [])
+
+    def test_single_character_query(self):
+        # n-gram보다 짧은 검색어는 제목/본문에서 직접 찾음 (제목에 있는 게시글 먼저)
+        response = self.search({"q": "애"})
+        self.assertEqual(
+            self.titles(response.data), ["연애는 어려워요", "점심 메뉴 고민"]
+        )
+
+        response = self.search({"q": "음", "cursor": ""})
+        self.assertEqual(self.titles(response.data["results"]), ["오늘 날씨"])
+
+    def test_rebuild_command(self):
+        ArticleNgram.objects.all().delete()
+        call_command("rebuild_article_search_index", stdout=StringIO())
+
+        self.assertTrue(ArticleNgram.objects.filter(gram="연애").exists())
+        response = self.search({"q": "연애"})
+        self.assertEqual(len(response.data), 2)
+
+
+@override_settings(
+    ARTICLE_SEARCH_BACKEND="articles.search.backends.InMemorySearchBackend"
+)
+class InMemoryArticleSearchTests(ArticleSearchTestsMixin, APITestCase):
+    pass
+
+
+@override_settings(
+    ARTICLE_SEARCH_BACKEND="articles.search.backends.PostgresSearchBackend"
+)
+class PostgresArticleSearchTests(ArticleSearchTestsMixin, APITestCase):
+
+    def setUp(self):
+        if connection.vendor != "postgresql":
+            self.skipTest("PostgreSQL 전문 검색 테스트")
+        super().setUp()
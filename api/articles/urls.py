@@ -3,7 +3,9 @@ from django.urls import path
 from .views.article_crud_views import (
     ArticleCreateView,
     ArticleDeleteView,
+    ArticleImageConfirmView,
     ArticleImageDeleteView,
+    ArticleImagePresignView,
     ArticleImageUploadView,
     ArticleUpdateView,
 )
@@ -35,6 +37,16 @@ urlpatterns = [
         ArticleImageDeleteView.as_view(),
         name="article-image-delete",
     ),
+    path(
+        "images/presign/",
+        ArticleImagePresignView.as_view(),
+        name="article-image-presign",
+    ),
+    path(
+        "images/<int:image_id>/confirm/",
+        ArticleImageConfirmView.as_view(),
+        name="article-image-confirm",
+    ),
     # 게시글 리스트 및 상세 조회 관련 URL
     path("", ArticleListView.as_view(), name="article-list"),
     path("<int:id>/", ArticleDetailView.as_view(), name="article-detail"),
@@ -1,5 +1,7 @@
 import re
 
+from common import outbox
+from django.db import transaction
 from rest_framework import generics, permissions, serializers, status
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.parsers import FormParser, MultiPartParser
@@ -7,8 +9,8 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from .. import images as article_images
 from ..models import Article, ArticleImage
-from ..s3instance import S3Instance
 from ..serializers import ArticleImageSerializer, ArticleSerializer
 
 
@@ -18,6 +20,7 @@ class ArticleCreateView(generics.CreateAPIView):
     serializer_class = ArticleSerializer
     permission_classes = [IsAuthenticated]
 
+    @transaction.atomic
     def perform_create(self, serializer):
         tag_id = self.request.data.get("tag_id")
         temp_image_ids = self.request.data.get("temp_image_ids", [])
@@ -33,15 +36,11 @@ class ArticleCreateView(generics.CreateAPIView):
         if not article.id:
             raise serializers.ValidationError("게시글 ID가 생성되지 않았습니다.")
 
-        # S3 인스턴스 생성
-        s3instance = S3Instance().get_s3_instance()
-
         # 임시 이미지들을 게시글과 연결 및 경로 변경 (ID가 확정된 후 실행)
-        S3Instance.move_temp_images_to_article(s3instance, temp_image_ids, article)
+        article_images.move_temp_images_to_article(temp_image_ids, article)
 
-        # content에 포함된 이미지 경로 업데이트 (S3Instance 내 메서드 사용)
-        s3 = S3Instance()  # S3Instance 객체 생성
-        updated_content = s3.update_image_urls(content, article.id)
+        # content에 포함된 이미지 중 이동이 끝난 이미지의 경로 업데이트
+        updated_content = article_images.update_image_urls(content, article)
         article.content = updated_content
         article.save()  # 변경된 content와 함께 게시글 다시 저장
 
@@ -67,6 +66,7 @@ class ArticleUpdateView(generics.UpdateAPIView):
             raise PermissionDenied("게시글 수정 권한이 없습니다.")
         return article
 
+    @transaction.atomic
     def perform_update(self, serializer):
         tag_id = self.request.data.get("tag_id")
         temp_image_ids = self.request.data.get("temp_image_ids", [])
@@ -86,37 +86,22 @@ class ArticleUpdateView(generics.UpdateAPIView):
         # 게시글 수정 및 저장
         article = serializer.save(tag_id=tag_id)
 
-        # S3 인스턴스 생성
-        s3instance = S3Instance().get_s3_instance()
-
         # 기존 이미지 처리 로직
         existing_images = list(article.images.values_list("id", flat=True))
 
         # 새로 들어온 이미지와 기존 이미지 비교하여 삭제할 이미지 선정
         images_to_delete = set(existing_images) - set(temp_image_ids)
 
-        # S3에서 삭제하고 DB에서도 삭제
-        for image_id in images_to_delete:
-            try:
-                image = ArticleImage.objects.get(id=image_id)
-                # S3에서 이미지 삭제
-                S3Instance.delete_file(s3instance, image.image)
-                # DB에서 이미지 객체 삭제
-                image.delete()
-            except ArticleImage.DoesNotExist:
-                pass
-            except Exception as e:
-                raise serializers.ValidationError(
-                    f"S3 이미지 삭제 중 오류가 발생했습니다: {str(e)}"
-                )
+        # DB에서 삭제하고 S3 삭제는 outbox에 기록 (커밋 후 처리)
+        if images_to_delete:
+            article_images.delete_images(images_to_delete)
 
         # 임시 이미지들을 게시글과 연결 및 경로 변경
         if temp_image_ids:
-            S3Instance.move_temp_images_to_article(s3instance, temp_image_ids, article)
+            article_images.move_temp_images_to_article(temp_image_ids, article)
 
-        # content에 포함된 이미지 경로 업데이트 (S3Instance 내 메서드 사용)
-        s3 = S3Instance()  # S3Instance 객체 생성
-        updated_content = s3.update_image_urls(content, article.id)
+        # content에 포함된 이미지 중 이동이 끝난 이미지의 경로 업데이트
+        updated_content = article_images.update_image_urls(content, article)
         article.content = updated_content
         article.save()  # 변경된 content와 함께 다시 저장
 
@@ -143,15 +128,12 @@ class ArticleImageUploadView(APIView):
                 {"error": "No image file provided"}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        # S3 인스턴스 생성
-        s3instance = S3Instance().get_s3_instance()
-
-        # S3에 이미지 업로드 (리스트로 전달)
-        image_urls = S3Instance.upload_files(s3instance, [image_file])
+        # S3 임시 경로에 이미지 업로드
+        image_url = article_images.upload_temp_image(image_file)
 
         # 업로드된 이미지 URL을 사용해 ArticleImage 객체 생성 및 저장
         article_image = ArticleImage.objects.create(
-            image=image_urls[0],  # S3에서 반환된 URL 사용
+            image=image_url,  # S3에서 반환된 URL 사용
             article=None,  # article 연결은 나중에
         )
 
@@ -160,18 +142,65 @@ class ArticleImageUploadView(APIView):
         return Response(image_data, status=status.HTTP_201_CREATED)
 
 
+# 이미지 직접 업로드(presigned POST) 발급 뷰
+class ArticleImagePresignView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        content_type = request.data.get("content_type")
+        try:
+            image, upload = article_images.create_pending_image(
+                content_type, request.user
+            )
+        except ValueError:
+            return Response(
+                {"error": "Unsupported image type"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # 클라이언트는 upload_url에 fields와 파일을 multipart로 전송한 뒤 confirm 요청
+        return Response(
+            {
+                "id": image.id,
+                "image_url": upload["image_url"],
+                "upload_url": upload["upload_url"],
+                "fields": upload["fields"],
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
+# 직접 업로드 완료 확인 뷰
+class ArticleImageConfirmView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, image_id):
+        try:
+            # 본인이 발급받은 업로드만 확인 가능
+            image = ArticleImage.objects.get(
+                id=image_id, is_temporary=True, uploader=request.user
+            )
+        except ArticleImage.DoesNotExist:
+            return Response(
+                {"error": "Image not found"}, status=status.HTTP_404_NOT_FOUND
+            )
+
+        if not article_images.confirm_uploaded_image(image):
+            return Response(
+                {"error": "Image has not been uploaded"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return Response(ArticleImageSerializer(image).data, status=status.HTTP_200_OK)
+
+
 # 이미지 삭제 뷰
 class ArticleImageDeleteView(APIView):
     permission_classes = [AllowAny]
 
     def delete(self, request, image_id):
-        # S3 인스턴스 생성
-        s3instance = S3Instance().get_s3_instance()
-
-        # S3Instance를 통해 이미지 삭제
         try:
             # 이미지 ID에 해당하는 이미지를 S3에서 삭제하고 DB에서도 삭제
-            deleted_images = S3Instance.delete_images(s3instance, [image_id])
+            deleted_images = article_images.delete_images([image_id])
         except Exception as e:
             return Response(
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -193,12 +222,10 @@ class ArticleDeleteView(generics.DestroyAPIView):
         if instance.is_closed:
             raise PermissionDenied("채택이 이루어진 게시글은 삭제할 수 없습니다.")
 
-        # S3 인스턴스 생성
-        s3instance = S3Instance().get_s3_instance()
-
-        # 게시글에 연결된 이미지들을 삭제
-        for image in instance.images.all():
-            S3Instance.delete_file(s3instance, image.image)  # S3에서 이미지 삭제
-            image.delete()  # DB에서 이미지 객체 삭제
+        # 게시글 삭제와 같은 트랜잭션에서 S3 이미지 삭제를 outbox에 기록
+        with transaction.atomic():
+            images = instance.images.all()
+            outbox.enqueue_deletes(article_images.get_image_keys(images))
+            images.delete()  # DB에서 이미지 객체 삭제
 
-        super().perform_destroy(instance)
+            super().perform_destroy(instance)
@@ -1,16 +1,21 @@
-from django.core.cache import cache
+from common.pagination import KeysetPagination
 from django.utils.decorators import method_decorator
 from rest_framework import generics
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import AllowAny, IsAuthenticatedOrReadOnly
 from rest_framework.response import Response
 
+from ..cache import (
+    apply_viewer_overlay,
+    article_list_cache_key,
+    get_or_build_article_list,
+)
 from ..models import Article
 from ..serializers import ArticleDetailSerializer, ArticleListSerializer
 
 
 # 페이지네이션 1페이지당 12개 게시물
-class ArticlePagination(PageNumberPagination):
+class ArticlePageNumberPagination(PageNumberPagination):
     page_size = 12
     page_size_query_param = "page_size"
     max_page_size = 100
@@ -20,6 +25,11 @@ class ArticlePagination(PageNumberPagination):
         return Response(data)
 
 
+# cursor 파라미터가 있으면 키셋 페이지네이션, 없으면 기존 page 번호 방식
+class ArticlePagination(KeysetPagination):
+    fallback_pagination_class = ArticlePageNumberPagination
+
+
 # 게시글 상세정보 조회
 class ArticleDetailView(generics.RetrieveAPIView):
     queryset = Article.objects.all()
@@ -30,54 +40,70 @@ class ArticleDetailView(generics.RetrieveAPIView):
 
 # 전체 게시글 조회 리스트
 class ArticleListView(generics.ListAPIView):
-    queryset = (
-        Article.objects.select_related("user")
-        .prefetch_related("tags", "images")
-        .order_by("-created_at")
-    )
+    queryset = Article.objects.order_by("-created_at", "-id")
     serializer_class = ArticleListSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
     pagination_class = ArticlePagination
 
+    def get_queryset(self):
+        return ArticleListSerializer.setup_eager_loading(
+            super().get_queryset(), self.request.user
+        )
+
     def list(self, request, *args, **kwargs):
+        # 커서 방식은 OFFSET/COUNT 없이 조회되므로 캐시를 거치지 않음
+        if self.paginator.cursor_query_param in request.query_params:
+            return super().list(request, *args, **kwargs)
 
-        # 페이지 번호를 캐시 키에 포함
+        # 페이지 번호와 페이지 크기를 캐시 키에 포함
         page_number = request.query_params.get("page", 1)
-        cache_key = f"article_list_page_{page_number}"
+        page_size = self.paginator.fallback_pagination_class().get_page_size(request)
+        cache_key = article_list_cache_key("page", page_number, page_size)
 
-        # 캐시에서 데이터 가져오기
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(cached_data)
+        # 캐시에는 사용자와 무관한 게시글 목록만 저장 (like=False, status=False)
+        queryset = ArticleListSerializer.setup_eager_loading(super().get_queryset())
 
-        # 캐시된 데이터가 없으면 쿼리 실행 후 캐시에 저장
-        page = self.paginate_queryset(self.get_queryset())
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            data = serializer.data
+        def build():
+            page = self.paginate_queryset(queryset)
+            if page is None:
+                return None
+            # request 없이 직렬화하여 로그인 사용자 정보가 캐시에 섞이지 않도록 함
+            return ArticleListSerializer(page, many=True).data
 
-            # 응답 객체에 렌더러 설정
-            response = Response(data)
-            response.accepted_renderer = self.request.accepted_renderer
-            response.accepted_media_type = self.request.accepted_media_type
-            response.renderer_context = self.get_renderer_context()
-
-            response.render()
-            cache.set(cache_key, response.data, 60 * 15)  # 15분 동안 캐시 유지
-            return response
-
-        return Response({"detail": "No articles found."}, status=404)
+        cached_data = get_or_build_article_list(cache_key, build)
+        if cached_data is None:
+            return Response({"detail": "No articles found."}, status=404)
+        return Response(apply_viewer_overlay(request, cached_data))
 
 
 # 특정 태그별 게시글 조회 리스트
 class ArticleByTagView(generics.ListAPIView):
     serializer_class = ArticleListSerializer
     permission_classes = [AllowAny]
+    pagination_class = KeysetPagination
 
-    def get_queryset(self):
+    def get_tag_queryset(self):
         tag_id = self.kwargs["tag_id"]
         return Article.objects.filter(tags__tag_id=tag_id).order_by("-created_at")
 
+    def get_queryset(self):
+        return ArticleListSerializer.setup_eager_loading(
+            self.get_tag_queryset(), self.request.user
+        )
+
+    def list(self, request, *args, **kwargs):
+        # 커서 방식은 캐시를 거치지 않음
+        if self.paginator.cursor_query_param in request.query_params:
+            return super().list(request, *args, **kwargs)
+
+        # 태그별 전체 목록은 사용자와 무관한 데이터만 캐시
+        cache_key = article_list_cache_key("tag", self.kwargs["tag_id"])
+        queryset = ArticleListSerializer.setup_eager_loading(self.get_tag_queryset())
+        cached_data = get_or_build_article_list(
+            cache_key, lambda: ArticleListSerializer(queryset, many=True).data
+        )
+        return Response(apply_viewer_overlay(request, cached_data))
+
 
 # 전체 게시글 조회 리스트 (like 상태와 article_id만 반환)
 class ArticleLikeListView(generics.ListAPIView):
@@ -85,6 +111,11 @@ class ArticleLikeListView(generics.ListAPIView):
     serializer_class = ArticleListSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
+    def get_queryset(self):
+        return ArticleListSerializer.setup_eager_loading(
+            super().get_queryset(), self.request.user
+        )
+
     def list(self, request, *args, **kwargs):
         queryset = self.get_queryset()
         serializer = self.get_serializer(
@@ -1,4 +1,3 @@
-from django.db.models import Count
 from django.shortcuts import get_object_or_404
 from rest_framework import status
 from rest_framework.permissions import (
@@ -9,6 +8,8 @@ from rest_framework.permissions import (
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from ..counters import get_pending_view_count, increment_view_count
+from ..likes import toggle_like
 from ..models import Article
 from ..serializers import ArticleListSerializer, ArticleSerializer
 
@@ -19,32 +20,31 @@ class ArticleLikeToggleView(APIView):
 
     def post(self, request, *args, **kwargs):
         article_id = kwargs.get("id")
-        article = get_object_or_404(Article, id=article_id)
+        article = get_object_or_404(
+            Article.objects.only("id", "user_id"), id=article_id
+        )
         user = request.user
 
         # 작성자가 자신의 게시글에 좋아요를 할 수 없도록 함
-        if article.user == user:
+        if article.user_id == user.id:
             return Response(
                 {"message": "게시글 작성자는 좋아요를 누를 수 없습니다."},
                 status=status.HTTP_409_CONFLICT,
             )
 
-        if user in article.likes.all():
-            article.likes.remove(user)
-            message = "Like removed"
-        else:
-            article.likes.add(user)
-            message = "Like added"
+        # 좋아요 행 추가/삭제와 비정규화된 좋아요 수 갱신을 한 문장으로 처리
+        liked, like_count = toggle_like(article, user.id)
 
         response_data = {
             "article_id": article_id,
-            "like_count": article.like_count,
-            "message": message,
+            "like_count": like_count,
+            "message": "Like added" if liked else "Like removed",
         }
         return Response(response_data, status=status.HTTP_200_OK)
 
 
 # 조회수 로직: 세션 기반으로 중복 방지
+# 조회수는 Redis에 누적한 뒤 flush_article_view_counts 커맨드가 일괄 반영
 class ArticleViewCountView(APIView):
     permission_classes = [AllowAny]
 
@@ -54,10 +54,11 @@ class ArticleViewCountView(APIView):
 
         session_key = f"viewed_article_{article_id}"
         if not request.session.get(session_key, False):
-            article.view_count += 1
-            article.save()
+            increment_view_count(article)
             request.session[session_key] = True
 
+        # 응답에는 아직 DB에 반영되지 않은 조회수까지 포함
+        article.view_count += get_pending_view_count(article.id)
         serializer = ArticleSerializer(article)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -70,10 +71,10 @@ class TopLikedArticlesView(APIView):
     permission_classes = [IsAuthenticatedOrReadOnly]
 
     def get(self, request, *args, **kwargs):
-        # Article 모델에서 좋아요 수를 Count하여 상위 5개의 게시글을 가져옵니다.
-        top_articles = Article.objects.annotate(
-            annotate_liked_count=Count("likes")
-        ).order_by("-annotate_liked_count")[:5]
+        # 비정규화된 좋아요 수 컬럼 기준으로 상위 5개의 게시글을 가져옵니다.
+        top_articles = ArticleListSerializer.setup_eager_loading(
+            Article.objects.order_by("-like_count", "-id"), request.user
+        )[:5]
 
         # ArticleListSerializer를 사용하여 직렬화
         serializer = ArticleListSerializer(
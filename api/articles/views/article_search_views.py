@@ -1,24 +1,59 @@
-from django.db import transaction
-from django.db.models import Q
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
-from ..models import Article
+from ..cache import (
+    apply_viewer_overlay,
+    article_search_cache_key,
+    get_or_build_article_list,
+)
+from ..search import get_search_backend
 from ..serializers import ArticleListSerializer
+from .article_list_views import ArticlePagination
+
+
+# 검색 결과 페이지네이션 (관련도 순, 동률이면 최신 게시글 먼저)
+# cursor 파라미터가 있으면 키셋 페이지네이션, 없으면 page 번호 방식
+class ArticleSearchPagination(ArticlePagination):
+    ordering = ("-rank", "-id")
 
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def article_search_view(request):
-    query = request.GET.get("q")
+    query = request.GET.get("q", "").strip()
     if not query:
         return Response({"error": "검색어를 입력해주세요."}, status=400)
 
-    results = Article.objects.filter(
-        Q(title__icontains=query) | Q(content__icontains=query)
-    ).distinct()
-    results = list(results)
+    tag_id = request.GET.get("tag")
+    if tag_id is not None:
+        try:
+            tag_id = int(tag_id)
+        except ValueError:
+            return Response({"error": "올바른 태그 id를 입력해주세요."}, status=400)
+
+    paginator = ArticleSearchPagination()
+    results = get_search_backend().search(query, tag_id=tag_id)
+
+    # 커서 방식은 캐시를 거치지 않음
+    if paginator.cursor_query_param in request.query_params:
+        results = ArticleListSerializer.setup_eager_loading(results, request.user)
+        page = paginator.paginate_queryset(results, request)
+        serializer = ArticleListSerializer(
+            page, many=True, context={"request": request}
+        )
+        return paginator.get_paginated_response(serializer.data)
+
+    page_number = request.query_params.get("page", 1)
+    page_size = paginator.fallback_pagination_class().get_page_size(request)
+
+    def build():
+        page = paginator.paginate_queryset(
+            ArticleListSerializer.setup_eager_loading(results), request
+        )
+        return ArticleListSerializer(page, many=True).data
 
-    serializer = ArticleListSerializer(results, many=True)
-    return Response(serializer.data)
+    # 검색 결과도 사용자와 무관한 데이터만 캐시하고 좋아요 여부는 요청마다 덮어씀
+    cache_key = article_search_cache_key(query, tag_id, page_number, page_size)
+    data = get_or_build_article_list(cache_key, build)
+    return Response(apply_viewer_overlay(request, data))
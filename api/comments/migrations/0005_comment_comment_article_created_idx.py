@@ -0,0 +1,20 @@
+# Generated by Django 5.1 on 2026-10-18 15:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0009_article_article_created_id_idx'),
+        ('comments', '0004_alter_commentimage_image'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['article', 'created_at', 'id'], name='comment_article_created_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1 on 2026-10-18 16:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comments', '0005_comment_comment_article_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='commentimage',
+            name='is_uploaded',
+            field=models.BooleanField(default=True),
+        ),
+    ]
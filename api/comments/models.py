@@ -1,10 +1,9 @@
 from articles.models import Article
+from common import storage
 from common.models import TimeStampModel
 from django.db import models
 from users.models import User
 
-from .s3instance import S3Instance
-
 
 class Comment(TimeStampModel):
     user = models.ForeignKey(User, on_delete=models.CASCADE, null=False)
@@ -18,6 +17,13 @@ class Comment(TimeStampModel):
 
     class Meta:
         unique_together = ("user", "article")
+        indexes = [
+            # 게시글별 댓글 키셋 페이지네이션 (created_at, id) 정렬용 인덱스
+            models.Index(
+                fields=["article", "created_at", "id"],
+                name="comment_article_created_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Comment by {self.user.username} on {self.article.title}"
@@ -28,11 +34,12 @@ class CommentImage(TimeStampModel):
         Comment, on_delete=models.CASCADE, null=False, related_name="images"
     )
     image = models.URLField(null=True, blank=True)  # URLField로 변경
+    # presigned URL로 직접 업로드하는 경우 업로드 확인 전까지 False
+    is_uploaded = models.BooleanField(default=True)
 
     def delete(self, *args, **kwargs):
         if self.image:
-            s3instance = S3Instance().get_s3_instance()
-            S3Instance.delete_file(s3instance, self.image)
+            storage.delete_url(self.image, fail_silently=True)
         super().delete(*args, **kwargs)
 
     def __str__(self):
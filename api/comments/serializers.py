@@ -5,11 +5,21 @@ from tags.serializers import TagSerializer
 from .models import Comment, CommentImage, CommentReaction
 
 
+# 업로드가 확인된 이미지만 직렬화 (presigned 업로드 대기 중인 이미지 제외)
+class UploadedImageListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        images = data.all() if hasattr(data, "all") else data
+        return super().to_representation(
+            [image for image in images if image.is_uploaded]
+        )
+
+
 # 댓글 이미지 시리얼라이저
 class CommentImageSerializer(serializers.ModelSerializer):
     class Meta:
         model = CommentImage
         fields = ["id", "image"]
+        list_serializer_class = UploadedImageListSerializer
 
 
 # 댓글 작성 및 수정 시리얼라이저
@@ -116,7 +126,6 @@ class CommentListSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
-        
 
     def get_user_profile_image(self, obj):
         profile = obj.user.profile
@@ -170,7 +179,6 @@ class CommentArticleListSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
-        
 
     def get_user_profile_image(self, obj):
         profile = obj.user.profile
@@ -229,7 +237,6 @@ class UserCommentListSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
-        
 
 
 # 특정 댓글 조회 시리얼라이저
@@ -1,8 +1,8 @@
+from ai_hunsoos.jobs import enqueue_ai_hunsoo
 from ai_hunsoos.models import AiHunsoo
-from ai_hunsoos.utils import generate_ai_response
 from articles.models import Article
-from django.db import transaction
-from django.db.models.signals import post_save
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from .models import Comment
@@ -12,28 +12,27 @@ from .models import Comment
 def create_ai_hunsoo(sender, instance, created, **kwargs):
     # 댓글이 업데이트되었고 is_selected가 True로 변경된 경우
     if not created and instance.is_selected:
-        with transaction.atomic():
-            # 관련된 게시글
-            article = instance.article
-
-            # 해당 게시글에 대한 AI 댓글이 이미 존재하고 status가 True인 경우
-            try:
-                ai_hunsoo = AiHunsoo.objects.get(article=article, status=True)
-                # 이미 존재하므로 업데이트하지 않음
-                return
-            except AiHunsoo.DoesNotExist:
-                # AI 댓글이 존재하지 않거나 status가 False인 경우
-                pass
-
-            # AI 응답 생성
-            ai_response = generate_ai_response(article.content, instance.content)
-
-            # AiHunsoo 테이블에 저장하거나 업데이트
-            ai_hunsoo, created = AiHunsoo.objects.get_or_create(
-                article=article, defaults={"content": ai_response, "status": True}
-            )
-            if not created:
-                # 이미 존재하는 경우 업데이트
-                ai_hunsoo.content = ai_response
-                ai_hunsoo.status = True
-                ai_hunsoo.save()
+        # 해당 게시글에 대한 AI 댓글이 이미 생성된 경우 다시 생성하지 않음
+        if AiHunsoo.objects.filter(
+            article_id=instance.article_id, status=True
+        ).exists():
+            return
+
+        # AI 응답 생성은 트랜잭션 커밋 후 워커에서 처리 (요청 스레드에서 OpenAI를 기다리지 않음)
+        enqueue_ai_hunsoo(instance)
+
+
+# 댓글 작성/삭제 시 게시글의 비정규화된 댓글 수 갱신
+@receiver(post_save, sender=Comment)
+def increase_comment_count(sender, instance, created, **kwargs):
+    if created:
+        Article.objects.filter(id=instance.article_id).update(
+            comment_count=F("comment_count") + 1
+        )
+
+
+@receiver(post_delete, sender=Comment)
+def decrease_comment_count(sender, instance, **kwargs):
+    Article.objects.filter(id=instance.article_id).update(
+        comment_count=F("comment_count") - 1
+    )
@@ -1,5 +1,6 @@
 from articles.models import Article
 from comments.models import Comment, CommentImage
+from common.testing import use_fake_s3
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -162,3 +163,63 @@ class CommentCRUDTests(APITestCase):
         self.profile.delete()
         self.article.delete()
         self.comment.delete()
+
+
+class CommentImagePresignTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="presign",
+            email="presign@example.com",
+            password="testpassword",
+            nickname="Presign",
+        )
+        self.other = User.objects.create_user(
+            username="other",
+            email="other@example.com",
+            password="testpassword",
+            nickname="Other",
+        )
+        article = Article.objects.create(
+            user=self.other, title="Test Article", content="Test Content"
+        )
+        self.comment = Comment.objects.create(
+            user=self.user, article=article, content="Test Comment"
+        )
+        self.presign_url = reverse(
+            "comment-image-presign", kwargs={"pk": self.comment.id}
+        )
+        self.s3_client = use_fake_s3(self)
+
+    def test_presign_and_confirm(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(
+            self.presign_url, {"content_type": "image/jpeg"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        image_id = response.data["id"]
+        key = response.data["fields"]["key"]
+        self.assertTrue(key.startswith(f"comments/{self.user.id}/"))
+
+        # 업로드 확인 전에는 댓글 응답에 포함되지 않음
+        detail_url = reverse("comment-detail", kwargs={"pk": self.comment.id})
+        self.assertEqual(self.client.get(detail_url).data["images"], [])
+
+        self.s3_client.objects[key] = b"jpeg"
+        confirm_url = reverse("comment-image-confirm", kwargs={"image_id": image_id})
+        response = self.client.post(confirm_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(CommentImage.objects.get(id=image_id).is_uploaded)
+        self.assertEqual(
+            [image["id"] for image in self.client.get(detail_url).data["images"]],
+            [image_id],
+        )
+
+    def test_presign_requires_comment_owner(self):
+        self.client.force_authenticate(user=self.other)
+        response = self.client.post(
+            self.presign_url, {"content_type": "image/png"}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(CommentImage.objects.exists())
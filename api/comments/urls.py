@@ -3,6 +3,8 @@ from django.urls import path
 from .views.comment_crud_views import (
     CommentCreateView,
     CommentDetailView,
+    CommentImageConfirmView,
+    CommentImagePresignView,
     CommentListView,
     CommentUpdateView,
 )
@@ -36,4 +38,14 @@ urlpatterns = [
         name="comment-select",
     ),
     path("top/", TopHelpfulCommentsView.as_view(), name="top-helpful-comments"),
+    path(
+        "<int:pk>/images/presign/",
+        CommentImagePresignView.as_view(),
+        name="comment-image-presign",
+    ),
+    path(
+        "images/<int:image_id>/confirm/",
+        CommentImageConfirmView.as_view(),
+        name="comment-image-confirm",
+    ),
 ]
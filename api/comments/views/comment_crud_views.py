@@ -1,9 +1,12 @@
-from rest_framework import generics, permissions
+from common import storage
+from common.pagination import KeysetPagination
+from rest_framework import generics, permissions, status
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from ..models import Comment, CommentImage
-from ..s3instance import S3Instance
 from ..serializers import (
     CommentDetailSerializer,
     CommentImageSerializer,
@@ -27,13 +30,11 @@ class CommentCreateView(generics.CreateAPIView):
 
         # 이미지 처리
         images = self.request.FILES.getlist("images")
-        if images:
-            s3instance = S3Instance().get_s3_instance()
-            for image in images:
-                image_url = S3Instance.upload_file(
-                    s3instance, image, self.request.user.id
-                )
-                CommentImage.objects.create(comment=comment, image=image_url)
+        for image in images:
+            image_url = storage.upload_file(
+                image, storage.generate_key(f"comments/{self.request.user.id}")
+            )
+            CommentImage.objects.create(comment=comment, image=image_url)
 
 
 # 댓글 수정 뷰
@@ -66,22 +67,92 @@ class CommentUpdateView(generics.UpdateAPIView):
         # 이미지 처리 (기존 이미지 삭제 후 새로운 이미지 업로드)
         images = self.request.FILES.getlist("images")
         if images:
-            s3instance = S3Instance().get_s3_instance()
+            # CommentImage.delete()에서 S3 파일도 함께 삭제
             for img in comment.images.all():
-                S3Instance.delete_file(s3instance, img.image)
                 img.delete()
             for image in images:
-                image_url = S3Instance.upload_file(
-                    s3instance, image, self.request.user.id
+                image_url = storage.upload_file(
+                    image, storage.generate_key(f"comments/{self.request.user.id}")
                 )
                 CommentImage.objects.create(comment=comment, image=image_url)
 
 
+# 댓글 이미지 직접 업로드(presigned POST) 발급 뷰
+class CommentImagePresignView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, pk):
+        try:
+            comment = Comment.objects.get(pk=pk)
+        except Comment.DoesNotExist:
+            return Response(
+                {"error": "Comment not found"}, status=status.HTTP_404_NOT_FOUND
+            )
+        if comment.user_id != request.user.id:
+            raise PermissionDenied("댓글에 이미지를 추가할 권한이 없습니다.")
+
+        try:
+            upload = storage.create_presigned_upload(
+                f"comments/{request.user.id}", request.data.get("content_type")
+            )
+        except ValueError:
+            return Response(
+                {"error": "Unsupported image type"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # 업로드 확인 전까지 목록/상세 응답에는 포함되지 않음
+        image = CommentImage.objects.create(
+            comment=comment, image=upload["image_url"], is_uploaded=False
+        )
+        return Response(
+            {
+                "id": image.id,
+                "image_url": upload["image_url"],
+                "upload_url": upload["upload_url"],
+                "fields": upload["fields"],
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
+# 댓글 이미지 직접 업로드 완료 확인 뷰
+class CommentImageConfirmView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, image_id):
+        try:
+            image = CommentImage.objects.select_related("comment").get(id=image_id)
+        except CommentImage.DoesNotExist:
+            return Response(
+                {"error": "Image not found"}, status=status.HTTP_404_NOT_FOUND
+            )
+        if image.comment.user_id != request.user.id:
+            raise PermissionDenied("댓글 이미지를 수정할 권한이 없습니다.")
+
+        if not image.is_uploaded:
+            if not storage.object_exists(storage.get_key(image.image)):
+                return Response(
+                    {"error": "Image has not been uploaded"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            image.is_uploaded = True
+            image.save(update_fields=["is_uploaded", "updated_at"])
+
+        return Response(CommentImageSerializer(image).data, status=status.HTTP_200_OK)
+
+
+# 댓글 목록 커서 페이지네이션 (작성순)
+class CommentPagination(KeysetPagination):
+    page_size = 20
+    ordering = ("created_at", "id")
+
+
 # 댓글 목록 조회 뷰
 class CommentListView(generics.ListAPIView):
     queryset = Comment.objects.all()
     serializer_class = CommentListSerializer
     permission_classes = [permissions.AllowAny]
+    pagination_class = CommentPagination
 
     def get_queryset(self):
         article_id = self.kwargs["article_id"]
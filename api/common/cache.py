@@ -0,0 +1,74 @@
+from common import metrics
+from common.logger import logger
+from django.core.cache import cache
+
+# 네임스페이스 버전 키 (버전 값은 만료되지 않도록 timeout=None으로 저장)
+NAMESPACE_VERSION_KEY = "cache_ns:{namespace}"
+
+
+def get_redis():
+    """
+    캐시 백엔드의 Redis 연결을 반환합니다.
+    Redis 캐시가 아닌 환경(로컬 메모리 캐시 등)에서는 None을 반환합니다.
+    """
+    try:
+        from django_redis import get_redis_connection
+
+        return get_redis_connection("default")
+    except (ImportError, NotImplementedError):
+        return None
+
+
+def get_namespace_version(namespace):
+    """네임스페이스의 현재 버전을 반환합니다. 처음 사용하는 네임스페이스는 1부터 시작합니다."""
+    key = NAMESPACE_VERSION_KEY.format(namespace=namespace)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, 1, None)
+        version = cache.get(key, 1)
+    return version
+
+
+def bump_namespace(namespace):
+    """
+    네임스페이스 버전을 1 올려 해당 네임스페이스의 캐시 전체를 무효화합니다.
+    이전 버전의 키는 삭제하지 않고 TTL로 만료되도록 둡니다.
+    """
+    key = NAMESPACE_VERSION_KEY.format(namespace=namespace)
+    metrics.increment(f"cache.{namespace}.bump")
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # 버전 키가 아직 없으면 2로 시작 (1은 이전에 만들어진 기본 버전)
+        if cache.add(key, 2, None):
+            return 2
+        return cache.incr(key)
+
+
+def versioned_key(namespace, *parts):
+    """네임스페이스 버전이 포함된 캐시 키를 만듭니다."""
+    version = get_namespace_version(namespace)
+    suffix = ":".join(str(part) for part in parts)
+    return f"{namespace}:v{version}:{suffix}"
+
+
+def get_cached(namespace, key):
+    """캐시 조회 결과와 함께 네임스페이스별 hit/miss 지표를 기록합니다."""
+    try:
+        value = cache.get(key)
+    except Exception as e:
+        logger.warning(f"캐시 조회 실패 ({key}): {e}")
+        value = None
+    metrics.increment(f"cache.{namespace}.{'miss' if value is None else 'hit'}")
+    return value
+
+
+async def aget_cached(namespace, key):
+    """get_cached의 비동기 버전. 캐시 서버 오류는 캐시 미스로 처리합니다."""
+    try:
+        value = await cache.aget(key)
+    except Exception as e:
+        logger.warning(f"캐시 조회 실패 ({key}): {e}")
+        value = None
+    metrics.increment(f"cache.{namespace}.{'miss' if value is None else 'hit'}")
+    return value
@@ -0,0 +1,73 @@
+import time
+
+from common.models import StorageTask
+from common.outbox import drain, recover_stale_tasks, retry_failed_tasks
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        "대기 중인 S3 작업(outbox)을 실행합니다. "
+        "(웹 프로세스에서 실패한 작업 재시도, --interval 지정 시 주기적으로 반복)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=0,
+            help="반복 주기(초). 0이면 한 번만 실행",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="한 번에 실행할 작업 수",
+        )
+        parser.add_argument(
+            "--stale-timeout",
+            type=int,
+            default=600,
+            help="running 상태로 이 시간(초) 이상 남은 작업은 다시 실행",
+        )
+        parser.add_argument(
+            "--failed",
+            action="store_true",
+            help="최대 시도 횟수를 넘어 실패한 작업을 출력하고 종료",
+        )
+        parser.add_argument(
+            "--retry-failed",
+            action="store_true",
+            help="실패한 작업을 다시 대기 상태로 돌린 뒤 실행",
+        )
+
+    def handle(self, *args, **options):
+        if options["failed"]:
+            self.list_failed()
+            return
+        if options["retry_failed"]:
+            self.stdout.write(f"실패한 S3 작업 {retry_failed_tasks()}개 재시도")
+
+        batch_size = options["batch_size"]
+        while True:
+            recovered = recover_stale_tasks(options["stale_timeout"])
+            executed = drain(batch_size)
+            self.stdout.write(
+                f"S3 작업 {executed}개 실행 (중단된 작업 {recovered}개 복구)"
+            )
+
+            if not options["interval"]:
+                break
+            # 처리할 작업이 남아 있으면 바로 다음 배치 실행
+            if executed < batch_size:
+                time.sleep(options["interval"])
+
+    def list_failed(self):
+        tasks = StorageTask.objects.filter(status="failed").order_by("id")
+        for task in tasks:
+            dest = f" -> {task.dest_key}" if task.dest_key else ""
+            self.stdout.write(
+                f"{task.id} {task.action} {task.key}{dest} "
+                f"({task.attempts}회, {task.updated_at:%Y-%m-%d %H:%M}): {task.last_error}"
+            )
+        self.stdout.write(f"실패한 S3 작업 {len(tasks)}개")
@@ -0,0 +1,81 @@
+import threading
+from collections import defaultdict
+
+# 프로세스 단위로 집계되는 간단한 카운터/히스토그램
+# (워커 프로세스마다 따로 집계되므로 /api/health/metrics/ 응답은 해당 워커 기준 값)
+_lock = threading.Lock()
+_counters = defaultdict(int)
+_histograms = {}
+
+# 히스토그램 버킷 상한값 (ms 등 관측 단위 기준)
+DEFAULT_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+def increment(name, value=1):
+    """카운터 값을 증가시킵니다."""
+    with _lock:
+        _counters[name] += value
+
+
+def observe(name, value, buckets=DEFAULT_BUCKETS):
+    """히스토그램에 관측값을 추가합니다."""
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = {
+                "count": 0,
+                "sum": 0.0,
+                "min": None,
+                "max": None,
+                "buckets": {bound: 0 for bound in buckets},
+            }
+        histogram["count"] += 1
+        histogram["sum"] += value
+        if histogram["min"] is None or value < histogram["min"]:
+            histogram["min"] = value
+        if histogram["max"] is None or value > histogram["max"]:
+            histogram["max"] = value
+        for bound in histogram["buckets"]:
+            if value <= bound:
+                histogram["buckets"][bound] += 1
+
+
+def get_counter(name):
+    with _lock:
+        return _counters.get(name, 0)
+
+
+def hit_ratio(name):
+    """`{name}.hit` / (`{name}.hit` + `{name}.miss`) 비율을 반환합니다."""
+    with _lock:
+        hits = _counters.get(f"{name}.hit", 0)
+        misses = _counters.get(f"{name}.miss", 0)
+    total = hits + misses
+    return hits / total if total else None
+
+
+def snapshot():
+    """현재까지 집계된 모든 지표를 반환합니다."""
+    with _lock:
+        counters = dict(_counters)
+        histograms = {
+            name: {
+                **histogram,
+                "buckets": {str(k): v for k, v in histogram["buckets"].items()},
+            }
+            for name, histogram in _histograms.items()
+        }
+
+    ratios = {}
+    for name in counters:
+        if name.endswith(".hit"):
+            prefix = name[: -len(".hit")]
+            ratios[f"{prefix}.hit_ratio"] = hit_ratio(prefix)
+    return {"counters": counters, "histograms": histograms, "ratios": ratios}
+
+
+def reset():
+    """모든 지표를 초기화합니다. (테스트용)"""
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
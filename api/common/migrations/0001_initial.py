@@ -0,0 +1,35 @@
+# Generated by Django 5.1 on 2026-10-18 16:29
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StorageTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(null=True)),
+                ('action', models.CharField(choices=[('move', '이동'), ('delete', '삭제')], max_length=10)),
+                ('key', models.CharField(max_length=500)),
+                ('dest_key', models.CharField(blank=True, default='', max_length=500)),
+                ('status', models.CharField(choices=[('pending', '대기'), ('running', '실행 중'), ('failed', '실패')], default='pending', max_length=10)),
+                ('attempts', models.IntegerField(default=0)),
+                ('next_run_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True, default='')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'next_run_at'], name='storage_task_status_idx')],
+            },
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 
 
 # Create your models here.
@@ -9,3 +10,45 @@ class TimeStampModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+STORAGE_TASK_ACTIONS = (
+    ("move", "이동"),
+    ("delete", "삭제"),
+)
+
+STORAGE_TASK_STATUS = (
+    ("pending", "대기"),
+    ("running", "실행 중"),
+    ("failed", "실패"),
+)
+
+
+# S3 작업 outbox (DB 변경과 같은 트랜잭션에 기록하고 커밋 후 워커가 처리)
+# 처리에 성공한 작업은 삭제됩니다.
+class StorageTask(TimeStampModel):
+    action = models.CharField(max_length=10, choices=STORAGE_TASK_ACTIONS)
+    # 대상 객체 키 (move는 원본 키)
+    key = models.CharField(max_length=500)
+    # move의 대상 키
+    dest_key = models.CharField(max_length=500, blank=True, default="")
+    status = models.CharField(
+        max_length=10, choices=STORAGE_TASK_STATUS, default="pending"
+    )
+    attempts = models.IntegerField(default=0)
+    # 다음 실행 가능 시각 (재시도 backoff)
+    next_run_at = models.DateTimeField(default=timezone.now)
+    # 실행을 시작한 시각 (워커가 죽어 running으로 남은 작업 감지용)
+    started_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default="")
+
+    class Meta:
+        indexes = [
+            # 워커가 실행할 작업을 찾는 조회용 인덱스
+            models.Index(
+                fields=["status", "next_run_at"], name="storage_task_status_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"StorageTask {self.id} ({self.action}, {self.status}) - {self.key}"
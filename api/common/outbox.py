@@ -0,0 +1,240 @@
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from common import metrics, storage
+from common.logger import logger
+from common.models import StorageTask
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+_executor = None
+_executor_lock = threading.Lock()
+
+# 이동 작업의 복사가 끝나고 원본을 삭제하기 전에 호출할 함수 (register_move_handler)
+_move_handlers = []
+
+
+def register_move_handler(handler):
+    """
+    이동 작업의 복사가 끝난 뒤, 원본을 삭제하기 전에 handler(tasks)를 호출하도록 등록합니다.
+    DB에 저장된 URL은 handler에서 새 경로로 바꾸므로 이동이 끝날 때까지 원본 URL이 유효하고,
+    handler가 실패하면 원본을 삭제하지 않고 재시도합니다.
+    """
+    if handler not in _move_handlers:
+        _move_handlers.append(handler)
+
+
+def get_executor():
+    """커밋 직후 outbox 작업을 바로 처리하는 스레드 풀을 반환합니다."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.STORAGE_OUTBOX_WORKERS,
+                thread_name_prefix="storage-outbox",
+            )
+    return _executor
+
+
+def enqueue_moves(moves, then=None):
+    """
+    (원본 키, 대상 키) 이동 작업을 outbox에 기록합니다.
+    then은 커밋 후 작업이 모두 성공하면 호출됩니다.
+    """
+    return enqueue(
+        [
+            StorageTask(action="move", key=source, dest_key=dest)
+            for source, dest in moves
+        ],
+        then=then,
+    )
+
+
+def enqueue_deletes(keys, then=None):
+    """S3 객체 삭제 작업을 outbox에 기록합니다."""
+    return enqueue(
+        [StorageTask(action="delete", key=key) for key in dict.fromkeys(keys)],
+        then=then,
+    )
+
+
+def enqueue(tasks, then=None):
+    """
+    작업을 현재 트랜잭션 안에서 저장하고, 커밋되면 워커 풀에 전달합니다.
+    트랜잭션이 롤백되면 작업도 함께 사라지므로 DB와 S3 상태가 어긋나지 않습니다.
+    """
+    if not tasks:
+        if then is not None:
+            transaction.on_commit(then)
+        return []
+    tasks = StorageTask.objects.bulk_create(tasks)
+    task_ids = [task.id for task in tasks]
+    transaction.on_commit(lambda: submit(task_ids, then))
+    return tasks
+
+
+def submit(task_ids, then=None):
+    if settings.STORAGE_OUTBOX_EAGER:
+        # 테스트 등에서 현재 스레드에서 바로 실행 (재시도는 워커 명령어가 처리)
+        run_tasks(task_ids, then)
+        return
+    get_executor().submit(run_tasks_in_thread, task_ids, then)
+
+
+def run_tasks_in_thread(task_ids, then=None):
+    try:
+        run_tasks(task_ids, then)
+    except Exception:
+        logger.exception(f"S3 작업 {task_ids} 실행 중 오류")
+    finally:
+        # 워커 스레드에서 연 DB 연결 정리
+        connections.close_all()
+
+
+def claim_tasks(queryset, limit=None):
+    """
+    실행 시각이 된 대기 작업을 running으로 변경하고 반환합니다.
+    SKIP LOCKED로 잠그므로 여러 워커가 같은 작업을 동시에 실행하지 않습니다.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        task_ids = queryset.filter(
+            status="pending", next_run_at__lte=now
+        ).select_for_update(skip_locked=True)
+        task_ids = list(task_ids.order_by("id").values_list("id", flat=True)[:limit])
+        StorageTask.objects.filter(id__in=task_ids).update(
+            status="running", started_at=now, attempts=F("attempts") + 1
+        )
+    return list(StorageTask.objects.filter(id__in=task_ids).order_by("id"))
+
+
+def run_tasks(task_ids, then=None):
+    """지정한 작업을 실행합니다. 모두 성공하면 then을 호출하고 True를 반환합니다."""
+    tasks = claim_tasks(StorageTask.objects.filter(id__in=task_ids))
+    succeeded = execute(tasks) == len(task_ids)
+    if succeeded and then is not None:
+        then()
+    return succeeded
+
+
+def drain(batch_size=100):
+    """실행 시각이 된 대기 작업을 batch_size개까지 실행하고, 실행한 작업 수를 반환합니다."""
+    tasks = claim_tasks(StorageTask.objects.all(), limit=batch_size)
+    execute(tasks)
+    return len(tasks)
+
+
+def execute(tasks):
+    """
+    move는 스레드 풀에서 동시에 복사하고 등록된 handler로 DB의 URL을 바꾼 뒤 원본을,
+    delete는 delete_objects로 묶어서 삭제합니다.
+    성공한 작업은 outbox에서 삭제하고, 실패한 작업은 재시도를 예약합니다.
+    """
+    moves = [task for task in tasks if task.action == "move"]
+    deletes = [task for task in tasks if task.action == "delete"]
+    errors = {}
+
+    if moves:
+        with ThreadPoolExecutor(
+            max_workers=min(len(moves), settings.AWS_S3_MAX_CONCURRENCY),
+            thread_name_prefix="storage-move",
+        ) as executor:
+            for task, error in zip(moves, executor.map(copy_for_move, moves)):
+                if error is not None:
+                    errors[task.id] = error
+
+    # 복사가 끝난 이동 작업의 URL을 DB에서 새 경로로 변경
+    copied = [task for task in moves if task.id not in errors]
+    if copied:
+        for handler in _move_handlers:
+            try:
+                handler(copied)
+            except Exception as e:
+                for task in copied:
+                    errors[task.id] = e
+                break
+
+    # 복사가 끝난 이동 작업의 원본과 삭제 작업을 함께 삭제
+    delete_tasks = [task for task in moves if task.id not in errors] + deletes
+    for i in range(0, len(delete_tasks), storage.DELETE_BATCH_SIZE):
+        chunk = delete_tasks[i : i + storage.DELETE_BATCH_SIZE]
+        try:
+            storage.delete_files([task.key for task in chunk])
+        except Exception as e:
+            for task in chunk:
+                errors[task.id] = e
+
+    done = [task.id for task in tasks if task.id not in errors]
+    StorageTask.objects.filter(id__in=done).delete()
+    for task in tasks:
+        if task.id in errors:
+            fail_task(task, errors[task.id])
+
+    metrics.increment("storage_outbox.succeeded", len(done))
+    return len(done)
+
+
+def copy_for_move(task):
+    """이동 작업의 복사 단계 (실패하면 예외를 반환)"""
+    try:
+        storage.copy_file(task.key, task.dest_key)
+    except Exception as e:
+        # 이전 시도에서 복사와 원본 삭제까지 끝난 경우는 성공으로 처리
+        try:
+            if storage.object_exists(task.dest_key) and not storage.object_exists(
+                task.key
+            ):
+                return None
+        except Exception:
+            pass
+        return e
+    return None
+
+
+def get_retry_delay(attempts):
+    """지수 backoff (base x 2^(시도 횟수 - 1), 최대값 제한) 에 jitter를 적용한 재시도 대기 시간(초)"""
+    delay = min(
+        settings.STORAGE_OUTBOX_RETRY_BASE_DELAY * 2 ** (attempts - 1),
+        settings.STORAGE_OUTBOX_RETRY_MAX_DELAY,
+    )
+    return delay * random.uniform(0.5, 1.0)
+
+
+def fail_task(task, error):
+    """실패한 작업을 재시도 대기 상태로 돌리거나, 최대 시도 횟수를 넘으면 failed로 처리합니다."""
+    logger.warning(f"S3 작업 {task.id} 실패 ({task.attempts}회): {error}")
+    metrics.increment("storage_outbox.error")
+    task.last_error = str(error)[:1000]
+
+    if task.attempts >= settings.STORAGE_OUTBOX_MAX_ATTEMPTS:
+        # 더 이상 재시도하지 않으므로 확인이 필요함 (drain_storage_outbox --failed로 조회)
+        logger.error(f"S3 작업 {task.id} 최종 실패 ({task.action} {task.key}): {error}")
+        metrics.increment("storage_outbox.failed")
+        task.status = "failed"
+        task.save(update_fields=["status", "last_error", "updated_at"])
+        return task
+
+    task.status = "pending"
+    task.next_run_at = timezone.now() + timedelta(
+        seconds=get_retry_delay(task.attempts)
+    )
+    task.save(update_fields=["status", "last_error", "next_run_at", "updated_at"])
+    return task
+
+
+def recover_stale_tasks(timeout):
+    """워커가 중간에 종료되어 running으로 남은 작업을 다시 대기 상태로 돌립니다."""
+    return StorageTask.objects.filter(
+        status="running", started_at__lt=timezone.now() - timedelta(seconds=timeout)
+    ).update(status="pending", next_run_at=timezone.now())
+
+
+def retry_failed_tasks():
+    """실패(failed)한 작업을 다시 대기 상태로 돌립니다. (시도 횟수 초기화)"""
+    return StorageTask.objects.filter(status="failed").update(
+        status="pending", attempts=0, next_run_at=timezone.now()
+    )
@@ -0,0 +1,166 @@
+import base64
+import json
+from datetime import datetime
+
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+
+
+class KeysetPagination(BasePagination):
+    """
+    (정렬 필드, id) 기준 키셋(커서) 페이지네이션.
+    OFFSET과 COUNT(*) 쿼리 없이 인덱스를 그대로 타기 때문에 몇 번째 페이지를 읽든 응답 시간이 일정합니다.
+    cursor 쿼리 파라미터가 있을 때만 동작하며(빈 값이면 첫 페이지),
+    없으면 fallback_pagination_class로 처리하거나 페이지네이션을 적용하지 않습니다.
+    """
+
+    page_size = 12
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    # (정렬 필드, 동률 처리 필드) - 두 필드는 같은 방향으로 정렬되어야 함
+    ordering = ("-created_at", "-id")
+    # cursor 파라미터가 없을 때 사용할 기존 페이지네이션 클래스
+    fallback_pagination_class = None
+    invalid_cursor_message = "유효하지 않은 커서입니다."
+    # PostgreSQL bigint 범위 (범위를 벗어난 값은 쿼리 실행 시 오류가 남)
+    max_integer = 2**63 - 1
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.fallback = None
+        if self.cursor_query_param not in request.query_params:
+            if self.fallback_pagination_class is None:
+                return None
+            self.fallback = self.fallback_pagination_class()
+            return self.fallback.paginate_queryset(queryset, request, view=view)
+
+        page_size = self.get_page_size(request)
+        position, reverse = self.decode_cursor(request)
+
+        field, tiebreak = [name.lstrip("-") for name in self.ordering]
+        if position is not None:
+            try:
+                position = (
+                    self.parse_cursor_value(queryset, field, position[0]),
+                    self.parse_cursor_value(queryset, tiebreak, position[1]),
+                )
+            except (TypeError, ValueError, ValidationError):
+                raise NotFound(self.invalid_cursor_message)
+        descending = self.ordering[0].startswith("-")
+        # 이전 페이지를 읽을 때는 정렬 방향을 뒤집어 커서 직전의 행부터 가져옴
+        if reverse:
+            descending = not descending
+
+        if position is not None:
+            value, pk = position
+            lookup = "lt" if descending else "gt"
+            # (field, id) < (value, pk) 조건. 앞쪽 범위 조건을 따로 두어 인덱스 범위 스캔이 가능하도록 함
+            queryset = queryset.filter(
+                Q(**{f"{field}__{lookup}e": value}),
+                Q(**{f"{field}__{lookup}": value}) | Q(**{f"{tiebreak}__{lookup}": pk}),
+            )
+
+        prefix = "-" if descending else ""
+        queryset = queryset.order_by(f"{prefix}{field}", f"{prefix}{tiebreak}")
+
+        # 다음 페이지 존재 여부 확인을 위해 1개를 더 조회
+        results = list(queryset[: page_size + 1])
+        has_more = len(results) > page_size
+        results = results[:page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        if self.fallback is not None:
+            return self.fallback.get_paginated_response(data)
+        return Response(
+            {
+                "next": self.get_next_cursor(),
+                "previous": self.get_previous_cursor(),
+                "results": data,
+            }
+        )
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_next_cursor(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_cursor(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, instance, reverse):
+        field, tiebreak = [name.lstrip("-") for name in self.ordering]
+        value = getattr(instance, field)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        payload = {"p": [value, getattr(instance, tiebreak)], "r": int(reverse)}
+        encoded = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(encoded).decode("ascii")
+
+    def decode_cursor(self, request):
+        """커서 문자열을 (정렬 값, id), 역방향 여부로 변환합니다."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            value, pk = payload["p"]
+            reverse = bool(payload.get("r", 0))
+        except (TypeError, ValueError, KeyError, UnicodeEncodeError):
+            raise NotFound(self.invalid_cursor_message)
+        return (value, pk), reverse
+
+    def get_cursor_field(self, queryset, name):
+        """정렬 필드의 모델 필드 (annotate된 값이면 그 output_field)"""
+        if name in queryset.query.annotations:
+            return queryset.query.annotations[name].output_field
+        return queryset.model._meta.get_field(name)
+
+    def parse_cursor_value(self, queryset, name, value):
+        """
+        커서에 담긴 값을 정렬 필드 타입으로 변환합니다.
+        조작된 커서(null, 리스트, 잘못된 시각, 범위를 벗어난 정수 등)는 ValueError를 발생시킵니다.
+        """
+        if value is None or isinstance(value, (bool, list, dict)):
+            raise ValueError(value)
+        field = self.get_cursor_field(queryset, name)
+        if isinstance(field, models.DateTimeField):
+            if not isinstance(value, str):
+                raise ValueError(value)
+            parsed = parse_datetime(value)
+            # encode_cursor는 항상 시간대가 포함된 isoformat을 사용함
+            if parsed is None or timezone.is_naive(parsed):
+                raise ValueError(value)
+            return parsed
+        if isinstance(field, models.IntegerField):
+            if not isinstance(value, int) or abs(value) > self.max_integer:
+                raise ValueError(value)
+            return value
+        return field.to_python(value)
@@ -0,0 +1,380 @@
+import random
+import re
+import string
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from common import metrics
+from common.logger import logger
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+# delete_objects 한 번에 삭제할 수 있는 최대 키 개수
+DELETE_BATCH_SIZE = 1000
+
+# 프로세스 전체에서 재사용하는 S3 클라이언트 (keep-alive 연결 풀 공유)
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_s3_client():
+    """
+    S3 클라이언트를 반환하는 함수. (테스트에서는 가짜 클라이언트로 대체)
+    boto3 클라이언트는 스레드 간에 공유해도 안전하므로 처음 호출될 때 한 번만 만들고,
+    요청마다 클라이언트와 연결 풀을 새로 만들지 않습니다.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            # 기본 세션은 스레드 안전하지 않으므로 전용 세션에서 생성
+            session = boto3.session.Session(
+                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                region_name=settings.AWS_S3_REGION_NAME,
+            )
+            _client = session.client(
+                "s3",
+                config=Config(
+                    max_pool_connections=settings.AWS_S3_MAX_POOL_CONNECTIONS,
+                    tcp_keepalive=True,
+                    connect_timeout=settings.AWS_S3_CONNECT_TIMEOUT,
+                    read_timeout=settings.AWS_S3_READ_TIMEOUT,
+                    retries={
+                        "max_attempts": settings.AWS_S3_MAX_ATTEMPTS,
+                        "mode": "standard",
+                    },
+                ),
+            )
+    return _client
+
+
+def get_bucket_name():
+    return settings.AWS_STORAGE_BUCKET_NAME
+
+
+class UrlCodec:
+    """
+    S3 객체 키 <-> URL 변환기.
+    버킷 URL과 정규 표현식을 한 번만 만들어 두고 재사용합니다. (get_codec()으로 사용)
+    """
+
+    # 임시 이미지 파일 이름 (generate_key: 영문/숫자 16자리 + .png)
+    TEMP_NAME_PATTERN = r"([A-Za-z0-9]{1,64}\.png)"
+    TEMP_NAME_MAX_LENGTH = 64 + len(".png")
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.temp_prefix = f"{base_url}temporary/"
+        self.temp_pattern = re.compile(
+            re.escape(self.temp_prefix) + self.TEMP_NAME_PATTERN
+        )
+        # 임시 이미지 URL 하나의 최대 길이 (스트리밍 변환 시 청크 경계에 남겨둘 길이)
+        self.max_temp_url_length = len(self.temp_prefix) + self.TEMP_NAME_MAX_LENGTH
+
+    def to_url(self, key):
+        return self.base_url + key
+
+    def to_key(self, url):
+        """S3 URL에서 객체 키를 추출합니다. (키가 전달되면 그대로 반환)"""
+        if url.startswith(self.base_url):
+            return url[len(self.base_url) :]
+        return url.split(self.base_url)[-1]
+
+    def article_prefix(self, article_id):
+        return f"{self.base_url}articles/{article_id}/"
+
+    def rewrite_temp_urls(self, content, article_id, names=None):
+        """
+        본문의 임시 이미지 URL을 게시글 이미지 URL로 한 번에 변환합니다.
+        names(파일 이름 집합)를 지정하면 해당 파일의 URL만 변환합니다.
+        """
+        if self.temp_prefix not in content:
+            return content
+        prefix = self.article_prefix(article_id)
+
+        def replace(match):
+            if names is not None and match.group(1) not in names:
+                return match.group(0)
+            return prefix + match.group(1)
+
+        return self.temp_pattern.sub(replace, content)
+
+    def iter_rewrite_temp_urls(self, chunks, article_id):
+        """
+        rewrite_temp_urls의 스트리밍 버전. 문자열 청크를 받아 변환된 청크를 반환합니다.
+        청크 경계에 걸친 URL도 변환되도록 마지막 max_temp_url_length 글자는 다음 청크와
+        합쳐서 처리합니다.
+        """
+        prefix = self.article_prefix(article_id)
+        carry = ""
+        for chunk in chunks:
+            buffer = carry + chunk
+            safe = len(buffer) - self.max_temp_url_length
+            if safe <= 0:
+                carry = buffer
+                continue
+
+            parts = []
+            position = 0
+            for match in self.temp_pattern.finditer(buffer):
+                if match.start() >= safe:
+                    break
+                parts.append(buffer[position : match.start()])
+                parts.append(prefix + match.group(1))
+                position = match.end()
+            cut = max(position, safe)
+            parts.append(buffer[position:cut])
+            carry = buffer[cut:]
+            yield "".join(parts)
+
+        if carry:
+            yield self.rewrite_temp_urls(carry, article_id)
+
+
+@lru_cache(maxsize=None)
+def get_codec():
+    """설정값으로 만든 UrlCodec을 반환합니다. (버킷/리전 설정이 바뀌면 다시 생성)"""
+    return UrlCodec(
+        f"https://{settings.AWS_STORAGE_BUCKET_NAME}.s3.{settings.AWS_S3_REGION_NAME}.amazonaws.com/"
+    )
+
+
+@receiver(setting_changed)
+def reset_codec(setting, **kwargs):
+    if setting in ("AWS_STORAGE_BUCKET_NAME", "AWS_S3_REGION_NAME"):
+        get_codec.cache_clear()
+
+
+def get_base_url():
+    return get_codec().base_url
+
+
+def get_url(key):
+    return get_codec().to_url(key)
+
+
+def get_key(url):
+    """S3 URL에서 객체 키를 추출합니다. (키가 전달되면 그대로 반환)"""
+    return get_codec().to_key(url)
+
+
+def generate_key(prefix):
+    """prefix 경로 아래에 임의의 파일 이름(16자리)으로 객체 키를 만듭니다."""
+    random_string = "".join(random.choices(string.ascii_letters + string.digits, k=16))
+    return f"{prefix}/{random_string}.png"
+
+
+@contextmanager
+def timed(operation):
+    """S3 요청 시간(s3.{operation}.latency_ms)과 실패 횟수(s3.{operation}.error)를 기록합니다."""
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        metrics.increment(f"s3.{operation}.error")
+        raise
+    finally:
+        metrics.observe(
+            f"s3.{operation}.latency_ms", (time.perf_counter() - started) * 1000
+        )
+
+
+def upload_file(file, key):
+    """파일을 S3에 업로드하고, 업로드된 파일의 URL을 반환합니다."""
+    try:
+        with timed("upload"):
+            get_s3_client().upload_fileobj(file, get_bucket_name(), key)
+    except Exception as e:
+        raise Exception(f"Could not upload file to S3: {str(e)}")
+    return get_url(key)
+
+
+def put_file(key, content, content_type):
+    """bytes 내용을 S3에 저장하고 URL을 반환합니다."""
+    try:
+        with timed("upload"):
+            get_s3_client().put_object(
+                Bucket=get_bucket_name(),
+                Key=key,
+                Body=content,
+                ContentType=content_type,
+                CacheControl=settings.AWS_S3_OBJECT_PARAMETERS["CacheControl"],
+            )
+    except Exception as e:
+        raise Exception(f"Could not upload file to S3: {str(e)}")
+    return get_url(key)
+
+
+def download_file(key):
+    """S3 객체 내용을 bytes로 반환합니다."""
+    try:
+        with timed("download"):
+            response = get_s3_client().get_object(Bucket=get_bucket_name(), Key=key)
+            return response["Body"].read()
+    except Exception as e:
+        raise Exception(f"Could not download file from S3: {str(e)}")
+
+
+def create_presigned_upload(prefix, content_type):
+    """
+    클라이언트가 Django 서버를 거치지 않고 S3에 직접 업로드할 수 있는 presigned POST를 만듭니다.
+    업로드 가능한 파일 형식과 크기는 S3 정책 조건으로 제한됩니다.
+    """
+    if content_type not in settings.AWS_S3_UPLOAD_CONTENT_TYPES:
+        raise ValueError(f"Unsupported content type: {content_type}")
+
+    key = generate_key(prefix)
+    with timed("presign"):
+        presigned = get_s3_client().generate_presigned_post(
+            Bucket=get_bucket_name(),
+            Key=key,
+            Fields={"Content-Type": content_type},
+            Conditions=[
+                {"Content-Type": content_type},
+                ["content-length-range", 1, settings.AWS_S3_UPLOAD_MAX_SIZE],
+            ],
+            ExpiresIn=settings.AWS_S3_PRESIGNED_EXPIRES,
+        )
+    return {
+        "key": key,
+        "image_url": get_url(key),
+        "upload_url": presigned["url"],
+        "fields": presigned["fields"],
+    }
+
+
+def object_exists(key):
+    """S3에 key 객체가 업로드되어 있는지 확인합니다."""
+    try:
+        with timed("head"):
+            get_s3_client().head_object(Bucket=get_bucket_name(), Key=key)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+            return False
+        raise
+    return True
+
+
+def get_object_size(key):
+    """S3 객체 크기(bytes)를 반환합니다. 객체가 없으면 None을 반환합니다."""
+    try:
+        with timed("head"):
+            response = get_s3_client().head_object(Bucket=get_bucket_name(), Key=key)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+            return None
+        raise
+    return response["ContentLength"]
+
+
+def get_object_sizes(keys):
+    """
+    키 목록의 객체 크기를 스레드 풀에서 동시에 head_object로 조회해 {키: 크기}로 반환합니다.
+    (없는 객체는 제외)
+    """
+    keys = list(dict.fromkeys(keys))
+    if not keys:
+        return {}
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(keys), settings.AWS_S3_MAX_CONCURRENCY),
+        thread_name_prefix="s3-head",
+    ) as executor:
+        sizes = executor.map(get_object_size, keys)
+        return {key: size for key, size in zip(keys, sizes) if size is not None}
+
+
+def copy_file(source_key, dest_key):
+    """
+    S3에서 source_key 경로의 파일을 dest_key 경로로 복사합니다.
+    """
+    try:
+        with timed("copy"):
+            get_s3_client().copy_object(
+                Bucket=get_bucket_name(),
+                CopySource={"Bucket": get_bucket_name(), "Key": source_key},
+                Key=dest_key,
+            )
+    except Exception as e:
+        raise Exception(f"Could not copy file on S3: {str(e)}")
+
+
+def copy_files(moves):
+    """
+    (source_key, dest_key) 목록을 스레드 풀에서 동시에 복사합니다.
+    하나라도 실패하면 예외가 전달됩니다.
+    """
+    if not moves:
+        return
+    if len(moves) == 1:
+        copy_file(*moves[0])
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(moves), settings.AWS_S3_MAX_CONCURRENCY),
+        thread_name_prefix="s3-copy",
+    ) as executor:
+        futures = [executor.submit(copy_file, source, dest) for source, dest in moves]
+        for future in futures:
+            future.result()
+
+
+def delete_file(file_key):
+    """
+    S3에서 file_key 경로의 파일을 삭제합니다.
+    """
+    try:
+        with timed("delete"):
+            get_s3_client().delete_object(Bucket=get_bucket_name(), Key=file_key)
+    except Exception as e:
+        raise Exception(f"Could not delete file from S3: {str(e)}")
+
+
+def delete_files(file_keys):
+    """
+    S3에서 여러 파일을 delete_objects로 삭제합니다. (요청 1회당 최대 1000개)
+    """
+    file_keys = list(dict.fromkeys(file_keys))
+    for i in range(0, len(file_keys), DELETE_BATCH_SIZE):
+        chunk = file_keys[i : i + DELETE_BATCH_SIZE]
+        try:
+            with timed("delete_many"):
+                response = get_s3_client().delete_objects(
+                    Bucket=get_bucket_name(),
+                    Delete={
+                        "Objects": [{"Key": key} for key in chunk],
+                        "Quiet": True,
+                    },
+                )
+        except Exception as e:
+            raise Exception(f"Could not delete files from S3: {str(e)}")
+
+        errors = response.get("Errors") or []
+        if errors:
+            metrics.increment("s3.delete_many.error")
+            failed = ", ".join(
+                f"{error.get('Key')} ({error.get('Code')})" for error in errors
+            )
+            raise Exception(f"Could not delete files from S3: {failed}")
+
+
+def delete_url(file_url, fail_silently=False):
+    """
+    S3 URL에 해당하는 파일을 삭제합니다.
+    fail_silently가 True면 실패해도 예외 대신 False를 반환합니다.
+    """
+    try:
+        delete_file(get_key(file_url))
+    except Exception as e:
+        if not fail_silently:
+            raise
+        logger.warning(f"Failed to delete file from S3: {str(e)}")
+        return False
+    return True
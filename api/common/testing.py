@@ -0,0 +1,108 @@
+import threading
+import time
+from unittest.mock import patch
+
+from botocore.exceptions import ClientError
+
+from .storage import DELETE_BATCH_SIZE, get_bucket_name
+
+
+class FakeS3Client:
+    """
+    테스트용 S3 client (버킷 내용을 메모리에 보관하고 API 호출 횟수를 기록)
+    copy_object는 실제 네트워크 요청처럼 지연시키고 동시 실행 수를 측정합니다.
+    """
+
+    def __init__(self, objects=(), copy_delay=0.05):
+        # 객체 키 -> 내용(bytes)
+        if isinstance(objects, dict):
+            self.objects = dict(objects)
+        else:
+            self.objects = {key: b"image" for key in objects}
+        self.copy_delay = copy_delay
+        self.calls = []
+        self._lock = threading.Lock()
+        self._running = 0
+        self.max_concurrent_copies = 0
+
+    def _record(self, name):
+        with self._lock:
+            self.calls.append(name)
+
+    def count(self, name):
+        return self.calls.count(name)
+
+    def upload_fileobj(self, Fileobj, Bucket, Key, ExtraArgs=None):
+        self._record("upload_fileobj")
+        self.objects[Key] = Fileobj.read()
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self._record("put_object")
+        self.objects[Key] = Body
+
+    def get_object(self, Bucket, Key):
+        self._record("get_object")
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        return {"Body": _Body(self.objects[Key])}
+
+    def head_object(self, Bucket, Key):
+        self._record("head_object")
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        return {"ContentLength": len(self.objects[Key])}
+
+    def copy_object(self, Bucket, CopySource, Key):
+        self._record("copy_object")
+        with self._lock:
+            self._running += 1
+            self.max_concurrent_copies = max(self.max_concurrent_copies, self._running)
+        try:
+            time.sleep(self.copy_delay)
+            with self._lock:
+                if CopySource["Key"] not in self.objects:
+                    raise ClientError({"Error": {"Code": "NoSuchKey"}}, "CopyObject")
+                self.objects[Key] = self.objects[CopySource["Key"]]
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def delete_object(self, Bucket, Key):
+        self._record("delete_object")
+        self.objects.pop(Key, None)
+
+    def delete_objects(self, Bucket, Delete):
+        self._record("delete_objects")
+        keys = [obj["Key"] for obj in Delete["Objects"]]
+        if len(keys) > DELETE_BATCH_SIZE:
+            raise ClientError({"Error": {"Code": "MalformedXML"}}, "DeleteObjects")
+        with self._lock:
+            for key in keys:
+                self.objects.pop(key, None)
+        return {}
+
+    def generate_presigned_post(
+        self, Bucket, Key, Fields=None, Conditions=None, ExpiresIn=3600
+    ):
+        self._record("generate_presigned_post")
+        return {
+            "url": f"https://{get_bucket_name()}.s3.amazonaws.com/",
+            "fields": {**(Fields or {}), "key": Key, "policy": "fake-policy"},
+        }
+
+
+class _Body:
+    def __init__(self, content):
+        self.content = content
+
+    def read(self):
+        return self.content
+
+
+def use_fake_s3(test_case, objects=(), **kwargs):
+    """테스트가 끝날 때까지 공용 S3 클라이언트를 FakeS3Client로 대체합니다."""
+    s3_client = FakeS3Client(objects=objects, **kwargs)
+    patcher = patch("common.storage.get_s3_client", return_value=s3_client)
+    patcher.start()
+    test_case.addCleanup(patcher.stop)
+    return s3_client
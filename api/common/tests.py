@@ -1,3 +1,250 @@
-from django.test import TestCase
+import threading
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import Mock, patch
 
-# Create your tests here.
+from common import metrics, outbox, storage
+from common.models import StorageTask
+from common.testing import use_fake_s3
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from users.models import User
+
+
+class MetricsTests(TestCase):
+
+    def setUp(self):
+        metrics.reset()
+
+    def test_counters_and_hit_ratio(self):
+        metrics.increment("cache.sample.hit", 3)
+        metrics.increment("cache.sample.miss")
+
+        self.assertEqual(metrics.get_counter("cache.sample.hit"), 3)
+        self.assertEqual(metrics.hit_ratio("cache.sample"), 0.75)
+        self.assertIsNone(metrics.hit_ratio("cache.unknown"))
+
+    def test_histogram(self):
+        for value in (3, 30, 300):
+            metrics.observe("sample.latency_ms", value)
+
+        histogram = metrics.snapshot()["histograms"]["sample.latency_ms"]
+        self.assertEqual(histogram["count"], 3)
+        self.assertEqual(histogram["min"], 3)
+        self.assertEqual(histogram["max"], 300)
+        self.assertEqual(histogram["buckets"]["5"], 1)
+        self.assertEqual(histogram["buckets"]["500"], 3)
+
+    def test_metrics_view_requires_admin(self):
+        client = APIClient()
+        url = reverse("metrics")
+        self.assertEqual(client.get(url).status_code, 401)
+
+        admin = User.objects.create_superuser(
+            username="admin",
+            email="admin@example.com",
+            password="testpassword",
+            nickname="admin",
+        )
+        client.force_authenticate(user=admin)
+        metrics.increment("cache.sample.hit")
+        response = client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["ratios"]["cache.sample.hit_ratio"], 1.0)
+
+
+class StorageTests(TestCase):
+    def setUp(self):
+        metrics.reset()
+        storage._client = None
+        self.addCleanup(setattr, storage, "_client", None)
+
+    @override_settings(AWS_S3_MAX_POOL_CONNECTIONS=32)
+    def test_client_is_shared_between_threads(self):
+        clients = []
+        threads = [
+            threading.Thread(target=lambda: clients.append(storage.get_s3_client()))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(client) for client in clients}), 1)
+        config = clients[0].meta.config
+        self.assertEqual(config.max_pool_connections, 32)
+        self.assertTrue(config.tcp_keepalive)
+
+    def test_operations_record_latency_and_errors(self):
+        s3_client = Mock()
+        s3_client.delete_object.side_effect = [None, RuntimeError("denied")]
+
+        with patch("common.storage.get_s3_client", return_value=s3_client):
+            storage.delete_file("articles/1/a.png")
+            self.assertFalse(
+                storage.delete_url(
+                    storage.get_url("articles/1/b.png"), fail_silently=True
+                )
+            )
+
+        s3_client.delete_object.assert_called_with(
+            Bucket=storage.get_bucket_name(), Key="articles/1/b.png"
+        )
+        histogram = metrics.snapshot()["histograms"]["s3.delete.latency_ms"]
+        self.assertEqual(histogram["count"], 2)
+        self.assertEqual(metrics.get_counter("s3.delete.error"), 1)
+
+
+@override_settings(AWS_STORAGE_BUCKET_NAME="hunsu", AWS_S3_REGION_NAME="ap-northeast-2")
+class UrlCodecTests(TestCase):
+    base_url = "https://hunsu.s3.ap-northeast-2.amazonaws.com/"
+
+    def test_key_url_conversion(self):
+        codec = storage.get_codec()
+
+        self.assertIs(storage.get_codec(), codec)
+        self.assertEqual(
+            storage.get_url("articles/1/a.png"), self.base_url + "articles/1/a.png"
+        )
+        self.assertEqual(
+            storage.get_key(self.base_url + "articles/1/a.png"), "articles/1/a.png"
+        )
+        self.assertEqual(storage.get_key("articles/1/a.png"), "articles/1/a.png")
+
+        with override_settings(AWS_STORAGE_BUCKET_NAME="other"):
+            self.assertEqual(
+                storage.get_base_url(), "https://other.s3.ap-northeast-2.amazonaws.com/"
+            )
+
+    def test_rewrite_temp_urls(self):
+        names = [f"img{i:013d}.png" for i in range(50)]
+        content = "".join(
+            f'본문 {i} <img src="{self.base_url}temporary/{name}">'
+            for i, name in enumerate(names)
+        )
+        # 다른 버킷 URL은 변환하지 않음
+        content += '<img src="https://other.example.com/temporary/abc.png">'
+        expected = (
+            "".join(
+                f'본문 {i} <img src="{self.base_url}articles/7/{name}">'
+                for i, name in enumerate(names)
+            )
+            + '<img src="https://other.example.com/temporary/abc.png">'
+        )
+
+        codec = storage.get_codec()
+        self.assertEqual(codec.rewrite_temp_urls(content, 7), expected)
+        # 청크 경계가 URL 중간에 걸려도 결과가 같음
+        for size in (1, 7, 64, 1000):
+            chunks = [content[i : i + size] for i in range(0, len(content), size)]
+            self.assertEqual("".join(codec.iter_rewrite_temp_urls(chunks, 7)), expected)
+
+
+@override_settings(STORAGE_OUTBOX_EAGER=True, STORAGE_OUTBOX_MAX_ATTEMPTS=2)
+class StorageOutboxTests(TestCase):
+    def test_tasks_run_only_after_commit(self):
+        s3_client = use_fake_s3(self, ["a.png"], copy_delay=0)
+        then = Mock()
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            outbox.enqueue_moves([("a.png", "b.png")], then=then)
+        self.assertEqual(s3_client.calls, [])
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(set(s3_client.objects), {"b.png"})
+        self.assertFalse(StorageTask.objects.exists())
+        then.assert_called_once_with()
+
+    def test_move_retry_is_idempotent(self):
+        # 이전 시도에서 복사와 원본 삭제까지 끝났지만 작업 삭제 전에 중단된 경우
+        s3_client = use_fake_s3(self, ["b.png"], copy_delay=0)
+        StorageTask.objects.create(action="move", key="a.png", dest_key="b.png")
+
+        self.assertEqual(outbox.drain(), 1)
+
+        self.assertEqual(set(s3_client.objects), {"b.png"})
+        self.assertFalse(StorageTask.objects.exists())
+
+    def test_failed_task_is_retried_with_backoff(self):
+        s3_client = use_fake_s3(self, copy_delay=0)
+        with self.captureOnCommitCallbacks(execute=True):
+            outbox.enqueue_moves([("a.png", "b.png")])
+
+        task = StorageTask.objects.get()
+        self.assertEqual((task.status, task.attempts), ("pending", 1))
+        self.assertGreater(task.next_run_at, timezone.now())
+        # 재시도 시각 전에는 실행하지 않음
+        self.assertEqual(outbox.drain(), 0)
+
+        # 원본이 올라온 뒤 워커가 재시도
+        s3_client.objects["a.png"] = b"image"
+        StorageTask.objects.update(next_run_at=timezone.now())
+        out = StringIO()
+        call_command("drain_storage_outbox", stdout=out)
+
+        self.assertIn("S3 작업 1개 실행", out.getvalue())
+        self.assertEqual(set(s3_client.objects), {"b.png"})
+        self.assertFalse(StorageTask.objects.exists())
+
+    def test_task_fails_after_max_attempts(self):
+        use_fake_s3(self, copy_delay=0)
+        task = StorageTask.objects.create(
+            action="move", key="a.png", dest_key="b.png", attempts=1
+        )
+
+        outbox.drain()
+
+        task.refresh_from_db()
+        self.assertEqual((task.status, task.attempts), ("failed", 2))
+
+    def test_source_is_kept_when_move_handler_fails(self):
+        s3_client = use_fake_s3(self, ["a.png"], copy_delay=0)
+        handler = Mock(side_effect=RuntimeError("DB 오류"))
+        with patch.object(outbox, "_move_handlers", [handler]):
+            with self.captureOnCommitCallbacks(execute=True):
+                outbox.enqueue_moves([("a.png", "b.png")])
+
+        # URL을 바꾸지 못했으므로 원본을 삭제하지 않고 재시도
+        handler.assert_called_once()
+        self.assertIn("a.png", s3_client.objects)
+        task = StorageTask.objects.get()
+        self.assertEqual((task.status, task.attempts), ("pending", 1))
+        self.assertIn("DB 오류", task.last_error)
+
+    def test_failed_tasks_are_listed_and_retried(self):
+        s3_client = use_fake_s3(self, copy_delay=0)
+        StorageTask.objects.create(
+            action="move", key="a.png", dest_key="b.png", attempts=1
+        )
+        metrics.reset()
+        with self.assertLogs("common.logger", level="ERROR"):
+            outbox.drain()
+        self.assertEqual(metrics.get_counter("storage_outbox.failed"), 1)
+
+        out = StringIO()
+        call_command("drain_storage_outbox", "--failed", stdout=out)
+        self.assertIn("move a.png -> b.png", out.getvalue())
+        self.assertIn("실패한 S3 작업 1개", out.getvalue())
+
+        s3_client.objects["a.png"] = b"image"
+        out = StringIO()
+        call_command("drain_storage_outbox", "--retry-failed", stdout=out)
+        self.assertIn("실패한 S3 작업 1개 재시도", out.getvalue())
+        self.assertEqual(set(s3_client.objects), {"b.png"})
+        self.assertFalse(StorageTask.objects.exists())
+
+    def test_recover_stale_tasks(self):
+        StorageTask.objects.create(
+            action="delete",
+            key="a.png",
+            status="running",
+            started_at=timezone.now() - timedelta(minutes=20),
+        )
+
+        self.assertEqual(outbox.recover_stale_tasks(600), 1)
+        self.assertEqual(StorageTask.objects.get().status, "pending")
@@ -4,4 +4,5 @@ from . import views
 
 urlpatterns = [
     path("", views.HealthCheck.as_view()),
+    path("metrics/", views.MetricsView.as_view(), name="metrics"),
 ]
@@ -1,8 +1,9 @@
+from common import metrics
 from common.logger import logger
 from django.shortcuts import render
 from rest_framework import status
 from rest_framework.generics import GenericAPIView
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAdminUser
 from rest_framework.response import Response
 
 
@@ -12,3 +13,11 @@ class HealthCheck(GenericAPIView):
     def get(self, request, *args, **kwargs):
         logger.info("GET /api/health")
         return Response(data={"Message": "HELLO"}, status=status.HTTP_200_OK)
+
+
+# 프로세스 단위 지표 조회 (캐시 hit ratio, 네임스페이스 무효화 횟수 등)
+class MetricsView(GenericAPIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response(data=metrics.snapshot(), status=status.HTTP_200_OK)
@@ -233,6 +233,38 @@ AWS_S3_OBJECT_PARAMETERS = {
     "CacheControl": "max-age=86400",
 }
 
+# 공용 S3 클라이언트 설정 (common.storage)
+# 연결 풀은 프로세스 전체에서 공유하므로 동시 요청 스레드 수 x 동시 복사 수를 고려
+AWS_S3_MAX_POOL_CONNECTIONS = int(os.getenv("AWS_S3_MAX_POOL_CONNECTIONS", 50))
+# 요청 하나에서 동시에 실행할 S3 복사 수
+AWS_S3_MAX_CONCURRENCY = 10
+AWS_S3_CONNECT_TIMEOUT = 5  # 초
+AWS_S3_READ_TIMEOUT = 30  # 초
+AWS_S3_MAX_ATTEMPTS = 3
+# 클라이언트 직접 업로드(presigned POST) 설정
+AWS_S3_PRESIGNED_EXPIRES = 60 * 10  # 10분
+AWS_S3_UPLOAD_MAX_SIZE = 10 * 1024 * 1024  # 10MB
+AWS_S3_UPLOAD_CONTENT_TYPES = ("image/png", "image/jpeg", "image/gif", "image/webp")
+
+# 게시글 이미지 크기별 WebP 변환 설정 (articles.image_variants)
+ARTICLE_IMAGE_VARIANT_WIDTHS = (320, 640, 1280)
+# 게시글 목록 thumbnail_image로 사용할 너비
+ARTICLE_IMAGE_THUMBNAIL_WIDTH = 320
+ARTICLE_IMAGE_WEBP_QUALITY = 80
+ARTICLE_IMAGE_WORKERS = int(os.getenv("ARTICLE_IMAGE_WORKERS", 2))
+# True면 변환 작업을 워커 풀 대신 호출한 스레드에서 바로 실행 (테스트용)
+ARTICLE_IMAGE_VARIANTS_EAGER = False
+# 게시글에 연결되지 않은 임시 이미지 보관 시간 (cleanup_temporary_article_images)
+ARTICLE_TEMP_IMAGE_MAX_AGE_HOURS = 24
+
+# S3 작업 outbox 설정 (게시글 이미지 이동/삭제를 커밋 후 처리)
+STORAGE_OUTBOX_WORKERS = int(os.getenv("STORAGE_OUTBOX_WORKERS", 4))
+STORAGE_OUTBOX_MAX_ATTEMPTS = 8
+STORAGE_OUTBOX_RETRY_BASE_DELAY = 2  # 초
+STORAGE_OUTBOX_RETRY_MAX_DELAY = 600  # 초
+# True면 작업을 워커 풀 대신 커밋한 스레드에서 바로 실행 (테스트용)
+STORAGE_OUTBOX_EAGER = False
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.1/topics/i18n/
@@ -298,3 +330,49 @@ CACHES = {
         },
     }
 }
+
+# 알림 타임라인 설정 (Redis에 사용자별 최근 알림 ID와 읽지 않은 알림 수 저장)
+NOTIFICATION_TIMELINE_SIZE = 100  # 사용자별로 Redis에 보관할 최근 알림 수
+NOTIFICATION_TIMELINE_TTL = 60 * 60 * 24 * 7  # 7일 (만료되면 DB에서 다시 채움)
+NOTIFICATION_SUMMARY_SIZE = 10  # 요약 API 기본 알림 수
+NOTIFICATION_BULK_DELETE_SIZE = 1000  # 한 번에 삭제할 수 있는 알림 수
+# 읽은 알림 보관 기간 (purge_read_notifications 명령으로 정리)
+NOTIFICATION_RETENTION_DAYS = int(os.getenv("NOTIFICATION_RETENTION_DAYS", 30))
+NOTIFICATION_RETENTION_BATCH_SIZE = 1000  # 한 트랜잭션에서 삭제할 알림 수
+# 묶음 알림 설정: 같은 게시글에 대한 같은 종류의 알림을 시간 구간마다 한 행으로 모음
+NOTIFICATION_COALESCE_VERBS = ("like", "comment")  # 빈 값이면 이벤트마다 알림 생성
+NOTIFICATION_COALESCE_WINDOW = 60 * 60  # 초, 이 구간 안의 이벤트를 한 알림으로 묶음
+NOTIFICATION_COALESCE_ACTORS = 3  # 묶음 알림에 보관할 최근 actor 수
+# 알림 저장 (댓글/좋아요/신고 트랜잭션이 커밋된 뒤 알림을 모아서 저장)
+# 0이면 커밋한 스레드에서 바로 저장하고, 1 이상이면 그 수만큼의 스레드 풀에서 저장
+NOTIFICATION_DISPATCH_WORKERS = int(os.getenv("NOTIFICATION_DISPATCH_WORKERS", 0))
+# 알림 SSE 스트림 설정
+NOTIFICATION_STREAM_HEARTBEAT = 15  # 초, 알림이 없을 때 연결 유지용 주석 전송 주기
+NOTIFICATION_STREAM_MAX_AGE = 60 * 5  # 초, 지나면 연결을 닫고 Last-Event-ID로 재연결
+NOTIFICATION_STREAM_RETRY_MS = 3000  # 클라이언트 재연결 대기 시간(ms)
+NOTIFICATION_STREAM_QUEUE_SIZE = 100  # 연결별로 쌓아둘 수 있는 알림 수
+
+# 게시글 검색 백엔드 (None이면 n-gram 역색인 사용)
+# - articles.search.ngrams.NgramSearchBackend: 한국어 부분 문자열 검색 (ArticleNgram 테이블)
+# - articles.search.backends.PostgresSearchBackend: tsvector 전문 검색
+# - articles.search.backends.InMemorySearchBackend: 프로세스 내부 색인 (테스트/개발용)
+# 백엔드를 바꾼 뒤에는 rebuild_article_search_index 명령으로 색인을 다시 만들어야 함
+ARTICLE_SEARCH_BACKEND = None
+
+# AI 훈수 생성 작업 설정
+AI_HUNSOO_MAX_CONCURRENCY = int(os.getenv("AI_HUNSOO_MAX_CONCURRENCY", 4))
+AI_HUNSOO_MAX_ATTEMPTS = 5
+AI_HUNSOO_RETRY_BASE_DELAY = 2  # 초
+AI_HUNSOO_RETRY_MAX_DELAY = 300  # 초
+# True면 작업을 워커 풀 대신 호출한 스레드에서 바로 실행 (테스트용)
+AI_HUNSOO_JOBS_EAGER = False
+
+# OpenAI 클라이언트 설정 (연결 풀은 AI 훈수 동시 실행 수에 맞춤)
+OPENAI_MODEL = "gpt-4o-mini"
+OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", 30))  # 초
+OPENAI_CONNECT_TIMEOUT = float(os.getenv("OPENAI_CONNECT_TIMEOUT", 5))  # 초
+OPENAI_MAX_CONNECTIONS = AI_HUNSOO_MAX_CONCURRENCY
+OPENAI_KEEPALIVE_EXPIRY = 60  # 초
+OPENAI_MAX_RETRIES = 0
+# 같은 (프롬프트, 모델)에 대한 AI 응답 캐시 유지 시간
+AI_HUNSOO_RESPONSE_CACHE_TIMEOUT = 60 * 60 * 24 * 7
@@ -0,0 +1,78 @@
+from common import metrics
+from django.db import connection, transaction
+
+from . import timeline
+from .models import Notification
+
+# post_delete 시그널 수신자가 있으면 QuerySet.delete()는 행을 먼저 조회한 뒤 지우므로
+# 여러 알림 삭제는 DELETE ... RETURNING 한 번으로 처리하고 Redis 값은 결과로 맞춤
+_DELETE_FOR_USER = """
+DELETE FROM {table}
+WHERE recipient_id = %s AND id = ANY(%s)
+RETURNING read
+"""
+
+# 다른 트랜잭션이 잠근 행은 건너뛰고, 오래된 순으로 batch_size개씩 삭제
+_DELETE_READ_BEFORE = """
+DELETE FROM {table}
+WHERE id IN (
+    SELECT id FROM {table}
+    WHERE read AND timestamp < %s
+    ORDER BY timestamp
+    LIMIT %s
+    FOR UPDATE SKIP LOCKED
+)
+RETURNING recipient_id
+"""
+
+
+def _execute(sql, params):
+    with connection.cursor() as cursor:
+        cursor.execute(sql.format(table=Notification._meta.db_table), params)
+        return cursor.fetchall()
+
+
+def mark_read(user_id, up_to_id=None):
+    """
+    사용자의 읽지 않은 알림을 UPDATE 한 번으로 읽음 처리하고 변경된 알림 수를 반환합니다.
+    up_to_id를 전달하면 그 ID 이하의 알림만 읽음 처리합니다.
+    """
+    notifications = Notification.objects.filter(recipient_id=user_id, read=False)
+    if up_to_id is not None:
+        notifications = notifications.filter(id__lte=up_to_id)
+    updated = notifications.update(read=True)
+    if updated:
+        transaction.on_commit(lambda: timeline.adjust_unread(user_id, -updated))
+    metrics.increment("notification.bulk.read", updated)
+    return updated
+
+
+def delete(user_id, notification_ids):
+    """사용자의 알림 중 notification_ids에 해당하는 알림을 삭제하고 삭제된 알림 수를 반환합니다."""
+    rows = _execute(_DELETE_FOR_USER, [user_id, list(notification_ids)])
+    if rows:
+        unread = sum(1 for (read,) in rows if not read)
+
+        def update_timeline():
+            timeline.invalidate([user_id])
+            timeline.adjust_unread(user_id, -unread)
+
+        transaction.on_commit(update_timeline)
+    metrics.increment("notification.bulk.deleted", len(rows))
+    return len(rows)
+
+
+def delete_read_before(cutoff, batch_size):
+    """
+    cutoff 이전에 생성된 읽은 알림을 batch_size개씩 나눠 삭제합니다.
+    배치마다 트랜잭션을 따로 커밋해 잠금을 오래 잡지 않으며, 배치별 삭제 수를 반환(yield)합니다.
+    """
+    while True:
+        with transaction.atomic():
+            rows = _execute(_DELETE_READ_BEFORE, [cutoff, batch_size])
+        if not rows:
+            return
+        # 읽은 알림이므로 읽지 않은 알림 수는 그대로 두고 타임라인만 다시 채움
+        timeline.invalidate({recipient_id for (recipient_id,) in rows})
+        metrics.increment("notification.retention.deleted", len(rows))
+        yield len(rows)
@@ -0,0 +1,82 @@
+import json
+
+from common import metrics
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from .models import Notification
+
+# 같은 (recipient, verb, article, 시간 구간)의 묶음 알림이 있으면 actor 수와 최근 actor를 갱신하고,
+# 없으면 새로 만듭니다. 이미 최근 actor에 포함된 사용자의 이벤트(좋아요 취소 후 다시 좋아요 등)는
+# 세지 않습니다. (xmax = 0)이면 새로 INSERT된 행입니다.
+# 갱신할 때는 timestamp만 바꾸고 created_at(목록 페이지네이션 기준)은 그대로 둡니다.
+_UPSERT = """
+INSERT INTO {table} AS n (
+    recipient_id, actor_id, verb, content_type_id, object_id, article_id,
+    read, timestamp, created_at, is_admin, coalesce_window, actor_count, latest_actors
+)
+VALUES (%s, %s, %s, %s, %s, %s, false, %s, %s, false, %s, 1, %s::jsonb)
+ON CONFLICT (recipient_id, verb, article_id, coalesce_window)
+    WHERE coalesce_window IS NOT NULL
+DO UPDATE SET
+    actor_id = EXCLUDED.actor_id,
+    content_type_id = EXCLUDED.content_type_id,
+    object_id = EXCLUDED.object_id,
+    timestamp = EXCLUDED.timestamp,
+    read = false,
+    actor_count = n.actor_count + 1,
+    latest_actors = EXCLUDED.latest_actors || (
+        SELECT coalesce(jsonb_agg(actor ORDER BY position), '[]'::jsonb)
+        FROM (
+            SELECT actor, position
+            FROM jsonb_array_elements(n.latest_actors)
+                WITH ORDINALITY AS previous(actor, position)
+            ORDER BY position
+            LIMIT %s
+        ) AS previous
+    )
+WHERE NOT n.latest_actors @> EXCLUDED.latest_actors
+RETURNING id, (xmax = 0) AS created
+"""
+
+
+def is_coalesced(verb):
+    return verb in settings.NOTIFICATION_COALESCE_VERBS
+
+
+def get_window(timestamp):
+    """시각이 속한 묶음 구간 번호"""
+    return int(timestamp.timestamp()) // settings.NOTIFICATION_COALESCE_WINDOW
+
+
+def upsert(recipient_id, actor_id, verb, content_type_id, object_id, article_id):
+    """
+    묶음 알림에 이벤트 하나를 upsert 한 번으로 더하고 (알림 id, 새로 생성 여부)를 반환합니다.
+    actor가 이미 최근 actor에 있어 변경하지 않았으면 None을 반환합니다.
+    """
+    now = timezone.now()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            _UPSERT.format(table=Notification._meta.db_table),
+            [
+                recipient_id,
+                actor_id,
+                verb,
+                content_type_id,
+                object_id,
+                article_id,
+                now,
+                now,
+                get_window(now),
+                json.dumps([actor_id]),
+                settings.NOTIFICATION_COALESCE_ACTORS - 1,
+            ],
+        )
+        row = cursor.fetchone()
+    if row is None:
+        return None
+    metrics.increment(
+        "notification.coalesce.created" if row[1] else "notification.coalesce.merged"
+    )
+    return row
@@ -0,0 +1,242 @@
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from common import metrics
+from common.logger import logger
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import connections, transaction
+from django.db.models import Q
+
+from . import coalescing, stream, timeline
+from .models import Notification
+
+
+@dataclass(frozen=True)
+class Event:
+    """저장할 알림 하나. key가 같은 이벤트는 알림 테이블의 unique 제약과 같은 기준으로 중복입니다."""
+
+    verb: str
+    content_type_id: int
+    object_id: int
+    article_id: int
+    recipient_id: int | None = None
+    actor_id: int | None = None
+    is_admin: bool = False
+
+    @property
+    def key(self):
+        return get_key(self)
+
+    @property
+    def is_coalesced(self):
+        return self.actor_id is not None and coalescing.is_coalesced(self.verb)
+
+    def to_notification(self):
+        return Notification(
+            recipient_id=self.recipient_id,
+            actor_id=self.actor_id,
+            verb=self.verb,
+            content_type_id=self.content_type_id,
+            object_id=self.object_id,
+            article_id=self.article_id,
+            is_admin=self.is_admin,
+        )
+
+
+class Marker:
+    """
+    이벤트를 등록한 트랜잭션(세이브포인트)에 함께 등록하는 빈 on_commit 콜백.
+    롤백되면 Django가 콜백을 버리므로 Marker도 사라지고, 그 이벤트는 저장하지 않습니다.
+    """
+
+    def __call__(self):
+        pass
+
+
+class Batch:
+    """트랜잭션 하나에서 발생한 알림 이벤트 (같은 이벤트는 한 번만 저장)"""
+
+    def __init__(self, using):
+        self.using = using
+        # (이벤트, Marker 약한 참조)
+        self.events = []
+        self.flushed = False
+
+    def add(self, event):
+        marker = Marker()
+        transaction.on_commit(marker, using=self.using)
+        self.events.append((event, weakref.ref(marker)))
+
+    def flush(self):
+        self.flushed = True
+        events = {}
+        for event, marker in self.events:
+            if marker() is not None:
+                events.setdefault(event.key, event)
+        submit(list(events.values()))
+
+
+# 연결(DB alias)별 현재 Batch의 약한 참조. Batch는 on_commit에 등록한 flush 콜백만 붙잡고 있으므로
+# 트랜잭션이 롤백되어 콜백이 버려지면 Batch도 사라지고 다음 이벤트는 새 Batch에 모입니다.
+_local = threading.local()
+
+
+def _get_batch(connection):
+    """현재 트랜잭션의 Batch를 반환합니다. 없거나 이미 저장한 Batch면 새로 만듭니다."""
+    if not hasattr(_local, "batches"):
+        _local.batches = {}
+    ref = _local.batches.get(connection.alias)
+    batch = ref() if ref is not None else None
+    if batch is None or batch.flushed:
+        batch = Batch(connection.alias)
+        _local.batches[connection.alias] = weakref.ref(batch)
+        transaction.on_commit(batch.flush, using=connection.alias)
+    return batch
+
+
+def notify(verb, target, article_id, recipient_id=None, actor_id=None, is_admin=False):
+    """
+    알림 이벤트를 등록합니다. 트랜잭션 안에서는 모아 두었다가 커밋된 뒤 한 번에 저장하고,
+    롤백되면 버립니다. 트랜잭션 밖에서는 바로 저장합니다.
+    """
+    event = Event(
+        verb=verb,
+        content_type_id=ContentType.objects.get_for_model(target).id,
+        object_id=target.pk,
+        article_id=article_id,
+        recipient_id=recipient_id,
+        actor_id=actor_id,
+        is_admin=is_admin,
+    )
+    connection = transaction.get_connection()
+    if not connection.in_atomic_block:
+        submit([event])
+        return
+    _get_batch(connection).add(event)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    알림 저장용 스레드 풀을 반환합니다. (NOTIFICATION_DISPATCH_WORKERS가 1 이상일 때만 사용)
+    알림 저장/타임라인 반영/발행이 응답 시간에 포함되지 않는 대신, 프로세스가 종료되면
+    아직 저장하지 않은 알림은 사라집니다.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.NOTIFICATION_DISPATCH_WORKERS,
+                thread_name_prefix="notification",
+            )
+    return _executor
+
+
+def submit(events):
+    if not events:
+        return
+    if not settings.NOTIFICATION_DISPATCH_WORKERS:
+        # 기본값: 커밋한 스레드에서 바로 저장
+        run(events)
+        return
+    get_executor().submit(run_in_thread, events)
+
+
+def run(events):
+    # 원래 트랜잭션은 이미 커밋되었으므로 알림 저장 실패는 기록만 하고 요청은 실패시키지 않음
+    try:
+        save(events)
+    except Exception:
+        metrics.increment("notification.dispatch.error")
+        logger.exception(f"알림 {len(events)}개 저장 중 오류")
+
+
+def run_in_thread(events):
+    try:
+        run(events)
+    finally:
+        # 워커 스레드에서 연 DB 연결 정리
+        connections.close_all()
+
+
+def get_key(notification):
+    return (
+        notification.recipient_id,
+        notification.actor_id,
+        notification.verb,
+        notification.content_type_id,
+        notification.object_id,
+    )
+
+
+def save(events):
+    """
+    커밋된 트랜잭션의 알림 이벤트를 저장하고, 새로 만든 알림을 타임라인/스트림에 반영합니다.
+    일반 알림은 bulk_create 한 번으로 저장하며 이미 있는 알림은 unique 제약으로 무시합니다.
+    묶음 알림(NOTIFICATION_COALESCE_VERBS)은 이벤트마다 upsert 합니다.
+    """
+    # 묶음 알림 id -> 새로 생성 여부
+    coalesced = {}
+    for event in events:
+        if event.is_coalesced:
+            result = coalescing.upsert(
+                event.recipient_id,
+                event.actor_id,
+                event.verb,
+                event.content_type_id,
+                event.object_id,
+                event.article_id,
+            )
+            if result is not None:
+                coalesced[result[0]] = result[1]
+
+    notifications = [
+        event.to_notification() for event in events if not event.is_coalesced
+    ]
+    query = Q(id__in=list(coalesced))
+    if notifications:
+        Notification.objects.bulk_create(notifications, ignore_conflicts=True)
+        # ignore_conflicts를 사용하면 생성된 id를 돌려받지 못하므로 다시 조회
+        for notification in notifications:
+            query |= Q(
+                recipient_id=notification.recipient_id,
+                actor_id=notification.actor_id,
+                verb=notification.verb,
+                content_type_id=notification.content_type_id,
+                object_id=notification.object_id,
+                coalesce_window__isnull=True,
+            )
+    if not coalesced and not notifications:
+        return
+
+    # 저장 시각이 같은 행만 이번에 새로 만든 알림 (나머지는 이미 있던 알림)
+    timestamps = {get_key(n): n.timestamp for n in notifications}
+    created = 0
+    for notification in (
+        Notification.objects.select_related("actor", "article", "content_type")
+        .filter(query)
+        .order_by("id")
+    ):
+        if notification.id in coalesced:
+            notification_committed(notification, coalesced[notification.id])
+        elif timestamps.get(get_key(notification)) == notification.timestamp:
+            notification_committed(notification)
+        else:
+            continue
+        created += 1
+    metrics.increment("notification.dispatch.created", created)
+
+
+def notification_committed(notification, created=True):
+    """커밋된 알림을 Redis 타임라인과 읽지 않은 알림 수에 반영하고 SSE로 발행합니다."""
+    if created:
+        timeline.add(notification)
+    else:
+        timeline.touch(notification)
+    stream.publish(notification)
@@ -0,0 +1,87 @@
+import time
+
+from articles.models import Article
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from notifications.models import Notification
+from users.models import User
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "좋아요가 많은 게시글에 좋아요 1개를 추가할 때의 시간과 쿼리 수를 측정합니다. "
+        "(벤치마크 데이터는 트랜잭션 롤백으로 남기지 않음)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--likes",
+            type=int,
+            action="append",
+            dest="like_counts",
+            help="기존 좋아요 수 (여러 번 지정 가능, 기본: 0, 100, 1000, 10000)",
+        )
+        parser.add_argument("--repeat", type=int, default=20, help="측정할 좋아요 수")
+
+    def handle(self, *args, **options):
+        like_counts = options["like_counts"] or [0, 100, 1000, 10000]
+        repeat = options["repeat"]
+        try:
+            with transaction.atomic():
+                users = self.create_users(max(like_counts) + repeat)
+                owner = users.pop()
+                for like_count in like_counts:
+                    self.run(owner, users, like_count, repeat)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def create_users(self, count):
+        password = make_password(None)
+        return User.objects.bulk_create(
+            [
+                User(
+                    username=f"like_benchmark_{i}",
+                    email=f"like_benchmark_{i}@example.com",
+                    nickname=f"like_benchmark_{i}",
+                    password=password,
+                )
+                for i in range(count + 1)
+            ],
+            batch_size=5000,
+        )
+
+    def run(self, owner, users, like_count, repeat):
+        article = Article.objects.create(user=owner, title="benchmark", content="")
+        # 기존 좋아요는 시그널 없이 바로 저장
+        Article.likes.through.objects.bulk_create(
+            [
+                Article.likes.through(article_id=article.id, user_id=user.id)
+                for user in users[:like_count]
+            ],
+            batch_size=5000,
+        )
+
+        timings = []
+        queries = []
+        for user in users[like_count : like_count + repeat]:
+            with CaptureQueriesContext(connection) as context:
+                started = time.perf_counter()
+                article.likes.add(user)
+                timings.append((time.perf_counter() - started) * 1000)
+            queries.append(len(context.captured_queries))
+
+        timings.sort()
+        # 묶음 알림(NOTIFICATION_COALESCE_VERBS)을 사용하면 좋아요 수와 관계없이 행이 늘지 않음
+        rows = Notification.objects.filter(article=article, verb="like").count()
+        self.stdout.write(
+            f"likes={like_count:<6} queries/like={max(queries):<3} "
+            f"median={timings[len(timings) // 2]:.2f}ms max={timings[-1]:.2f}ms "
+            f"notification_rows={rows}"
+        )
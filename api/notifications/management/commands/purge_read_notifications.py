@@ -0,0 +1,44 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from notifications import bulk
+
+
+class Command(BaseCommand):
+    help = (
+        "보관 기간이 지난 읽은 알림을 삭제합니다. "
+        "배치마다 커밋하므로 실행 중에도 알림 테이블을 오래 잠그지 않습니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.NOTIFICATION_RETENTION_DAYS,
+            help="이 일수보다 오래된 읽은 알림을 삭제",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.NOTIFICATION_RETENTION_BATCH_SIZE,
+            help="한 트랜잭션에서 삭제할 알림 수",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0,
+            help="배치 사이에 쉴 시간(초). 복제 지연이나 I/O 부하를 줄일 때 사용",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        deleted = 0
+        for count in bulk.delete_read_before(cutoff, options["batch_size"]):
+            deleted += count
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        self.stdout.write(self.style.SUCCESS(f"읽은 알림 {deleted}개를 삭제했습니다."))
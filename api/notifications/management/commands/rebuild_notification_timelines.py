@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Q
+from notifications import timeline
+from notifications.models import Notification
+
+
+class Command(BaseCommand):
+    help = "DB의 알림으로 Redis 알림 타임라인과 읽지 않은 알림 수를 다시 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user-id",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="지정한 사용자만 다시 만듦 (여러 번 지정 가능). 생략하면 전체 사용자",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="읽지 않은 알림 수를 한 번에 집계할 사용자 수",
+        )
+
+    def handle(self, *args, **options):
+        user_ids = options["user_ids"]
+        if user_ids is None:
+            # 알림이 모두 삭제된 사용자의 키도 정리되도록 전체 삭제 후 다시 생성
+            timeline.clear()
+            user_ids = list(
+                Notification.objects.filter(recipient__isnull=False, is_admin=False)
+                .order_by("recipient_id")
+                .values_list("recipient_id", flat=True)
+                .distinct()
+            )
+
+        batch_size = options["batch_size"]
+        for start in range(0, len(user_ids), batch_size):
+            batch = user_ids[start : start + batch_size]
+            unread_counts = dict(
+                Notification.objects.filter(recipient_id__in=batch)
+                .values("recipient_id")
+                .annotate(unread=Count("id", filter=Q(read=False)))
+                .values_list("recipient_id", "unread")
+                .order_by()
+            )
+            for user_id in batch:
+                timeline.rebuild(user_id, unread_count=unread_counts.get(user_id, 0))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(user_ids)}명의 알림 타임라인을 다시 만들었습니다."
+            )
+        )
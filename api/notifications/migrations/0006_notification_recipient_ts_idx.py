@@ -0,0 +1,22 @@
+# Generated by Django 5.1 on 2026-10-18 16:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "notifications",
+            "0005_notification_is_admin_alter_notification_recipient_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["recipient", "-timestamp"], name="notification_recipient_ts_idx"
+            ),
+        ),
+    ]
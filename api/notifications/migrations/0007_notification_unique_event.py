@@ -0,0 +1,30 @@
+# Generated by Django 5.1 on 2026-10-18 16:40
+
+from django.db import migrations, models
+
+# unique 제약을 추가하기 전에 중복 알림 정리 (가장 먼저 생성된 알림만 남김)
+DELETE_DUPLICATES = """
+DELETE FROM notifications_notification AS duplicate
+USING notifications_notification AS original
+WHERE duplicate.id > original.id
+  AND duplicate.recipient_id = original.recipient_id
+  AND duplicate.actor_id = original.actor_id
+  AND duplicate.verb = original.verb
+  AND duplicate.content_type_id = original.content_type_id
+  AND duplicate.object_id = original.object_id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0006_notification_recipient_ts_idx'),
+    ]
+
+    operations = [
+        migrations.RunSQL(DELETE_DUPLICATES, reverse_sql=migrations.RunSQL.noop),
+        migrations.AddConstraint(
+            model_name='notification',
+            constraint=models.UniqueConstraint(fields=('recipient', 'actor', 'verb', 'content_type', 'object_id'), name='notification_unique_event'),
+        ),
+    ]
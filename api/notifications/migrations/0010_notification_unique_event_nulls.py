@@ -0,0 +1,36 @@
+# Generated by Django 5.1 on 2026-10-18 16:52
+
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+# 어드민/AI 알림처럼 recipient나 actor가 null인 중복 알림 정리 (가장 먼저 생성된 알림만 남김)
+DELETE_DUPLICATES = """
+DELETE FROM notifications_notification AS duplicate
+USING notifications_notification AS original
+WHERE duplicate.id > original.id
+  AND duplicate.coalesce_window IS NULL
+  AND original.coalesce_window IS NULL
+  AND duplicate.recipient_id IS NOT DISTINCT FROM original.recipient_id
+  AND duplicate.actor_id IS NOT DISTINCT FROM original.actor_id
+  AND duplicate.verb = original.verb
+  AND duplicate.content_type_id = original.content_type_id
+  AND duplicate.object_id = original.object_id
+"""
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0009_notification_coalescing'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='notification',
+            name='notification_unique_event',
+        ),
+        migrations.RunSQL(DELETE_DUPLICATES, reverse_sql=migrations.RunSQL.noop),
+        migrations.AddConstraint(
+            model_name='notification',
+            constraint=models.UniqueConstraint(django.db.models.functions.comparison.Coalesce('recipient', models.Value(0)), django.db.models.functions.comparison.Coalesce('actor', models.Value(0)), models.F('verb'), models.F('content_type'), models.F('object_id'), condition=models.Q(('coalesce_window__isnull', True)), name='notification_unique_event'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1 on 2026-10-18 17:40
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_created_at(apps, schema_editor):
+    # 기존 알림은 마지막 이벤트 시각을 생성 시각으로 사용
+    Notification = apps.get_model('notifications', 'Notification')
+    Notification.objects.update(created_at=F('timestamp'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0010_notification_unique_event_nulls'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_created_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient', '-created_at', '-id'], name='notification_recipient_ca_idx'),
+        ),
+    ]
@@ -5,6 +5,8 @@ from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
+from django.db.models import Q, Value
+from django.db.models.functions import Coalesce
 
 User = get_user_model()
 
@@ -30,11 +32,65 @@ class Notification(models.Model):
     target = GenericForeignKey("content_type", "object_id")
     article = models.ForeignKey(Article, on_delete=models.CASCADE)
     read = models.BooleanField(default=False)
+    # 마지막 이벤트 시각 (묶음 알림은 이벤트가 합쳐질 때마다 갱신되며, 표시/타임라인/SSE 재연결에 사용)
     timestamp = models.DateTimeField(auto_now_add=True)
+    # 알림 생성 시각 (갱신되지 않으므로 목록 커서 페이지네이션의 정렬 기준으로 사용)
+    created_at = models.DateTimeField(auto_now_add=True)
 
     # 어드민 알림은 recipient null로 하고 is_admin=True
     is_admin = models.BooleanField(default=False)
 
+    # 묶음 알림 ("N명이 좋아합니다"): 같은 시간 구간의 (recipient, verb, article) 이벤트를 한 행에 모음
+    # coalesce_window는 이벤트 시각을 NOTIFICATION_COALESCE_WINDOW로 나눈 구간 번호 (묶지 않는 알림은 null)
+    coalesce_window = models.PositiveBigIntegerField(null=True, blank=True)
+    actor_count = models.PositiveIntegerField(default=1)
+    latest_actors = models.JSONField(default=list, blank=True)  # 최근 actor id (최신순)
+
+    class Meta:
+        constraints = [
+            # 같은 대상에 대한 같은 알림은 한 번만 생성 (dispatcher의 bulk_create 중복 방지)
+            # 어드민 알림(recipient 없음)과 AI 알림(actor 없음)도 중복으로 보도록 null은 0으로 비교
+            models.UniqueConstraint(
+                Coalesce("recipient", Value(0)),
+                Coalesce("actor", Value(0)),
+                "verb",
+                "content_type",
+                "object_id",
+                condition=Q(coalesce_window__isnull=True),
+                name="notification_unique_event",
+            ),
+            # 묶음 알림 upsert 대상 (INSERT ... ON CONFLICT DO UPDATE)
+            models.UniqueConstraint(
+                fields=["recipient", "verb", "article", "coalesce_window"],
+                condition=Q(coalesce_window__isnull=False),
+                name="notification_coalesce_group",
+            ),
+        ]
+        indexes = [
+            # 사용자별 최신 알림 조회 (NotificationListView, 타임라인 재생성)
+            models.Index(
+                fields=["recipient", "-timestamp"],
+                name="notification_recipient_ts_idx",
+            ),
+            # 사용자별 알림 목록 커서 페이지네이션 (NotificationListView)
+            models.Index(
+                fields=["recipient", "-created_at", "-id"],
+                name="notification_recipient_ca_idx",
+            ),
+            # 읽지 않은 알림만 담는 부분 인덱스 (읽지 않은 알림 수, 일괄 읽음 처리)
+            models.Index(
+                fields=["recipient", "-timestamp"],
+                condition=Q(read=False),
+                name="notification_unread_idx",
+            ),
+            # 보관 기간이 지난 읽은 알림 정리 (purge_read_notifications)
+            models.Index(
+                fields=["timestamp"],
+                condition=Q(read=True),
+                name="notification_read_ts_idx",
+            ),
+        ]
+
     def __str__(self):
         if self.is_common:
             return f"Common Notification - {self.get_verb_display()}"
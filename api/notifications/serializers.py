@@ -3,10 +3,69 @@ from articles.models import Article
 from comments.models import Comment
 from reports.models import ArticleReport, CommentReport
 from rest_framework import serializers
+from users.models import User
 
 from .models import Notification
 
 
+def resolve_comment_contents(notifications):
+    """
+    알림 목록의 댓글/댓글 신고 대상을 content type별로 in_bulk 한 번씩 조회해
+    {(content type, object_id): 댓글 내용} 맵을 만듭니다.
+    """
+    object_ids = {"comment": set(), "commentreport": set()}
+    for notification in notifications:
+        model = notification.content_type.model
+        if model in object_ids:
+            object_ids[model].add(notification.object_id)
+
+    contents = {}
+    if object_ids["comment"]:
+        comments = Comment.objects.only("id", "content").in_bulk(object_ids["comment"])
+        for comment_id, comment in comments.items():
+            contents[("comment", comment_id)] = comment.content
+    if object_ids["commentreport"]:
+        reports = (
+            CommentReport.objects.select_related("reported_comment")
+            .only("id", "reported_comment__content")
+            .in_bulk(object_ids["commentreport"])
+        )
+        for report_id, report in reports.items():
+            contents[("commentreport", report_id)] = report.reported_comment.content
+    return contents
+
+
+def resolve_latest_actors(notifications):
+    """묶음 알림의 최근 actor를 in_bulk 한 번으로 조회해 {user id: User} 맵을 만듭니다."""
+    user_ids = set()
+    for notification in notifications:
+        user_ids.update(notification.latest_actors)
+        # actor는 select_related로 이미 조회됨
+        user_ids.discard(notification.actor_id)
+    if not user_ids:
+        return {}
+    return User.objects.only("id", "username", "nickname").in_bulk(user_ids)
+
+
+# 알림 목록 직렬화 시 댓글 내용과 묶음 알림 actor를 한 번에 조회해 context로 전달
+class NotificationListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        notifications = list(data.all() if hasattr(data, "all") else data)
+        self._context["comment_contents"] = resolve_comment_contents(notifications)
+        self._context["latest_actors"] = resolve_latest_actors(notifications)
+        return super().to_representation(notifications)
+
+
+def get_comment_content(serializer, obj, models):
+    """content type이 models에 속하는 알림의 댓글 내용 (목록이 아니면 해당 알림만 조회)"""
+    if obj.content_type.model not in models:
+        return "None"
+    contents = serializer.context.get("comment_contents")
+    if contents is None:
+        contents = resolve_comment_contents([obj])
+    return contents.get((obj.content_type.model, obj.object_id), "None")
+
+
 class NotificationSerializer(serializers.ModelSerializer):
     actor_nickname = serializers.CharField(source="actor.nickname", read_only=True)
     actor_username = serializers.CharField(source="actor.username", read_only=True)
@@ -16,6 +75,7 @@ class NotificationSerializer(serializers.ModelSerializer):
     description = serializers.SerializerMethodField()
     article_title = serializers.CharField(source="article.title", read_only=True)
     comment_content = serializers.SerializerMethodField()
+    latest_actors = serializers.SerializerMethodField()
 
     class Meta:
         model = Notification
@@ -24,6 +84,8 @@ class NotificationSerializer(serializers.ModelSerializer):
             "recipient",
             "actor_nickname",
             "actor_username",
+            "actor_count",
+            "latest_actors",
             "verb",
             "content_type",
             "article_id",
@@ -34,6 +96,11 @@ class NotificationSerializer(serializers.ModelSerializer):
             "read",
             "timestamp",
         ]
+        list_serializer_class = NotificationListSerializer
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        return queryset.select_related("actor", "article", "content_type")
 
     def get_content_type(self, obj):
         """알림 대상 객체의 타입(article, comment)을 반환"""
@@ -49,17 +116,33 @@ class NotificationSerializer(serializers.ModelSerializer):
             return "ai_hunsoo"
         return "unknown"
 
+    def get_latest_actors(self, obj):
+        """묶음 알림의 최근 actor 목록 (최신순, 묶지 않은 알림은 actor 한 명)"""
+        if obj.actor is None:
+            return []
+        users = self.context.get("latest_actors")
+        if users is None:
+            users = resolve_latest_actors([obj])
+        users = {**users, obj.actor_id: obj.actor}
+        return [
+            {"username": users[user_id].username, "nickname": users[user_id].nickname}
+            for user_id in obj.latest_actors or [obj.actor_id]
+            if user_id in users
+        ]
+
     def get_description(self, obj):
         """content_type과 verb에 따라 description을 생성"""
+        # 묶음 알림: "OO님 외 N명이 ..."
+        others = f" 외 {obj.actor_count - 1}명" if obj.actor_count > 1 else ""
         if obj.content_type.model == "article":
             if obj.verb == "like":
-                return f"님이 회원님의 게시글을 좋아합니다"
+                return f"님{others}이 회원님의 게시글을 좋아합니다"
         elif obj.content_type.model == "aihunsoo":
             if obj.verb == "ai_response":
                 return f"회원님의 게시글에 훈수봇이 훈수를 남겼습니다"
         elif obj.content_type.model == "comment":
             if obj.verb == "comment":
-                return f"님이 회원님의 게시글에 훈수를 남겼습니다"
+                return f"님{others}이 회원님의 게시글에 훈수를 남겼습니다"
             elif obj.verb == "select":
                 return f"회원님의 훈수가 채택되었습니다"
         elif obj.content_type.model == "articlereport":
@@ -70,14 +153,7 @@ class NotificationSerializer(serializers.ModelSerializer):
 
     def get_comment_content(self, obj):
         """content_type이 comment일 경우에만 필요"""
-        if obj.content_type.model == "comment":
-            comment = Comment.objects.get(id=obj.object_id)
-            return comment.content
-        elif obj.content_type.model == "commentreport":
-            report = CommentReport.objects.get(id=obj.object_id)
-            comment = Comment.objects.get(id=report.reported_comment.id)
-            return comment.content
-        return "None"
+        return get_comment_content(self, obj, ("comment", "commentreport"))
 
 
 class AdminNotificationSerializer(serializers.ModelSerializer):
@@ -110,6 +186,7 @@ class AdminNotificationSerializer(serializers.ModelSerializer):
             "read",
             "timestamp",
         ]
+        list_serializer_class = NotificationListSerializer
 
     def get_content_type(self, obj):
         if obj.content_type.model == "articlereport":
@@ -128,8 +205,4 @@ class AdminNotificationSerializer(serializers.ModelSerializer):
 
     def get_comment_content(self, obj):
         """content_type이 comment_report일 경우에만 필요"""
-        if obj.content_type.model == "commentreport":
-            report = CommentReport.objects.get(id=obj.object_id)
-            comment = Comment.objects.get(id=report.reported_comment.id)
-            return comment.content
-        return "None"
+        return get_comment_content(self, obj, ("commentreport",))
@@ -26,10 +26,11 @@ class CommentNotificationTest(TestCase):
         )
 
     def test_comment_notification(self):
-        # 댓글 작성
-        Comment.objects.create(
-            user=self.user2, article=self.article, content="Test Comment"
-        )
+        # 댓글 작성 (알림은 커밋 후 저장)
+        with self.captureOnCommitCallbacks(execute=True):
+            Comment.objects.create(
+                user=self.user2, article=self.article, content="Test Comment"
+            )
 
         # 알림이 생성되었는지 확인
         notification = Notification.objects.get(recipient=self.user1, verb="comment")
@@ -59,7 +60,8 @@ class LikeNotificationTest(TestCase):
 
     def test_like_notification(self):
         # 좋아요 추가
-        self.article.likes.add(self.user2)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.article.likes.add(self.user2)
 
         # 알림이 생성되었는지 확인
         notification = Notification.objects.get(recipient=self.user1, verb="like")
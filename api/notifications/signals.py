@@ -1,110 +1,106 @@
+import copy
+
 from ai_hunsoos.models import AiHunsoo
 from articles.models import Article
 from comments.models import Comment
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
-from django.db.models.signals import m2m_changed, post_save
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
+from notifications import dispatcher, timeline
 from notifications.models import Notification
 from reports.models import ArticleReport, CommentReport
 
 
+# 알림이 저장/삭제되면 커밋 후 Redis 타임라인과 읽지 않은 알림 수에 반영 (DB가 원본)
+# 새 알림은 Redis pub/sub으로 발행해 SSE로 연결된 클라이언트에 바로 전달
+# (dispatcher가 bulk_create/upsert로 만든 알림은 post_save가 없으므로 dispatcher에서 반영)
+@receiver(post_save, sender=Notification)
+def add_notification_to_timeline(sender, instance, created, **kwargs):
+    if created:
+        transaction.on_commit(lambda: dispatcher.notification_committed(instance))
+
+
+@receiver(post_delete, sender=Notification)
+def remove_notification_from_timeline(sender, instance, **kwargs):
+    # 삭제가 끝나면 instance.id가 None으로 바뀌므로 복사해서 전달
+    notification = copy.copy(instance)
+    transaction.on_commit(lambda: timeline.remove(notification))
+
+
+# 아래 알림은 모두 dispatcher로 등록합니다. 트랜잭션이 커밋된 뒤 중복을 제거해 한 번에 저장하며,
+# 이미 있는 알림은 unique 제약(notification_unique_event)으로 무시하므로 미리 조회하지 않습니다.
+
+
 # 댓글이 작성될 때 알림
 @receiver(post_save, sender=Comment)
 def notify_user_on_comment(sender, instance, created, **kwargs):
     if created:
-        # 동일한 알림이 이미 존재하는지 확인
-        if not Notification.objects.filter(
-            recipient=instance.article.user,
-            actor=instance.user,
-            verb="comment",
-            object_id=instance.id,
-            content_type=ContentType.objects.get_for_model(instance),
-        ).exists():
-            # 중복 알림이 없다면 새 알림 생성
-            Notification.objects.create(
-                recipient=instance.article.user,
-                actor=instance.user,
-                verb="comment",
-                content_type=ContentType.objects.get_for_model(instance),
-                object_id=instance.id,
-                article=instance.article,
-                is_admin=False,
-            )
+        dispatcher.notify(
+            "comment",
+            instance,
+            instance.article_id,
+            recipient_id=instance.article.user_id,
+            actor_id=instance.user_id,
+        )
 
 
 # 게시글에 좋아요가 추가될 때 알림
+# 이번에 좋아요를 누른 사용자(pk_set)에 대해서만 알림을 만들므로 전체 좋아요 수와 무관하게 처리
 @receiver(m2m_changed, sender=Article.likes.through)
-def notify_user_on_like(sender, instance, action, **kwargs):
+def notify_user_on_like(sender, instance, action, pk_set, reverse, **kwargs):
+    if reverse or not pk_set:
+        # user.liked_articles 쪽에서 변경하는 경우는 사용하지 않음
+        return
+
     if action == "post_add":
-        for user in instance.likes.all():
-            Notification.objects.create(
-                recipient=instance.user,
-                actor=user,
-                verb="like",
-                content_type=ContentType.objects.get_for_model(instance),
-                object_id=instance.id,
-                article=instance,
-                is_admin=False,
+        for actor_id in sorted(pk_set):
+            dispatcher.notify(
+                "like",
+                instance,
+                instance.id,
+                recipient_id=instance.user_id,
+                actor_id=actor_id,
             )
 
     elif action == "post_remove":
-        for user in kwargs.get("pk_set", []):  # 좋아요 취소한 사용자들
-            Notification.objects.filter(
-                recipient=instance.user,
-                actor_id=user,  # user_id로 필터링
-                verb="like",
-                object_id=instance.id,
-                content_type=ContentType.objects.get_for_model(instance),
-            ).delete()
+        # 좋아요 취소한 사용자들의 알림을 한 번에 삭제
+        # 여러 명이 묶인 알림은 그대로 두고, 취소한 사용자만 있는 묶음 알림은 삭제
+        Notification.objects.filter(
+            Q(coalesce_window__isnull=True) | Q(actor_count=1),
+            recipient_id=instance.user_id,
+            actor_id__in=pk_set,
+            verb="like",
+            object_id=instance.id,
+            content_type=ContentType.objects.get_for_model(instance),
+        ).delete()
 
 
 # 댓글이 채택될 때 알림
 @receiver(post_save, sender=Comment)
 def notify_user_on_comment_selection(sender, instance, **kwargs):
     if instance.is_selected:
-        # 동일한 알림이 이미 존재하는지 확인
-        if not Notification.objects.filter(
-            recipient=instance.user,
-            actor=instance.article.user,
-            verb="select",
-            object_id=instance.id,
-            content_type=ContentType.objects.get_for_model(instance),
-        ).exists():
-            # 중복 알림이 없다면 새 알림 생성
-            transaction.on_commit(
-                lambda: Notification.objects.create(
-                    recipient=instance.user,
-                    actor=instance.article.user,
-                    verb="select",
-                    content_type=ContentType.objects.get_for_model(instance),
-                    object_id=instance.id,
-                    article=instance.article,
-                    is_admin=False,
-                )
-            )
+        dispatcher.notify(
+            "select",
+            instance,
+            instance.article_id,
+            recipient_id=instance.user_id,
+            actor_id=instance.article.user_id,
+        )
 
 
 # AI 댓글이 생성될 때 알림
 @receiver(post_save, sender=AiHunsoo)
 def notify_user_on_ai_hunsoo(sender, instance, created, **kwargs):
     if not created and instance.status:
-        # 동일한 알림이 이미 존재하는지 확인
-        if not Notification.objects.filter(
-            recipient=instance.article.user,
-            verb="ai_response",
-            object_id=instance.id,
-            content_type=ContentType.objects.get_for_model(instance),
-        ).exists():
-            Notification.objects.create(
-                recipient=instance.article.user,
-                actor=None,  # AI는 사용자 대신 자동으로 생성되므로 actor가 없을 수 있음
-                verb="ai_response",
-                content_type=ContentType.objects.get_for_model(instance),
-                object_id=instance.id,
-                article=instance.article,
-                is_admin=False,
-            )
+        # AI는 사용자 대신 자동으로 생성되므로 actor가 없음
+        dispatcher.notify(
+            "ai_response",
+            instance,
+            instance.article_id,
+            recipient_id=instance.article.user_id,
+        )
 
 
 # 게시글 신고가 처리 완료되었을 때 알림
@@ -112,22 +108,13 @@ def notify_user_on_ai_hunsoo(sender, instance, created, **kwargs):
 def update_warning_article(sender, instance, created, **kwargs):
     # article_report가 업데이트되었고 status가 RS(resolved)로 변경된 경우
     if not created and instance.status == "RS":
-        # 동일한 알림이 이미 존재하는지 확인
-        if not Notification.objects.filter(
-            recipient=instance.reported_user,
-            verb="report",
-            object_id=instance.id,
-            content_type=ContentType.objects.get_for_model(instance),
-        ).exists():
-            Notification.objects.create(
-                recipient=instance.reported_user,
-                actor=instance.reported_user,
-                verb="report",
-                content_type=ContentType.objects.get_for_model(instance),
-                object_id=instance.id,
-                article=instance.reported_article,
-                is_admin=False,
-            )
+        dispatcher.notify(
+            "report",
+            instance,
+            instance.reported_article_id,
+            recipient_id=instance.reported_user_id,
+            actor_id=instance.reported_user_id,
+        )
 
 
 # 댓글 신고가 처리 완료되었을 때 알림
@@ -135,69 +122,36 @@ def update_warning_article(sender, instance, created, **kwargs):
 def update_warning_comment(sender, instance, created, **kwargs):
     # comment_report가 업데이트되었고 status가 RS(resolved)로 변경된 경우
     if not created and instance.status == "RS":
-        # 동일한 알림이 이미 존재하는지 확인
-        if not Notification.objects.filter(
-            recipient=instance.reported_user,
-            verb="report",
-            object_id=instance.id,
-            content_type=ContentType.objects.get_for_model(instance),
-        ).exists():
-            Notification.objects.create(
-                recipient=instance.reported_user,
-                actor=instance.reported_user,
-                verb="report",
-                content_type=ContentType.objects.get_for_model(instance),
-                object_id=instance.id,
-                article=instance.reported_comment.article,
-                is_admin=False,
-            )
+        dispatcher.notify(
+            "report",
+            instance,
+            instance.reported_comment.article_id,
+            recipient_id=instance.reported_user_id,
+            actor_id=instance.reported_user_id,
+        )
 
 
 # 게시글 신고가 접수될 때 알림
 @receiver(post_save, sender=ArticleReport)
 def notify_admin_on_article_report(sender, instance, created, **kwargs):
     if created:
-        # 동일한 알림이 이미 존재하는지 확인
-        if not Notification.objects.filter(
-            actor=instance.reported_user,
-            verb="report",
-            object_id=instance.id,
-            content_type=ContentType.objects.get_for_model(instance),
+        dispatcher.notify(
+            "report",
+            instance,
+            instance.reported_article_id,
+            actor_id=instance.reported_user_id,
             is_admin=True,
-        ).exists():
-            # 중복 알림이 없다면 새 알림 생성
-            transaction.on_commit(
-                lambda: Notification.objects.create(
-                    actor=instance.reported_user,
-                    verb="report",
-                    content_type=ContentType.objects.get_for_model(instance),
-                    object_id=instance.id,
-                    article=instance.reported_article,
-                    is_admin=True,
-                )
-            )
+        )
 
 
 # 댓글 신고가 접수될 때 알림
 @receiver(post_save, sender=CommentReport)
 def notify_admin_on_comment_report(sender, instance, created, **kwargs):
     if created:
-        # 동일한 알림이 이미 존재하는지 확인
-        if not Notification.objects.filter(
-            actor=instance.reported_user,
-            verb="report",
-            object_id=instance.id,
-            content_type=ContentType.objects.get_for_model(instance),
+        dispatcher.notify(
+            "report",
+            instance,
+            instance.reported_comment.article_id,
+            actor_id=instance.reported_user_id,
             is_admin=True,
-        ).exists():
-            # 중복 알림이 없다면 새 알림 생성
-            transaction.on_commit(
-                lambda: Notification.objects.create(
-                    actor=instance.reported_user,
-                    verb="report",
-                    content_type=ContentType.objects.get_for_model(instance),
-                    object_id=instance.id,
-                    article=instance.reported_comment.article,
-                    is_admin=True,
-                )
-            )
+        )
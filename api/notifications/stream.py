@@ -0,0 +1,249 @@
+import asyncio
+import json
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+from asgiref.sync import sync_to_async
+from common import metrics
+from common.cache import get_redis
+from common.logger import logger
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+from . import timeline
+from .models import Notification
+from .serializers import NotificationSerializer
+
+# 사용자별 알림 발행 채널 (Redis pub/sub)
+CHANNEL = "notifications:{user_id}"
+CHANNEL_PATTERN = "notifications:*"
+
+
+def get_channel(user_id):
+    return CHANNEL.format(user_id=user_id)
+
+
+def serialize(notification):
+    return json.dumps(
+        NotificationSerializer(notification).data,
+        cls=DjangoJSONEncoder,
+        ensure_ascii=False,
+    )
+
+
+def publish(notification):
+    """커밋된 알림을 수신자 채널에 발행합니다. (모든 프로세스의 SSE 연결로 전달)"""
+    redis = get_redis()
+    if redis is None or not timeline.is_tracked(notification):
+        return
+    try:
+        redis.publish(get_channel(notification.recipient_id), serialize(notification))
+        metrics.increment("notification.stream.published")
+    except Exception as e:
+        metrics.increment("notification.stream.error")
+        logger.warning(f"알림 발행 실패 ({notification.id}): {e}")
+
+
+class Listener:
+    """SSE 연결 하나가 받을 알림 큐 (연결이 실행 중인 이벤트 루프에서만 사용)"""
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=settings.NOTIFICATION_STREAM_QUEUE_SIZE)
+        # 큐가 가득 차 알림을 버린 경우 연결을 끊고 Last-Event-ID로 다시 받도록 함
+        self.overflowed = False
+
+    def put(self, data):
+        if self.queue.full():
+            self.overflowed = True
+            return
+        self.queue.put_nowait(data)
+
+
+class Broker:
+    """
+    프로세스당 Redis 연결 하나로 모든 사용자 채널을 구독하고(PSUBSCRIBE),
+    받은 알림을 해당 사용자의 SSE 연결 큐로 전달합니다.
+    연결마다 Redis 구독을 만들지 않으므로 유휴 연결이 많아도 Redis 연결 수는 늘지 않습니다.
+    """
+
+    def __init__(self):
+        self.listeners = defaultdict(set)
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def start(self):
+        """
+        구독 스레드를 시작합니다. Redis를 사용할 수 없으면 False를 반환하며, 이때 연결은
+        heartbeat만 보내다가 NOTIFICATION_STREAM_MAX_AGE에 닫히고 재연결 시 DB 백로그로 받습니다.
+        """
+        with self.lock:
+            if self.thread is not None and self.thread.is_alive():
+                return True
+            redis = get_redis()
+            if redis is None:
+                return False
+            try:
+                pubsub = redis.pubsub(ignore_subscribe_messages=True)
+                pubsub.psubscribe(**{CHANNEL_PATTERN: self.dispatch})
+            except Exception as e:
+                metrics.increment("notification.stream.error")
+                logger.warning(f"알림 구독 시작 실패, 재연결 시 DB에서 전달합니다: {e}")
+                return False
+            self.thread = pubsub.run_in_thread(
+                sleep_time=1, daemon=True, exception_handler=self.handle_error
+            )
+            return True
+
+    @staticmethod
+    def handle_error(error, pubsub, thread):
+        # 다음 get_message에서 다시 연결하고 구독을 복구함
+        metrics.increment("notification.stream.error")
+        logger.warning(f"알림 구독 연결 오류: {error}")
+        time.sleep(1)
+
+    def listen(self, user_id):
+        if not self.start():
+            # 실시간 전달 없이 heartbeat와 재연결 시 백로그로만 전달
+            metrics.increment("notification.stream.degraded")
+        listener = Listener(asyncio.get_running_loop())
+        with self.lock:
+            self.listeners[user_id].add(listener)
+        metrics.increment("notification.stream.connected")
+        return listener
+
+    def unlisten(self, user_id, listener):
+        with self.lock:
+            self.listeners[user_id].discard(listener)
+            if not self.listeners[user_id]:
+                del self.listeners[user_id]
+
+    def connection_count(self):
+        with self.lock:
+            return sum(len(listeners) for listeners in self.listeners.values())
+
+    def dispatch(self, message):
+        channel = message["channel"]
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+        user_id = int(channel.rsplit(":", 1)[-1])
+        data = message["data"]
+        if isinstance(data, bytes):
+            data = data.decode()
+
+        with self.lock:
+            listeners = list(self.listeners.get(user_id, ()))
+        for listener in listeners:
+            try:
+                listener.loop.call_soon_threadsafe(listener.put, data)
+            except RuntimeError:
+                # 이벤트 루프가 이미 종료된 연결
+                self.unlisten(user_id, listener)
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    with _broker_lock:
+        if _broker is None:
+            _broker = Broker()
+    return _broker
+
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def get_event_id(data):
+    """
+    SSE 이벤트 ID "(timestamp 마이크로초)-(알림 id)".
+    묶음 알림은 id를 유지한 채 timestamp가 갱신되므로, 갱신된 알림도 재연결 시 다시 받을 수 있도록
+    (timestamp, id) 순서로 이어서 전달합니다. 이미 받은 알림이 갱신되어 같은 id로 다시 올 수 있으므로
+    클라이언트는 알림 id 기준으로 덮어써야 합니다.
+    """
+    timestamp = parse_datetime(data["timestamp"])
+    return f"{(timestamp - EPOCH) // timedelta(microseconds=1)}-{data['id']}"
+
+
+def parse_event_id(value):
+    """Last-Event-ID를 (timestamp, 알림 id)로 변환합니다. 형식이 맞지 않으면 None을 반환합니다."""
+    try:
+        micros, notification_id = value.split("-")
+        return EPOCH + timedelta(microseconds=int(micros)), int(notification_id)
+    except (AttributeError, ValueError, OverflowError):
+        return None
+
+
+def get_backlog(user_id, last_event):
+    """
+    재연결 시 last_event((timestamp, id)) 이후에 생성되거나 갱신된 알림
+    (최대 NOTIFICATION_TIMELINE_SIZE개)
+    """
+    timestamp, notification_id = last_event
+    notifications = NotificationSerializer.setup_eager_loading(
+        Notification.objects.filter(
+            Q(timestamp__gt=timestamp) | Q(timestamp=timestamp, id__gt=notification_id),
+            recipient_id=user_id,
+            is_admin=False,
+        )
+    ).order_by("timestamp", "id")[: settings.NOTIFICATION_TIMELINE_SIZE]
+    return [
+        (
+            get_event_id(data),
+            json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False),
+        )
+        for data in NotificationSerializer(notifications, many=True).data
+    ]
+
+
+def format_event(event_id, data):
+    return f"id: {event_id}\nevent: notification\ndata: {data}\n\n"
+
+
+async def stream_events(user_id, last_event=None):
+    """
+    SSE 형식의 알림 스트림. last_event가 있으면 그 이후 알림을 DB에서 먼저 보내고,
+    이후에는 발행되는 알림을 전달합니다. 연결이 조용할 때는 heartbeat 주석을 보내고,
+    NOTIFICATION_STREAM_MAX_AGE가 지나면 연결을 닫아 클라이언트가 다시 연결하도록 합니다.
+    """
+    broker = get_broker()
+    # 백로그 조회 중에 발행된 알림을 놓치지 않도록 먼저 구독
+    listener = broker.listen(user_id)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.NOTIFICATION_STREAM_MAX_AGE
+    try:
+        yield f"retry: {settings.NOTIFICATION_STREAM_RETRY_MS}\n\n"
+
+        sent = set()
+        if last_event is not None:
+            for event_id, data in await sync_to_async(get_backlog)(user_id, last_event):
+                sent.add(event_id)
+                yield format_event(event_id, data)
+
+        while not listener.overflowed:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                data = await asyncio.wait_for(
+                    listener.queue.get(),
+                    timeout=min(settings.NOTIFICATION_STREAM_HEARTBEAT, remaining),
+                )
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"
+                continue
+
+            event_id = get_event_id(json.loads(data))
+            if event_id in sent:
+                # 백로그로 이미 보낸 알림
+                continue
+            metrics.increment("notification.stream.delivered")
+            yield format_event(event_id, data)
+    finally:
+        broker.unlisten(user_id, listener)
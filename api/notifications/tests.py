@@ -1,8 +1,22 @@
+import asyncio
+import itertools
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import Mock, patch
+
 from articles.models import Article
+from asgiref.sync import sync_to_async
 from comments.models import Comment
 from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
+from notifications import coalescing, dispatcher, stream, timeline
 from notifications.models import Notification
+from reports.models import ArticleReport, CommentReport
 from rest_framework import status
 from rest_framework.test import APITestCase
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -41,13 +55,13 @@ class NotificationTests(APITestCase):
         # 테스트용 알림 생성 전에 자동 생성된 알림이 있는지 확인
         self.initial_notification_count = Notification.objects.count()
 
-        # 테스트용 알림 생성
+        # 테스트용 알림 생성 (댓글 알림은 시그널로 이미 생성되었으므로 좋아요 알림)
         self.notification = Notification.objects.create(
             recipient=self.user1,
             actor=self.user2,
-            verb="comment",
-            content_type=ContentType.objects.get_for_model(self.comment),
-            object_id=self.comment.id,
+            verb="like",
+            content_type=ContentType.objects.get_for_model(self.article),
+            object_id=self.article.id,
             article=self.article,
         )
 
@@ -107,3 +121,780 @@ class NotificationTests(APITestCase):
         self.comment.delete()
         self.article.delete()
         self.notification.delete()
+
+
+@override_settings(NOTIFICATION_TIMELINE_SIZE=3)
+class NotificationTimelineTests(APITestCase):
+    def setUp(self):
+        timeline.clear()
+        self.user = User.objects.create_user(
+            username="timeline",
+            email="timeline@example.com",
+            password="password123",
+            nickname="timeline",
+        )
+        self.actor = User.objects.create_user(
+            username="actor",
+            email="actor@example.com",
+            password="password123",
+            nickname="actor",
+        )
+        self.article = Article.objects.create(
+            user=self.user, title="Test Article", content="Test Content"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("notification-summary")
+        self.object_ids = itertools.count(1)
+
+    def create_notification(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Notification.objects.create(
+                recipient=self.user,
+                actor=self.actor,
+                verb="like",
+                content_type=ContentType.objects.get_for_model(self.article),
+                object_id=next(self.object_ids),
+                article=self.article,
+            )
+
+    def get_summary(self, limit=10):
+        response = self.client.get(self.url, {"limit": limit})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data["unread_count"], [
+            item["id"] for item in response.data["results"]
+        ]
+
+    def test_summary_uses_timeline_and_unread_counter(self):
+        notifications = [self.create_notification() for _ in range(2)]
+
+        # 처음 조회할 때 DB에서 타임라인과 읽지 않은 알림 수를 채움
+        self.assertEqual(
+            self.get_summary(), (2, [n.id for n in reversed(notifications)])
+        )
+
+        # 이후 생성/읽음/삭제는 Redis에 바로 반영
+        notifications.append(self.create_notification())
+        self.client.patch(
+            reverse("notification-mark-as-read", kwargs={"pk": notifications[0].id})
+        )
+        with self.assertNumQueries(1):
+            # 알림 조회 1회 (읽지 않은 알림 수는 Redis에서 조회)
+            unread_count, ids = self.get_summary(limit=2)
+        self.assertEqual(
+            (unread_count, ids), (2, [notifications[2].id, notifications[1].id])
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(
+                reverse("notification-delete", kwargs={"pk": notifications[2].id})
+            )
+        self.assertEqual(
+            self.get_summary(), (1, [notifications[1].id, notifications[0].id])
+        )
+
+    def test_mark_as_read_rejects_other_users_notification(self):
+        notification = self.create_notification()
+        self.assertEqual(self.get_summary(), (1, [notification.id]))
+
+        self.client.force_authenticate(user=self.actor)
+        response = self.client.patch(
+            reverse("notification-mark-as-read", kwargs={"pk": notification.id})
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        # 다른 사용자의 요청은 읽음 상태와 읽지 않은 알림 수를 바꾸지 않음
+        notification.refresh_from_db()
+        self.assertFalse(notification.read)
+        self.assertEqual(timeline.get_unread_count(self.user.id), 1)
+
+    def test_timeline_keeps_latest_items(self):
+        notifications = [self.create_notification() for _ in range(3)]
+        self.get_summary()
+
+        # 최대 개수(3개)를 넘으면 오래된 알림부터 제거
+        notifications.append(self.create_notification())
+        self.assertEqual(
+            self.get_summary()[1], [n.id for n in reversed(notifications[1:])]
+        )
+
+        # 꽉 찬 타임라인에서 알림이 삭제되면 DB에서 다시 채움
+        with self.captureOnCommitCallbacks(execute=True):
+            notifications[3].delete()
+        self.assertEqual(
+            self.get_summary()[1], [n.id for n in reversed(notifications[:3])]
+        )
+
+    def test_summary_falls_back_to_db_when_redis_fails(self):
+        notification = self.create_notification()
+        redis = Mock()
+        redis.get.side_effect = ConnectionError("redis down")
+        redis.zrevrange.side_effect = ConnectionError("redis down")
+        redis.pipeline.side_effect = ConnectionError("redis down")
+        redis.set.side_effect = ConnectionError("redis down")
+
+        with patch("notifications.timeline.get_redis", return_value=redis):
+            self.assertEqual(self.get_summary(), (1, [notification.id]))
+
+    def test_rebuild_command(self):
+        notification = self.create_notification()
+        self.get_summary()
+        # Redis에 반영되지 않은 변경 (예: Redis 장애 중 처리된 읽음)
+        Notification.objects.filter(id=notification.id).update(read=True)
+        self.assertEqual(self.get_summary()[0], 1)
+
+        call_command("rebuild_notification_timelines", stdout=StringIO())
+
+        self.assertEqual(self.get_summary(), (0, [notification.id]))
+
+
+class NotificationStreamTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="stream",
+            email="stream@example.com",
+            password="password123",
+            nickname="stream",
+        )
+        self.actor = User.objects.create_user(
+            username="streamactor",
+            email="streamactor@example.com",
+            password="password123",
+            nickname="streamactor",
+        )
+        self.article = Article.objects.create(
+            user=self.user, title="Test Article", content="Test Content"
+        )
+        self.object_ids = itertools.count(1)
+
+    def create_notification(self):
+        return Notification.objects.create(
+            recipient=self.user,
+            actor=self.actor,
+            verb="like",
+            content_type=ContentType.objects.get_for_model(self.article),
+            object_id=next(self.object_ids),
+            article=self.article,
+        )
+
+    def get_event_id(self, notification):
+        return stream.get_event_id(
+            {"id": notification.id, "timestamp": notification.timestamp.isoformat()}
+        )
+
+    async def test_stream_delivers_published_notifications(self):
+        events = stream.stream_events(self.user.id)
+        self.assertEqual(await anext(events), "retry: 3000\n\n")
+        next_event = asyncio.ensure_future(anext(events))
+
+        # 다른 프로세스에서 커밋된 알림이 Redis로 발행된 경우
+        notification = await sync_to_async(self.create_notification)()
+        await sync_to_async(stream.publish)(notification)
+
+        event = await asyncio.wait_for(next_event, timeout=5)
+        self.assertTrue(
+            event.startswith(
+                f"id: {self.get_event_id(notification)}\nevent: notification\n"
+            )
+        )
+        self.assertIn('"verb": "like"', event)
+
+        await events.aclose()
+        self.assertEqual(stream.get_broker().connection_count(), 0)
+
+    async def test_stream_resumes_from_last_event_id(self):
+        first, second = [
+            await sync_to_async(self.create_notification)() for _ in range(2)
+        ]
+        refresh = await sync_to_async(RefreshToken.for_user)(self.user)
+        self.async_client.cookies["hunsu_access"] = str(refresh.access_token)
+
+        response = await self.async_client.get(
+            reverse("notification-stream"),
+            headers={"Last-Event-ID": self.get_event_id(first)},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        content = response.streaming_content
+        self.assertEqual(await anext(content), b"retry: 3000\n\n")
+        # 마지막으로 받은 알림 이후의 알림부터 전달
+        self.assertTrue(
+            (await anext(content)).startswith(
+                f"id: {self.get_event_id(second)}\n".encode()
+            )
+        )
+        await content.aclose()
+
+    @override_settings(NOTIFICATION_COALESCE_VERBS=("like",))
+    async def test_stream_resends_notifications_merged_while_disconnected(self):
+        def like(actor):
+            result = coalescing.upsert(
+                self.user.id,
+                actor.id,
+                "like",
+                ContentType.objects.get_for_model(self.article).id,
+                self.article.id,
+                self.article.id,
+            )
+            return Notification.objects.get(id=result[0])
+
+        def comment():
+            return Notification.objects.create(
+                recipient=self.user,
+                actor=self.actor,
+                verb="comment",
+                content_type=ContentType.objects.get_for_model(self.article),
+                object_id=next(self.object_ids),
+                article=self.article,
+            )
+
+        other = await sync_to_async(User.objects.create_user)(
+            username="streamother",
+            email="streamother@example.com",
+            password="password123",
+            nickname="streamother",
+        )
+        liked = await sync_to_async(like)(self.actor)
+        commented = await sync_to_async(comment)()
+
+        # 연결이 끊긴 동안 먼저 받은 묶음 알림에 다른 사용자의 좋아요가 합쳐진 경우
+        merged = await sync_to_async(like)(other)
+        self.assertEqual(merged.id, liked.id)
+        self.assertGreater(self.get_event_id(merged), self.get_event_id(commented))
+
+        events = stream.stream_events(
+            self.user.id, stream.parse_event_id(self.get_event_id(commented))
+        )
+        self.assertEqual(await anext(events), "retry: 3000\n\n")
+        event = await anext(events)
+        self.assertTrue(event.startswith(f"id: {self.get_event_id(merged)}\n"))
+        self.assertIn('"actor_count": 2', event)
+        await events.aclose()
+
+    @override_settings(NOTIFICATION_STREAM_HEARTBEAT=0.01)
+    @patch("notifications.stream.get_redis", return_value=None)
+    async def test_stream_without_redis_sends_heartbeats(self, get_redis):
+        broker = stream.Broker()
+        self.assertFalse(broker.start())
+
+        # Redis가 없으면 실시간 전달 없이 heartbeat만 보냄 (재연결 시 백로그로 전달)
+        with patch("notifications.stream.get_broker", return_value=broker):
+            events = stream.stream_events(self.user.id)
+            self.assertEqual(await anext(events), "retry: 3000\n\n")
+            self.assertEqual(await anext(events), ": ping\n\n")
+            await events.aclose()
+        self.assertEqual(broker.connection_count(), 0)
+
+    async def test_stream_requires_authentication(self):
+        response = await self.async_client.get(reverse("notification-stream"))
+
+        self.assertEqual(response.status_code, 401)
+
+
+# 이벤트마다 알림을 만드는 경우 (묶음 알림은 NotificationCoalescingTests)
+@override_settings(NOTIFICATION_COALESCE_VERBS=())
+class LikeNotificationTests(TestCase):
+    def setUp(self):
+        timeline.clear()
+        self.owner = User.objects.create_user(
+            username="likeowner",
+            email="likeowner@example.com",
+            password="password123",
+            nickname="likeowner",
+        )
+        self.article = Article.objects.create(
+            user=self.owner, title="Test Article", content="Test Content"
+        )
+        self.users = [
+            User.objects.create_user(
+                username=f"liker{i}",
+                email=f"liker{i}@example.com",
+                password="password123",
+                nickname=f"liker{i}",
+            )
+            for i in range(30)
+        ]
+
+    def like_notifications(self):
+        return Notification.objects.filter(recipient=self.owner, verb="like")
+
+    def test_like_creates_one_notification_per_new_liker(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.article.likes.add(*self.users[:20])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.article.likes.add(self.users[20])
+
+        self.assertEqual(self.like_notifications().count(), 21)
+        self.assertEqual(
+            set(self.like_notifications().values_list("actor_id", flat=True)),
+            {user.id for user in self.users[:21]},
+        )
+        # bulk_create로 만든 알림도 읽지 않은 알림 수에 반영
+        self.assertEqual(timeline.get_unread_count(self.owner.id), 21)
+        self.assertEqual(len(timeline.get_latest(self.owner.id, 100)), 21)
+
+    def test_like_cost_does_not_depend_on_existing_likes(self):
+        self.article.likes.add(self.users[0])
+        with CaptureQueriesContext(connection) as few:
+            self.article.likes.add(self.users[1])
+
+        self.article.likes.add(*self.users[2:29])
+        with CaptureQueriesContext(connection) as many:
+            self.article.likes.add(self.users[29])
+
+        self.assertEqual(len(many.captured_queries), len(few.captured_queries))
+
+    def test_existing_notification_is_not_duplicated(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.article.likes.add(self.users[0])
+        # 좋아요 행만 삭제된 경우 (알림은 남아 있음)
+        Article.likes.through.objects.filter(user=self.users[0]).delete()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.article.likes.add(self.users[0])
+
+        self.assertEqual(self.like_notifications().count(), 1)
+
+    def test_unlike_removes_notifications(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.article.likes.add(*self.users[:3])
+
+        self.article.likes.remove(*self.users[:2])
+
+        self.assertEqual(
+            list(self.like_notifications().values_list("actor_id", flat=True)),
+            [self.users[2].id],
+        )
+
+
+@override_settings(NOTIFICATION_COALESCE_VERBS=())
+class NotificationListQueryTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username="listowner",
+            email="listowner@example.com",
+            password="password123",
+            nickname="listowner",
+        )
+        self.article = Article.objects.create(
+            user=self.owner, title="Test Article", content="Test Content"
+        )
+        self.client.force_authenticate(user=self.owner)
+        self.actor_count = 0
+
+    def create_notifications(self, count):
+        """댓글, 댓글 신고, 좋아요 알림을 count개씩 생성"""
+        with self.captureOnCommitCallbacks(execute=True):
+            for _ in range(count):
+                self.actor_count += 1
+                actor = User.objects.create_user(
+                    username=f"listactor{self.actor_count}",
+                    email=f"listactor{self.actor_count}@example.com",
+                    password="password123",
+                    nickname=f"listactor{self.actor_count}",
+                )
+                # 댓글 알림은 시그널로 생성
+                comment = Comment.objects.create(
+                    user=actor, article=self.article, content=f"댓글 {self.actor_count}"
+                )
+                report = CommentReport.objects.create(
+                    reporter=actor,
+                    reported_user=self.owner,
+                    reported_comment=comment,
+                    reported_article=self.article,
+                    report_detail="신고",
+                )
+                Notification.objects.create(
+                    recipient=self.owner,
+                    actor=actor,
+                    verb="report",
+                    content_type=ContentType.objects.get_for_model(report),
+                    object_id=report.id,
+                    article=self.article,
+                )
+                self.article.likes.add(actor)
+
+    def get_list(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse("notification-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data, len(context.captured_queries)
+
+    def test_query_count_does_not_depend_on_page_size(self):
+        self.create_notifications(2)
+        results, few = self.get_list()
+        self.assertEqual(len(results), 6)
+
+        self.create_notifications(4)
+        results, many = self.get_list()
+        self.assertEqual(len(results), 18)
+
+        self.assertEqual(many, few)
+        comment_contents = {(item["verb"], item["comment_content"]) for item in results}
+        self.assertIn(("comment", "댓글 6"), comment_contents)
+        self.assertIn(("report", "댓글 6"), comment_contents)
+        self.assertIn(("like", "None"), comment_contents)
+
+
+class NotificationBulkTests(APITestCase):
+    def setUp(self):
+        timeline.clear()
+        self.user = User.objects.create_user(
+            username="bulkuser",
+            email="bulkuser@example.com",
+            password="password123",
+            nickname="bulkuser",
+        )
+        self.other = User.objects.create_user(
+            username="bulkother",
+            email="bulkother@example.com",
+            password="password123",
+            nickname="bulkother",
+        )
+        self.article = Article.objects.create(
+            user=self.user, title="Test Article", content="Test Content"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.object_ids = itertools.count(1)
+
+    def create_notification(self, recipient=None, read=False):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Notification.objects.create(
+                recipient=recipient or self.user,
+                actor=self.other,
+                verb="like",
+                content_type=ContentType.objects.get_for_model(self.article),
+                object_id=next(self.object_ids),
+                article=self.article,
+                read=read,
+            )
+
+    def get_summary(self):
+        response = self.client.get(reverse("notification-summary"))
+        return response.data["unread_count"], [
+            item["id"] for item in response.data["results"]
+        ]
+
+    def test_mark_all_as_read_up_to_id(self):
+        notifications = [self.create_notification() for _ in range(3)]
+        other = self.create_notification(recipient=self.other)
+        self.assertEqual(self.get_summary()[0], 3)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertNumQueries(1):
+                response = self.client.post(
+                    reverse("notification-read-all"),
+                    {"up_to_id": notifications[1].id},
+                    format="json",
+                )
+        self.assertEqual(response.data, {"updated": 2})
+        self.assertEqual(self.get_summary()[0], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse("notification-read-all"))
+        self.assertEqual(response.data, {"updated": 1})
+        self.assertEqual(self.get_summary()[0], 0)
+        other.refresh_from_db()
+        self.assertFalse(other.read)
+
+    def test_bulk_delete_only_own_notifications(self):
+        notifications = [self.create_notification(read=i == 0) for i in range(3)]
+        other = self.create_notification(recipient=self.other)
+        self.assertEqual(self.get_summary()[0], 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertNumQueries(1):
+                response = self.client.post(
+                    reverse("notification-bulk-delete"),
+                    {"ids": [notifications[0].id, notifications[1].id, other.id]},
+                    format="json",
+                )
+        self.assertEqual(response.data, {"deleted": 2})
+        self.assertTrue(Notification.objects.filter(id=other.id).exists())
+        self.assertEqual(self.get_summary(), (1, [notifications[2].id]))
+
+    def test_bulk_delete_requires_ids(self):
+        for data in ({}, {"ids": []}, {"ids": ["a"]}, {"ids": 1}):
+            response = self.client.post(
+                reverse("notification-bulk-delete"), data, format="json"
+            )
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_purge_read_notifications(self):
+        old_read = [self.create_notification(read=True) for _ in range(3)]
+        old_unread = self.create_notification()
+        recent_read = self.create_notification(read=True)
+        Notification.objects.exclude(id=recent_read.id).update(
+            timestamp=timezone.now() - timedelta(days=31)
+        )
+        self.get_summary()
+
+        out = StringIO()
+        call_command(
+            "purge_read_notifications", "--days", "30", "--batch-size", "2", stdout=out
+        )
+
+        self.assertIn("3개", out.getvalue())
+        self.assertQuerySetEqual(
+            Notification.objects.order_by("id").values_list("id", flat=True),
+            [old_unread.id, recent_read.id],
+        )
+        # 삭제된 알림은 타임라인에서도 빠짐
+        self.assertEqual(self.get_summary(), (1, [recent_read.id, old_unread.id]))
+        self.assertFalse(
+            Notification.objects.filter(id__in=[n.id for n in old_read]).exists()
+        )
+
+
+class NotificationCoalescingTests(APITestCase):
+    def setUp(self):
+        timeline.clear()
+        self.owner = User.objects.create_user(
+            username="coalesceowner",
+            email="coalesceowner@example.com",
+            password="password123",
+            nickname="coalesceowner",
+        )
+        self.article = Article.objects.create(
+            user=self.owner, title="Test Article", content="Test Content"
+        )
+        self.users = [
+            User.objects.create_user(
+                username=f"coalesce{i}",
+                email=f"coalesce{i}@example.com",
+                password="password123",
+                nickname=f"coalesce{i}",
+            )
+            for i in range(10)
+        ]
+        self.client.force_authenticate(user=self.owner)
+
+    def like(self, *users):
+        with self.captureOnCommitCallbacks(execute=True):
+            for user in users:
+                self.article.likes.add(user)
+
+    def test_list_pages_are_stable_while_notifications_merge(self):
+        self.like(self.users[0])
+        liked = Notification.objects.get(recipient=self.owner, verb="like")
+        for object_id in range(1, 4):
+            Notification.objects.create(
+                recipient=self.owner,
+                actor=self.users[object_id],
+                verb="report",
+                content_type=ContentType.objects.get_for_model(self.article),
+                object_id=object_id,
+                article=self.article,
+            )
+
+        url = reverse("notification-list")
+        first = self.client.get(url, {"cursor": "", "page_size": 2}).data
+        # 다음 페이지를 읽기 전에 이미 지나간 범위 밖의 묶음 알림에 좋아요가 합쳐짐
+        self.like(self.users[4])
+        liked.refresh_from_db()
+        self.assertEqual(liked.actor_count, 2)
+        self.assertGreater(liked.timestamp, liked.created_at)
+        second = self.client.get(url, {"cursor": first["next"], "page_size": 2}).data
+
+        # timestamp가 바뀌어도 생성 순서로 정렬하므로 누락/중복 없이 한 번씩 조회됨
+        ids = [item["id"] for item in first["results"] + second["results"]]
+        self.assertEqual(len(ids), 4)
+        self.assertEqual(ids[-1], liked.id)
+        self.assertEqual(second["results"][-1]["actor_count"], 2)
+        self.assertIsNone(second["next"])
+
+    def test_likes_in_window_are_folded_into_one_notification(self):
+        self.assertEqual(timeline.get_unread_count(self.owner.id), 0)
+        self.like(*self.users)
+
+        notification = Notification.objects.get(recipient=self.owner, verb="like")
+        self.assertEqual(notification.actor_count, 10)
+        self.assertEqual(notification.actor_id, self.users[9].id)
+        self.assertEqual(
+            notification.latest_actors, [user.id for user in self.users[:6:-1]]
+        )
+        self.assertEqual(timeline.get_unread_count(self.owner.id), 1)
+
+        response = self.client.get(reverse("notification-summary"))
+        [item] = response.data["results"]
+        self.assertEqual(item["actor_count"], 10)
+        self.assertEqual(
+            [actor["nickname"] for actor in item["latest_actors"]],
+            ["coalesce9", "coalesce8", "coalesce7"],
+        )
+        self.assertEqual(
+            item["description"], "님 외 9명이 회원님의 게시글을 좋아합니다"
+        )
+
+    def test_read_notification_becomes_unread_on_new_event(self):
+        self.like(self.users[0])
+        self.client.post(reverse("notification-read-all"))
+        self.assertEqual(timeline.get_unread_count(self.owner.id), 0)
+
+        self.like(self.users[1])
+
+        notification = Notification.objects.get(recipient=self.owner, verb="like")
+        self.assertFalse(notification.read)
+        self.assertEqual(timeline.get_unread_count(self.owner.id), 1)
+
+    def test_same_actor_is_counted_once(self):
+        self.like(self.users[0], self.users[1])
+        self.article.likes.remove(self.users[0])
+        self.like(self.users[0])
+
+        notification = Notification.objects.get(recipient=self.owner, verb="like")
+        self.assertEqual(notification.actor_count, 2)
+
+    def test_new_window_starts_new_notification(self):
+        self.like(self.users[0])
+        with patch(
+            "notifications.coalescing.get_window",
+            side_effect=lambda timestamp: 10**9,
+        ):
+            self.like(self.users[1])
+
+        self.assertEqual(
+            Notification.objects.filter(recipient=self.owner, verb="like").count(), 2
+        )
+
+    def test_unlike_removes_single_actor_notification(self):
+        self.like(self.users[0])
+        self.article.likes.remove(self.users[0])
+        self.assertFalse(Notification.objects.filter(verb="like").exists())
+
+    def test_comments_are_folded(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for user in self.users[:3]:
+                comment = Comment.objects.create(
+                    user=user, article=self.article, content=user.nickname
+                )
+
+        notification = Notification.objects.get(recipient=self.owner, verb="comment")
+        self.assertEqual(notification.actor_count, 3)
+        self.assertEqual(notification.object_id, comment.id)
+        response = self.client.get(reverse("notification-list"))
+        self.assertEqual(response.data[0]["comment_content"], "coalesce2")
+
+
+class NotificationDispatcherTests(TestCase):
+    def setUp(self):
+        timeline.clear()
+        self.owner = User.objects.create_user(
+            username="dispatchowner",
+            email="dispatchowner@example.com",
+            password="password123",
+            nickname="dispatchowner",
+        )
+        self.users = [
+            User.objects.create_user(
+                username=f"dispatch{i}",
+                email=f"dispatch{i}@example.com",
+                password="password123",
+                nickname=f"dispatch{i}",
+            )
+            for i in range(3)
+        ]
+        self.article = Article.objects.create(
+            user=self.owner, title="Test Article", content="Test Content"
+        )
+
+    def notify_select(self, user):
+        dispatcher.notify(
+            "select",
+            self.article,
+            self.article.id,
+            recipient_id=user.id,
+            actor_id=self.owner.id,
+        )
+
+    def test_events_are_saved_once_after_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            for user in self.users + self.users:
+                self.notify_select(user)
+            # 커밋 전에는 저장하지 않음
+            self.assertFalse(Notification.objects.filter(verb="select").exists())
+
+        # 트랜잭션당 저장 콜백 1개(나머지는 이벤트별 빈 콜백), bulk_create 1회 + 생성된 알림 조회 1회
+        self.assertEqual(len(callbacks), 7)
+        with self.assertNumQueries(2):
+            for callback in callbacks:
+                callback()
+        self.assertEqual(Notification.objects.filter(verb="select").count(), 3)
+        self.assertEqual(timeline.get_unread_count(self.users[0].id), 1)
+
+        # 이미 있는 알림은 unique 제약으로 무시
+        with self.captureOnCommitCallbacks(execute=True):
+            self.notify_select(self.users[0])
+        self.assertEqual(Notification.objects.filter(verb="select").count(), 3)
+        self.assertEqual(timeline.get_unread_count(self.users[0].id), 1)
+
+    def test_rolled_back_events_are_discarded(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.notify_select(self.users[0])
+            try:
+                with transaction.atomic():
+                    self.notify_select(self.users[1])
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            self.notify_select(self.users[2])
+
+        self.assertEqual(
+            set(
+                Notification.objects.filter(verb="select").values_list(
+                    "recipient_id", flat=True
+                )
+            ),
+            {self.users[0].id, self.users[2].id},
+        )
+
+    def test_batch_created_in_rolled_back_savepoint_is_discarded(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    self.notify_select(self.users[0])
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            # 롤백으로 저장 콜백이 버려졌으므로 새 Batch에 모아 저장
+            self.notify_select(self.users[1])
+
+        self.assertEqual(
+            list(
+                Notification.objects.filter(verb="select").values_list(
+                    "recipient_id", flat=True
+                )
+            ),
+            [self.users[1].id],
+        )
+
+    def test_admin_notifications_are_not_duplicated(self):
+        # 신고 접수 시그널로 어드민 알림 생성 (recipient 없음)
+        with self.captureOnCommitCallbacks(execute=True):
+            report = ArticleReport.objects.create(
+                reporter=self.users[0],
+                reported_user=self.owner,
+                reported_article=self.article,
+                report_detail="신고",
+            )
+        with self.captureOnCommitCallbacks(execute=True):
+            dispatcher.notify(
+                "report",
+                report,
+                self.article.id,
+                actor_id=self.owner.id,
+                is_admin=True,
+            )
+        self.assertEqual(Notification.objects.filter(is_admin=True).count(), 1)
+
+    @override_settings(NOTIFICATION_DISPATCH_WORKERS=2)
+    def test_events_are_saved_on_worker(self):
+        executor = Mock()
+        with patch("notifications.dispatcher.get_executor", return_value=executor):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.notify_select(self.users[0])
+
+        executor.submit.assert_called_once()
+        run_in_thread, events = executor.submit.call_args.args
+        self.assertEqual(run_in_thread, dispatcher.run_in_thread)
+        self.assertEqual([event.recipient_id for event in events], [self.users[0].id])
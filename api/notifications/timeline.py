@@ -0,0 +1,249 @@
+from common import metrics
+from common.cache import get_redis
+from common.logger import logger
+from django.conf import settings
+
+from .models import Notification
+
+# 사용자별 최근 알림 타임라인 (Redis sorted set: 알림 ID -> 생성 시각(마이크로초))
+TIMELINE_KEY = "notification_timeline:{user_id}"
+# 사용자별 읽지 않은 알림 수 (Redis string)
+UNREAD_KEY = "notification_unread:{user_id}"
+
+# 읽지 않은 알림 수 증감 (키가 없으면 다음 조회 때 DB에서 다시 계산하므로 그대로 둠)
+_ADJUST_UNREAD = """
+if tonumber(ARGV[3]) ~= 0 and redis.call('exists', KEYS[2]) == 1 then
+    if redis.call('incrby', KEYS[2], ARGV[3]) < 0 then
+        redis.call('del', KEYS[2])
+    end
+end
+"""
+
+# 타임라인이 이미 만들어진 경우에만 추가 (없으면 다음 조회 때 DB에서 전체를 채움)
+_ZADD = """
+if redis.call('exists', KEYS[1]) == 1 then
+    redis.call('zadd', KEYS[1], ARGV[4], ARGV[1])
+    redis.call('zremrangebyrank', KEYS[1], 0, -tonumber(ARGV[2]) - 1)
+    redis.call('expire', KEYS[1], ARGV[5])
+end
+"""
+_ADD_SCRIPT = _ZADD + _ADJUST_UNREAD
+
+# 갱신된 묶음 알림을 맨 앞으로 옮기고, 이전 읽음 상태를 알 수 없으므로 알림 수는 다시 계산하게 함
+_TOUCH_SCRIPT = _ZADD + """
+redis.call('del', KEYS[2])
+"""
+
+# 꽉 찬 타임라인에서 알림을 빼면 더 오래된 알림을 알 수 없으므로 다음 조회 때 다시 채움
+_REMOVE_SCRIPT = """
+if redis.call('zrem', KEYS[1], ARGV[1]) == 1
+        and redis.call('zcard', KEYS[1]) == tonumber(ARGV[2]) - 1 then
+    redis.call('del', KEYS[1])
+end
+""" + _ADJUST_UNREAD
+
+
+def get_timeline_key(user_id):
+    return TIMELINE_KEY.format(user_id=user_id)
+
+
+def get_unread_key(user_id):
+    return UNREAD_KEY.format(user_id=user_id)
+
+
+def get_score(notification):
+    return int(notification.timestamp.timestamp() * 1_000_000)
+
+
+def is_tracked(notification):
+    """사용자에게 보내는 알림만 타임라인에 저장 (어드민 알림 제외)"""
+    return notification.recipient_id is not None and not notification.is_admin
+
+
+def _eval(script, user_id, notification_id, unread_delta, score=0):
+    redis = get_redis()
+    if redis is None:
+        return
+    try:
+        redis.eval(
+            script,
+            2,
+            get_timeline_key(user_id),
+            get_unread_key(user_id),
+            notification_id,
+            settings.NOTIFICATION_TIMELINE_SIZE,
+            unread_delta,
+            score,
+            settings.NOTIFICATION_TIMELINE_TTL,
+        )
+    except Exception as e:
+        # Redis 값은 TTL이 지나거나 rebuild 명령을 실행하면 DB 기준으로 다시 맞춰짐
+        metrics.increment("notification.timeline.error")
+        logger.warning(f"알림 타임라인 갱신 실패 ({user_id}, {notification_id}): {e}")
+
+
+def _run_script(script, notification, unread_delta):
+    if not is_tracked(notification):
+        return
+    _eval(
+        script,
+        notification.recipient_id,
+        notification.id,
+        unread_delta,
+        get_score(notification),
+    )
+
+
+def add(notification):
+    """DB에 저장된 알림을 수신자의 타임라인에 추가하고, 읽지 않은 알림 수를 1 올립니다."""
+    _run_script(_ADD_SCRIPT, notification, 0 if notification.read else 1)
+
+
+def remove(notification):
+    """삭제된 알림을 타임라인에서 빼고, 읽지 않은 알림이었다면 알림 수를 1 내립니다."""
+    _run_script(_REMOVE_SCRIPT, notification, 0 if notification.read else -1)
+
+
+def touch(notification):
+    """묶음 알림(coalescing)에 이벤트가 더해져 시각이 바뀌고 읽지 않은 상태가 된 뒤 호출합니다."""
+    _run_script(_TOUCH_SCRIPT, notification, 0)
+
+
+def mark_read(notification):
+    """읽지 않은 상태였던 알림을 읽음 처리한 뒤 호출합니다."""
+    _run_script(_ADJUST_UNREAD, notification, -1)
+
+
+def adjust_unread(user_id, delta):
+    """여러 알림을 한 번에 읽음/삭제 처리한 뒤 읽지 않은 알림 수를 delta만큼 바꿉니다."""
+    if user_id is not None and delta:
+        _eval(_ADJUST_UNREAD, user_id, 0, delta)
+
+
+def invalidate(user_ids):
+    """사용자들의 타임라인을 삭제합니다. (다음 조회 때 DB에서 다시 채움)"""
+    keys = [get_timeline_key(user_id) for user_id in user_ids if user_id is not None]
+    redis = get_redis()
+    if redis is None or not keys:
+        return
+    try:
+        redis.delete(*keys)
+    except Exception as e:
+        metrics.increment("notification.timeline.error")
+        logger.warning(f"알림 타임라인 삭제 실패: {e}")
+
+
+def get_unread_count(user_id):
+    """읽지 않은 알림 수를 반환합니다. Redis에 없거나 사용할 수 없으면 DB에서 계산합니다."""
+    redis = get_redis()
+    if redis is not None:
+        try:
+            count = redis.get(get_unread_key(user_id))
+            if count is not None:
+                metrics.increment("notification.unread.hit")
+                return int(count)
+        except Exception as e:
+            redis = None
+            metrics.increment("notification.timeline.error")
+            logger.warning(f"읽지 않은 알림 수 조회 실패, DB에서 계산합니다: {e}")
+
+    metrics.increment("notification.unread.miss")
+    count = Notification.objects.filter(recipient_id=user_id, read=False).count()
+    if redis is not None:
+        try:
+            redis.set(
+                get_unread_key(user_id),
+                count,
+                nx=True,
+                ex=settings.NOTIFICATION_TIMELINE_TTL,
+            )
+        except Exception:
+            pass
+    return count
+
+
+def get_latest(user_id, limit):
+    """
+    최근 알림 limit개를 최신순으로 반환합니다. (limit은 NOTIFICATION_TIMELINE_SIZE 이하)
+    Redis 타임라인에서 ID를 가져오고, 타임라인이 없으면 DB에서 다시 채웁니다.
+    """
+    redis = get_redis()
+    notification_ids = None
+    if redis is not None:
+        try:
+            notification_ids = [
+                int(notification_id)
+                for notification_id in redis.zrevrange(
+                    get_timeline_key(user_id), 0, limit - 1
+                )
+            ]
+        except Exception as e:
+            metrics.increment("notification.timeline.error")
+            logger.warning(f"알림 타임라인 조회 실패, DB에서 조회합니다: {e}")
+
+    if notification_ids:
+        metrics.increment("notification.timeline.hit")
+    else:
+        metrics.increment("notification.timeline.miss")
+        notification_ids = rebuild(user_id)[:limit]
+
+    notifications = Notification.objects.select_related(
+        "actor", "article", "content_type"
+    ).in_bulk(notification_ids)
+    # 타임라인 순서 유지 (갱신 전에 삭제된 알림은 제외)
+    return [
+        notifications[notification_id]
+        for notification_id in notification_ids
+        if notification_id in notifications
+        and notifications[notification_id].recipient_id == user_id
+    ]
+
+
+def rebuild(user_id, unread_count=None):
+    """
+    DB에서 사용자의 최근 알림으로 타임라인을 다시 만들고 알림 ID 목록(최신순)을 반환합니다.
+    unread_count를 전달하면 읽지 않은 알림 수도 함께 저장합니다.
+    """
+    rows = list(
+        Notification.objects.filter(recipient_id=user_id, is_admin=False)
+        .order_by("-timestamp", "-id")
+        .values_list("id", "timestamp")[: settings.NOTIFICATION_TIMELINE_SIZE]
+    )
+    redis = get_redis()
+    if redis is None:
+        return [notification_id for notification_id, _ in rows]
+
+    timeline_key = get_timeline_key(user_id)
+    ttl = settings.NOTIFICATION_TIMELINE_TTL
+    try:
+        pipe = redis.pipeline()
+        pipe.delete(timeline_key)
+        if rows:
+            pipe.zadd(
+                timeline_key,
+                {
+                    notification_id: int(timestamp.timestamp() * 1_000_000)
+                    for notification_id, timestamp in rows
+                },
+            )
+            pipe.expire(timeline_key, ttl)
+        if unread_count is not None:
+            pipe.set(get_unread_key(user_id), unread_count, ex=ttl)
+        pipe.execute()
+    except Exception as e:
+        metrics.increment("notification.timeline.error")
+        logger.warning(f"알림 타임라인 재생성 실패 ({user_id}): {e}")
+    return [notification_id for notification_id, _ in rows]
+
+
+def clear():
+    """모든 사용자의 타임라인과 읽지 않은 알림 수를 삭제합니다."""
+    redis = get_redis()
+    if redis is None:
+        return 0
+    deleted = 0
+    for pattern in (TIMELINE_KEY, UNREAD_KEY):
+        keys = list(redis.scan_iter(match=pattern.format(user_id="*"), count=1000))
+        for i in range(0, len(keys), 1000):
+            deleted += redis.delete(*keys[i : i + 1000])
+    return deleted
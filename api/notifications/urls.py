@@ -5,14 +5,26 @@ from .views import (
     AdminNotificationDetailView,
     AdminNotificationListView,
     AdminNotificationMarkAsReadView,
+    NotificationBulkDeleteView,
+    NotificationBulkMarkAsReadView,
     NotificationDeleteView,
     NotificationDetailView,
     NotificationListView,
     NotificationMarkAsReadView,
+    NotificationStreamView,
+    NotificationSummaryView,
 )
 
 urlpatterns = [
     path("", NotificationListView.as_view(), name="notification-list"),
+    path("stream/", NotificationStreamView.as_view(), name="notification-stream"),
+    path("summary/", NotificationSummaryView.as_view(), name="notification-summary"),
+    path(
+        "read/", NotificationBulkMarkAsReadView.as_view(), name="notification-read-all"
+    ),
+    path(
+        "delete/", NotificationBulkDeleteView.as_view(), name="notification-bulk-delete"
+    ),
     path("<int:pk>/", NotificationDetailView.as_view(), name="notification-detail"),
     path(
         "<int:pk>/read/",
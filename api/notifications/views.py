@@ -1,22 +1,90 @@
+from asgiref.sync import sync_to_async
+from common.authentication.cookie_authentication import CookieJWTAuthentication
+from common.pagination import KeysetPagination
+from django.conf import settings
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views import View
+from notifications import bulk, stream, timeline
 from notifications.models import Notification
-from rest_framework import generics, status
+from rest_framework import exceptions, generics, status
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from .serializers import AdminNotificationSerializer, NotificationSerializer
 
 
+# 알림 목록 커서 페이지네이션 (생성 최신순)
+# 묶음 알림은 이벤트가 합쳐질 때 timestamp가 바뀌므로, 페이지를 넘기는 중에 행이 커서 앞으로
+# 옮겨가 누락되거나 중복되지 않도록 바뀌지 않는 created_at으로 정렬
+class NotificationPagination(KeysetPagination):
+    page_size = 20
+    ordering = ("-created_at", "-id")
+
+
 # 특정 사용자가 받은 모든 알림을 조회
 class NotificationListView(generics.ListAPIView):
     serializer_class = NotificationSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = NotificationPagination
 
     def get_queryset(self):
-        return Notification.objects.filter(recipient=self.request.user).order_by(
-            "-timestamp"
+        return NotificationSerializer.setup_eager_loading(
+            Notification.objects.filter(recipient=self.request.user)
+        ).order_by("-created_at", "-id")
+
+
+# 읽지 않은 알림 수와 최근 알림 N개를 조회 (알림 목록 전체를 폴링하지 않도록)
+class NotificationSummaryView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        try:
+            limit = int(
+                request.query_params.get("limit", settings.NOTIFICATION_SUMMARY_SIZE)
+            )
+        except ValueError:
+            limit = settings.NOTIFICATION_SUMMARY_SIZE
+        limit = max(1, min(limit, settings.NOTIFICATION_TIMELINE_SIZE))
+
+        notifications = timeline.get_latest(request.user.id, limit)
+        return Response(
+            {
+                "unread_count": timeline.get_unread_count(request.user.id),
+                "results": NotificationSerializer(notifications, many=True).data,
+            },
+            status=status.HTTP_200_OK,
         )
 
 
+# 새 알림을 Server-Sent Events로 전달 (ASGI 서버에서 실행해야 연결을 오래 유지할 수 있음)
+class NotificationStreamView(View):
+    async def get(self, request):
+        try:
+            auth = await sync_to_async(CookieJWTAuthentication().authenticate)(request)
+        except exceptions.AuthenticationFailed:
+            auth = None
+        if auth is None:
+            return JsonResponse(
+                {"detail": str(exceptions.NotAuthenticated.default_detail)},
+                status=status.HTTP_401_UNAUTHORIZED,
+            )
+
+        # 재연결 시 브라우저가 보내는 Last-Event-ID (또는 쿼리 파라미터) 이후 알림부터 전달
+        last_event = stream.parse_event_id(
+            request.headers.get("Last-Event-ID") or request.GET.get("last_event_id")
+        )
+
+        response = StreamingHttpResponse(
+            stream.stream_events(auth[0].id, last_event),
+            content_type="text/event-stream",
+        )
+        response["Cache-Control"] = "no-cache"
+        # nginx 등 프록시가 응답을 버퍼링하지 않도록 설정
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+
 # 특정 알림의 세부정보를 조회
 class NotificationDetailView(generics.RetrieveAPIView):
     queryset = Notification.objects.all()
@@ -33,10 +101,16 @@ class NotificationMarkAsReadView(generics.UpdateAPIView):
     serializer_class = NotificationSerializer
     permission_classes = [IsAuthenticated]
 
+    def get_queryset(self):
+        return super().get_queryset().filter(recipient=self.request.user)
+
     def update(self, request, *args, **kwargs):
         notification = self.get_object()
-        notification.read = True
-        notification.save()
+        # 읽지 않은 알림이었을 때만 읽지 않은 알림 수 감소
+        if Notification.objects.filter(id=notification.id, read=False).update(
+            read=True
+        ):
+            timeline.mark_read(notification)
         return Response(
             {"status": "알림이 읽음 상태로 변경되었습니다."}, status=status.HTTP_200_OK
         )
@@ -52,13 +126,62 @@ class NotificationDeleteView(generics.DestroyAPIView):
         return super().get_queryset().filter(recipient=self.request.user)
 
 
+# 읽지 않은 알림을 한 번에 읽음 상태로 변경 (up_to_id를 보내면 그 ID 이하의 알림만)
+class NotificationBulkMarkAsReadView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        up_to_id = request.data.get("up_to_id")
+        if up_to_id is not None:
+            try:
+                up_to_id = int(up_to_id)
+            except (TypeError, ValueError):
+                return Response(
+                    {"detail": "up_to_id는 정수여야 합니다."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        updated = bulk.mark_read(request.user.id, up_to_id)
+        return Response({"updated": updated}, status=status.HTTP_200_OK)
+
+
+# 여러 알림을 한 번에 삭제
+class NotificationBulkDeleteView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        ids = request.data.get("ids")
+        try:
+            ids = [int(notification_id) for notification_id in ids]
+        except (TypeError, ValueError):
+            ids = None
+        if not ids:
+            return Response(
+                {"detail": "삭제할 알림 ID 목록(ids)을 제공해야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(ids) > settings.NOTIFICATION_BULK_DELETE_SIZE:
+            return Response(
+                {
+                    "detail": f"한 번에 최대 {settings.NOTIFICATION_BULK_DELETE_SIZE}개까지 삭제할 수 있습니다."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        deleted = bulk.delete(request.user.id, ids)
+        return Response({"deleted": deleted}, status=status.HTTP_200_OK)
+
+
 # 어드민 유저가 받은 모든 알림을 조회
 class AdminNotificationListView(generics.ListAPIView):
     serializer_class = AdminNotificationSerializer
     permission_classes = [IsAdminUser]
+    pagination_class = NotificationPagination
 
     def get_queryset(self):
-        return Notification.objects.filter(is_admin=True).order_by("-timestamp")
+        return NotificationSerializer.setup_eager_loading(
+            Notification.objects.filter(is_admin=True)
+        ).order_by("-created_at", "-id")
 
 
 # 어드민 특정 알림의 세부정보를 조회
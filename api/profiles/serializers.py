@@ -2,7 +2,7 @@ from articles.models import Article
 from articles.serializers import ArticleListSerializer
 from comments.models import Comment
 from comments.serializers import UserCommentListSerializer
-from django.db.models import Count, Sum
+from django.db.models import Sum
 from rest_framework import serializers
 from rest_framework.serializers import ModelSerializer
 from tags.models import Tag
@@ -12,6 +12,18 @@ from users.models import User
 from .models import Profile
 
 
+# 프로필 이미지 직접 업로드 완료 확인 요청
+class ProfileImageConfirmSerializer(serializers.Serializer):
+    key = serializers.CharField(max_length=500)
+
+    def validate_key(self, key):
+        # 본인 경로에 발급된 키만 허용
+        user = self.context["request"].user
+        if not key.startswith(f"profile_images/{user.id}/") or ".." in key:
+            raise serializers.ValidationError("Invalid image key")
+        return key
+
+
 class ProfileSerializer(serializers.ModelSerializer):
     profile_image = serializers.SerializerMethodField()
     selected_tags = serializers.PrimaryKeyRelatedField(
@@ -79,8 +91,12 @@ class ProfileSerializer(serializers.ModelSerializer):
         return Comment.objects.filter(user=obj.user, is_selected=True).count()
 
     def get_articles(self, obj):
-        articles = Article.objects.filter(user=obj.user).order_by("-created_at")
-        return ArticleListSerializer(articles, many=True).data
+        request = self.context.get("request")
+        articles = ArticleListSerializer.setup_eager_loading(
+            Article.objects.filter(user=obj.user).order_by("-created_at"),
+            request.user if request else None,
+        )
+        return ArticleListSerializer(articles, many=True, context=self.context).data
 
     def get_comments(self, obj):
         comments = Comment.objects.filter(user=obj.user).order_by("-created_at")
@@ -102,7 +118,7 @@ class ProfileSerializer(serializers.ModelSerializer):
 
     def get_liked_articles_count(self, obj):
         result = Article.objects.filter(user=obj.user).aggregate(
-            total_likes=Count("likes")
+            total_likes=Sum("like_count")
         )
         return result["total_likes"] or 0
 
@@ -1,6 +1,8 @@
 import json
 
 import pytz
+from common import storage
+from common.testing import use_fake_s3
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.urls import reverse
@@ -96,9 +98,8 @@ class UserProfileDetailTest(APITestCase):
             nickname="testnickname",
             social_platform="general",
         )
-        self.profile = Profile.objects.get(
-            user=self.user)
-        self.profile.bio="This is a test bio."
+        self.profile = Profile.objects.get(user=self.user)
+        self.profile.bio = "This is a test bio."
         self.profile.save()
 
         # 닉네임 중복 테스트를 위해 추가 사용자 생성
@@ -109,10 +110,9 @@ class UserProfileDetailTest(APITestCase):
             nickname="duplicatenickname",
             social_platform="general",
         )
-        self.profile2 = Profile.objects.get(
-            user=self.user2)
+        self.profile2 = Profile.objects.get(user=self.user2)
         self.profile2.hunsoo_level = 2
-        self.profile2.bio="This is another test bio."
+        self.profile2.bio = "This is another test bio."
         self.profile2.save()
 
         # JWT 토큰 생성
@@ -198,3 +198,57 @@ class UserProfileDetailTest(APITestCase):
         self.profile.delete()
         self.user2.delete()
         self.profile2.delete()
+
+
+class ProfileImagePresignTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="presign@example.com",
+            username="presign",
+            password="testpassword",
+            nickname="presign",
+            social_platform="general",
+        )
+        self.client.force_authenticate(user=self.user)
+        self.s3_client = use_fake_s3(self)
+
+    def test_presign_and_confirm(self):
+        response = self.client.post(
+            reverse("profile-image-presign"),
+            {"content_type": "image/webp"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        key = response.data["key"]
+
+        confirm_url = reverse("profile-image-confirm")
+        response = self.client.post(confirm_url, {"key": key}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.s3_client.objects[key] = b"webp"
+        response = self.client.post(confirm_url, {"key": key}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        profile = Profile.objects.get(user=self.user)
+        self.assertEqual(profile.profile_image, storage.get_url(key))
+
+    def test_confirm_rejects_non_string_key(self):
+        for key in (None, 123, ["profile_images/"], {"key": "x"}):
+            with self.subTest(key=key):
+                response = self.client.post(
+                    reverse("profile-image-confirm"), {"key": key}, format="json"
+                )
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_confirm_rejects_other_users_key(self):
+        key = "profile_images/9999/other.png"
+        self.s3_client.objects[key] = b"png"
+
+        response = self.client.post(
+            reverse("profile-image-confirm"), {"key": key}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertNotEqual(
+            Profile.objects.get(user=self.user).profile_image, storage.get_url(key)
+        )
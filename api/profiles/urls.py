@@ -5,7 +5,12 @@ from .views.profile_auth_views import (
     UserProfileDetailView,
     UserProfileUpdateView,
 )
-from .views.profile_image_views import DeleteProfileImageView, UpdateProfileImageView
+from .views.profile_image_views import (
+    DeleteProfileImageView,
+    ProfileImageConfirmView,
+    ProfileImagePresignView,
+    UpdateProfileImageView,
+)
 
 urlpatterns = [
     path("profile/", UserProfileDetailView.as_view(), name="user-profile-detail"),
@@ -24,4 +29,14 @@ urlpatterns = [
         DeleteProfileImageView.as_view(),
         name="profile-image-delete",
     ),
+    path(
+        "profile/image/presign/",
+        ProfileImagePresignView.as_view(),
+        name="profile-image-presign",
+    ),
+    path(
+        "profile/image/confirm/",
+        ProfileImageConfirmView.as_view(),
+        name="profile-image-confirm",
+    ),
 ]
@@ -1,10 +1,11 @@
+from common import storage
 from profiles.models import Profile
-from profiles.s3instance import S3Instance
-from profiles.serializers import ProfileSerializer
+from profiles.serializers import ProfileImageConfirmSerializer, ProfileSerializer
 from rest_framework import generics, status
 from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
 
 class UpdateProfileImageView(generics.UpdateAPIView):
@@ -29,14 +30,14 @@ class UpdateProfileImageView(generics.UpdateAPIView):
             )
 
         # S3에 이미지 업로드
-        s3instance = S3Instance().get_s3_instance()
-        profile_image_url = S3Instance.upload_file(
-            s3instance, profile_image_file, profile.user.id
+        profile_image_url = storage.upload_file(
+            profile_image_file,
+            storage.generate_key(f"profile_images/{profile.user.id}"),
         )
 
         # 기존 이미지 삭제
         if profile.profile_image:
-            S3Instance.delete_file(s3instance, profile.profile_image)
+            storage.delete_url(profile.profile_image, fail_silently=True)
 
         # 새 이미지 URL로 프로필 업데이트
         profile.profile_image = profile_image_url
@@ -65,11 +66,71 @@ class DeleteProfileImageView(generics.UpdateAPIView):
 
         if profile.profile_image:
             # S3에서 이미지 삭제
-            s3instance = S3Instance().get_s3_instance()
-            S3Instance.delete_file(s3instance, profile.profile_image)
+            storage.delete_url(profile.profile_image, fail_silently=True)
 
             # 프로필 이미지 필드를 비웁니다.
             profile.profile_image = None
             profile.save()
 
         return Response({"message": "Profile image deleted"}, status=status.HTTP_200_OK)
+
+
+# 프로필 이미지 직접 업로드(presigned POST) 발급 뷰
+class ProfileImagePresignView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        try:
+            upload = storage.create_presigned_upload(
+                f"profile_images/{request.user.id}", request.data.get("content_type")
+            )
+        except ValueError:
+            return Response(
+                {"error": "Unsupported image type"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # 클라이언트는 업로드 후 key를 confirm 요청으로 전달
+        return Response(upload, status=status.HTTP_201_CREATED)
+
+
+# 프로필 이미지 직접 업로드 완료 확인 뷰
+class ProfileImageConfirmView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        try:
+            profile = Profile.objects.get(user=request.user)
+        except Profile.DoesNotExist:
+            return Response(
+                {"error": "Profile not found"}, status=status.HTTP_404_NOT_FOUND
+            )
+
+        serializer = ProfileImageConfirmSerializer(
+            data=request.data, context={"request": request}
+        )
+        if not serializer.is_valid():
+            return Response(
+                {"error": "Invalid image key"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        key = serializer.validated_data["key"]
+        if not storage.object_exists(key):
+            return Response(
+                {"error": "Image has not been uploaded"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        profile_image_url = storage.get_url(key)
+        # 기존 이미지 삭제
+        if profile.profile_image and profile.profile_image != profile_image_url:
+            storage.delete_url(profile.profile_image, fail_silently=True)
+
+        profile.profile_image = profile_image_url
+        profile.save()
+
+        return Response(
+            {
+                "message": "Profile image updated successfully.",
+                "profile_image": profile_image_url,
+            },
+            status=status.HTTP_200_OK,
+        )
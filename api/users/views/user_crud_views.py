@@ -3,6 +3,7 @@ from articles.serializers import ArticleDetailSerializer
 from comments.models import Comment
 from comments.serializers import CommentDetailSerializer
 from common.logger import logger
+from common.pagination import KeysetPagination
 from django.shortcuts import get_object_or_404
 from reports.models import ArticleReport, CommentReport
 from reports.serializers import (
@@ -65,9 +66,17 @@ class SwitchUserAuthorizationView(UpdateAPIView):
 class UserListForAdmin(ListAPIView):
     serializer_class = UserSerializer
     permission_classes = [IsAdminUser]
+    pagination_class = KeysetPagination
 
     def get(self, request, *args, **kwargs):
         users = User.objects.all()
+
+        # cursor 파라미터가 있는 경우에만 페이지 단위로 조회
+        page = self.paginate_queryset(users)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
         serializer = self.get_serializer(users, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
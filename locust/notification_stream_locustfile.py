@@ -0,0 +1,98 @@
+"""
+알림 SSE 스트림 부하 테스트 (유휴 연결 유지)
+
+사용자마다 /api/notification/stream/ 연결을 하나씩 열어 두고, 서버가 연결을 닫으면
+(NOTIFICATION_STREAM_MAX_AGE) 마지막으로 받은 이벤트 ID로 다시 연결합니다.
+스트림은 ASGI 서버(config.asgi:application)에서 실행 중이어야 합니다.
+
+예) 유휴 연결 10,000개:
+    locust -f locust/notification_stream_locustfile.py --host=http://app:8000 \\
+        --headless -u 10000 -r 200 --processes -1
+
+STREAM_USERNAME/STREAM_PASSWORD를 지정하면 회원가입 없이 같은 계정으로 연결합니다.
+"""
+
+import os
+import random
+import string
+import time
+
+from locust import HttpUser, constant, events, task
+
+STREAM_PATH = "/api/notification/stream/"
+
+
+class NotificationStreamUser(HttpUser):
+    # 연결이 끊기면 바로 다시 연결
+    wait_time = constant(0)
+
+    def on_start(self):
+        self.last_event_id = None
+        self.cookies = None
+        username = os.getenv("STREAM_USERNAME")
+        password = os.getenv("STREAM_PASSWORD")
+        if not username:
+            username = "stream_" + "".join(random.choices(string.ascii_letters, k=10))
+            password = "password123"
+            self.client.post(
+                "/api/auth/register/",
+                json={
+                    "username": username,
+                    "password": password,
+                    "nickname": username,
+                    "email": f"{username}@example.com",
+                },
+            )
+
+        response = self.client.post(
+            "/api/auth/login/", json={"username": username, "password": password}
+        )
+        if response.status_code == 200:
+            self.cookies = response.cookies
+
+    @task
+    def hold_stream(self):
+        """스트림 연결을 열고 서버가 닫을 때까지 이벤트와 heartbeat를 읽습니다."""
+        if not self.cookies:
+            time.sleep(1)
+            return
+
+        headers = {"Accept": "text/event-stream"}
+        if self.last_event_id:
+            headers["Last-Event-ID"] = self.last_event_id
+
+        started = time.perf_counter()
+        received = pings = 0
+        exception = None
+        try:
+            # heartbeat(기본 15초)보다 길게 읽기 대기
+            with self.client.get(
+                STREAM_PATH,
+                headers=headers,
+                cookies=self.cookies,
+                stream=True,
+                timeout=(10, 60),
+                name=f"{STREAM_PATH} (connect)",
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines(decode_unicode=True):
+                    if line.startswith("id: "):
+                        self.last_event_id = line[4:]
+                        received += 1
+                    elif line.startswith(": ping"):
+                        pings += 1
+        except Exception as e:
+            exception = e
+
+        # 연결 유지 시간과 받은 이벤트/heartbeat 수 기록
+        events.request.fire(
+            request_type="SSE",
+            name=f"{STREAM_PATH} (held)",
+            response_time=(time.perf_counter() - started) * 1000,
+            response_length=received,
+            response=None,
+            context={"pings": pings},
+            exception=exception,
+        )
+        if exception is not None:
+            time.sleep(1)